@@ -1,11 +1,28 @@
 import os
 from flask import Flask
+from flask_compress import Compress
 from flask_cors import CORS
 
 
+def _check_unique_routes(app):
+    """Fail at startup if two views are bound to the same path and method (one would shadow the other)."""
+    seen = {}
+    for rule in app.url_map.iter_rules():
+        for method in rule.methods - {'HEAD', 'OPTIONS'}:
+            other = seen.setdefault((rule.rule, method), rule.endpoint)
+            if other != rule.endpoint:
+                raise RuntimeError(f"{method} {rule.rule} is registered by both {other} and {rule.endpoint}")
+
+
 def create_app(config_name=None):
     """Flask application factory."""
     app = Flask(__name__)
+    # Match routes with or without a trailing slash instead of redirecting
+    app.url_map.strict_slashes = False
+
+    # Serialize responses (including NumPy payloads) with orjson
+    from .utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     from .config import config
@@ -31,6 +48,9 @@ def create_app(config_name=None):
         }
     })
 
+    # Compress large JSON payloads (correlation matrices, timelines, SHAP arrays)
+    Compress(app)
+
     with app.app_context():
         from .api.routes.data_generation import bp as data_generation_bp
         from .api.routes.preprocessing import bp as preprocessing_bp
@@ -47,5 +67,10 @@ def create_app(config_name=None):
         app.register_blueprint(data_ingestion_bp, url_prefix='/api/ingestion')
         app.register_blueprint(explainability_bp)
         app.register_blueprint(validation_bp, url_prefix='/api/validation')
+        _check_unique_routes(app)
+
+        # Service objects shared by all requests, looked up via current_app.extensions
+        from .services.analytics_service import AnalyticsService
+        app.extensions['analytics'] = AnalyticsService()
 
     return app
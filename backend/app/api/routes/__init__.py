@@ -1,2 +1,13 @@
 # Routes package
 from . import data_generation, preprocessing, training, analytics
+
+# Blueprint modules registered by create_app (one module per blueprint)
+__all__ = [
+    'data_generation',
+    'preprocessing',
+    'training',
+    'analytics',
+    'data_ingestion',
+    'explainability',
+    'validation',
+]
@@ -1,8 +1,80 @@
-from flask import Blueprint, request, jsonify
-from ...services.analytics_service import AnalyticsService
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Blueprint, request, jsonify, current_app
+from pydantic import TypeAdapter, ValidationError
+
+from ..schemas import AnalyticsQuery
 
 bp = Blueprint('analytics', __name__)
 
+# In-process cache of dataset-level analytics responses. Entries are keyed on
+# the endpoint, its query string and the dataset files' modification times,
+# so a regenerated or deleted dataset is never served from the cache.
+RESPONSE_CACHE_SIZE = 128
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _dataset_signature(dataset_id):
+    """Return (file name, mtime) pairs for a raw dataset, or None if it does not exist."""
+    dataset_path = os.path.join(current_app.config['RAW_DATA_DIR'], dataset_id)
+    try:
+        with os.scandir(dataset_path) as entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_file()
+            ))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def cached_by_dataset(view):
+    """Cache successful JSON responses of a dataset_id-keyed GET endpoint."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        dataset_id = request.args.get('dataset_id')
+        signature = _dataset_signature(dataset_id) if dataset_id else None
+        if signature is None:
+            return view(*args, **kwargs)
+
+        key = (request.endpoint, tuple(sorted(request.args.items(multi=True))), signature)
+        with _response_cache_lock:
+            body = _response_cache.get(key)
+            if body is not None:
+                _response_cache.move_to_end(key)
+        if body is not None:
+            return current_app.response_class(body, mimetype='application/json')
+
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            with _response_cache_lock:
+                _response_cache[key] = response.get_data()
+                while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                    _response_cache.popitem(last=False)
+        return response
+    return wrapper
+
+
+# Query-string validator built once per process rather than per request
+_QUERY_ADAPTER = TypeAdapter(AnalyticsQuery)
+
+
+def analytics_query():
+    """Parse and type-check all query-string arguments in a single pass."""
+    return _QUERY_ADAPTER.validate_python(request.args.to_dict(flat=True))
+
+
+@bp.errorhandler(ValidationError)
+def handle_query_validation_error(e):
+    return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
+
+
+def analytics_service():
+    """Return the application's shared AnalyticsService instance."""
+    return current_app.extensions['analytics']
+
 
 @bp.route('/', methods=['GET'])
 def health_check():
@@ -11,16 +83,18 @@ def health_check():
 
 
 @bp.route('/distributions', methods=['GET'])
+@cached_by_dataset
 def get_distribution():
     """Get distribution data for a feature."""
-    dataset_id = request.args.get('dataset_id')
-    feature = request.args.get('feature')
-    bins = request.args.get('bins', 50, type=int)
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    feature = q.feature
+    bins = q.bins
 
     if not dataset_id or not feature:
         return jsonify({'error': 'dataset_id and feature are required'}), 400
 
-    data = AnalyticsService.get_distribution(dataset_id, feature, bins)
+    data = analytics_service().get_distribution(dataset_id, feature, bins)
 
     if not data:
         return jsonify({'error': 'Dataset or feature not found'}), 404
@@ -29,15 +103,17 @@ def get_distribution():
 
 
 @bp.route('/correlations', methods=['GET'])
+@cached_by_dataset
 def get_correlations():
     """Get correlation matrix."""
-    dataset_id = request.args.get('dataset_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
     features = request.args.getlist('features')
 
     if not dataset_id:
         return jsonify({'error': 'dataset_id is required'}), 400
 
-    data = AnalyticsService.get_correlations(dataset_id, features if features else None)
+    data = analytics_service().get_correlations(dataset_id, features if features else None)
 
     if not data:
         return jsonify({'error': 'Dataset not found or insufficient features'}), 404
@@ -46,15 +122,17 @@ def get_correlations():
 
 
 @bp.route('/pre-injury-window', methods=['GET'])
+@cached_by_dataset
 def get_pre_injury_window():
     """Get pre-injury window analysis."""
-    dataset_id = request.args.get('dataset_id')
-    lookback_days = request.args.get('lookback_days', 14, type=int)
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    lookback_days = q.lookback_days
 
     if not dataset_id:
         return jsonify({'error': 'dataset_id is required'}), 400
 
-    data = AnalyticsService.get_pre_injury_window(dataset_id, lookback_days)
+    data = analytics_service().get_pre_injury_window(dataset_id, lookback_days)
 
     if not data:
         return jsonify({'error': 'Dataset not found'}), 404
@@ -65,13 +143,14 @@ def get_pre_injury_window():
 @bp.route('/athlete-timeline', methods=['GET'])
 def get_athlete_timeline():
     """Get athlete time series data."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
 
     if not dataset_id or not athlete_id:
         return jsonify({'error': 'dataset_id and athlete_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_timeline(dataset_id, athlete_id)
+    data = analytics_service().get_athlete_timeline(dataset_id, athlete_id)
 
     if not data:
         return jsonify({'error': 'Dataset or athlete not found'}), 404
@@ -80,14 +159,16 @@ def get_athlete_timeline():
 
 
 @bp.route('/acwr-zones', methods=['GET'])
+@cached_by_dataset
 def get_acwr_zones():
     """Get ACWR zone analysis."""
-    dataset_id = request.args.get('dataset_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
 
     if not dataset_id:
         return jsonify({'error': 'dataset_id is required'}), 400
 
-    data = AnalyticsService.get_acwr_zones(dataset_id)
+    data = analytics_service().get_acwr_zones(dataset_id)
 
     if not data:
         return jsonify({'error': 'Dataset not found'}), 404
@@ -98,12 +179,13 @@ def get_acwr_zones():
 @bp.route('/feature-importance', methods=['GET'])
 def get_feature_importance():
     """Get feature importance from a model."""
-    model_id = request.args.get('model_id')
+    q = analytics_query()
+    model_id = q.model_id
 
     if not model_id:
         return jsonify({'error': 'model_id is required'}), 400
 
-    data = AnalyticsService.get_feature_importance(model_id)
+    data = analytics_service().get_feature_importance(model_id)
 
     if not data:
         return jsonify({'error': 'Model not found'}), 404
@@ -114,12 +196,13 @@ def get_feature_importance():
 @bp.route('/athletes', methods=['GET'])
 def list_athletes():
     """List all athletes in a dataset."""
-    dataset_id = request.args.get('dataset_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
 
     if not dataset_id:
         return jsonify({'error': 'dataset_id is required'}), 400
 
-    athletes = AnalyticsService.list_athletes(dataset_id)
+    athletes = analytics_service().list_athletes(dataset_id)
 
     if athletes is None:
         return jsonify({'error': 'Dataset not found'}), 404
@@ -128,14 +211,16 @@ def list_athletes():
 
 
 @bp.route('/stats', methods=['GET'])
+@cached_by_dataset
 def get_dataset_stats():
     """Get overall dataset statistics."""
-    dataset_id = request.args.get('dataset_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
 
     if not dataset_id:
         return jsonify({'error': 'dataset_id is required'}), 400
 
-    stats = AnalyticsService.get_dataset_stats(dataset_id)
+    stats = analytics_service().get_dataset_stats(dataset_id)
 
     if not stats:
         return jsonify({'error': 'Dataset not found'}), 404
@@ -155,7 +240,7 @@ def simulate_intervention():
     if not all([model_id, athlete_id, date]):
         return jsonify({'error': 'model_id, athlete_id, and date are required'}), 400
 
-    result = AnalyticsService.simulate_intervention(
+    result = analytics_service().simulate_intervention(
         model_id=model_id,
         athlete_id=athlete_id,
         date=date,
@@ -175,13 +260,14 @@ def simulate_intervention():
 @bp.route('/athlete-profile', methods=['GET'])
 def get_athlete_profile():
     """Get detailed athlete profile with lifestyle context."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
 
     if not dataset_id or not athlete_id:
         return jsonify({'error': 'dataset_id and athlete_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_profile_detailed(dataset_id, athlete_id)
+    data = analytics_service().get_athlete_profile_detailed(dataset_id, athlete_id)
 
     if not data:
         return jsonify({'error': 'Athlete not found'}), 404
@@ -192,14 +278,15 @@ def get_athlete_profile():
 @bp.route('/athlete-pre-injury-patterns', methods=['GET'])
 def get_athlete_pre_injury_patterns():
     """Get athlete's personal pre-injury patterns."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
-    lookback_days = request.args.get('lookback_days', 14, type=int)
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
+    lookback_days = q.lookback_days
 
     if not dataset_id or not athlete_id:
         return jsonify({'error': 'dataset_id and athlete_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_pre_injury_patterns(dataset_id, athlete_id, lookback_days)
+    data = analytics_service().get_athlete_pre_injury_patterns(dataset_id, athlete_id, lookback_days)
 
     if not data:
         return jsonify({'error': 'Athlete not found'}), 404
@@ -210,14 +297,15 @@ def get_athlete_pre_injury_patterns():
 @bp.route('/athlete-risk-timeline', methods=['GET'])
 def get_athlete_risk_timeline():
     """Get continuous risk predictions over athlete's timeline."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
-    model_id = request.args.get('model_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
+    model_id = q.model_id
 
     if not all([dataset_id, athlete_id, model_id]):
         return jsonify({'error': 'dataset_id, athlete_id, and model_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_risk_timeline(dataset_id, athlete_id, model_id)
+    data = analytics_service().get_athlete_risk_timeline(dataset_id, athlete_id, model_id)
 
     if not data:
         return jsonify({'error': 'Could not generate risk timeline. Check if athlete and model exist.'}), 404
@@ -228,15 +316,16 @@ def get_athlete_risk_timeline():
 @bp.route('/athlete-risk-factors', methods=['GET'])
 def get_athlete_risk_factors():
     """Get risk factor breakdown for athlete."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
-    model_id = request.args.get('model_id')
-    date = request.args.get('date')  # Optional
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
+    model_id = q.model_id
+    date = q.date  # Optional
 
     if not all([dataset_id, athlete_id, model_id]):
         return jsonify({'error': 'dataset_id, athlete_id, and model_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_risk_factors(dataset_id, athlete_id, model_id, date)
+    data = analytics_service().get_athlete_risk_factors(dataset_id, athlete_id, model_id, date)
 
     if not data:
         return jsonify({'error': 'Could not calculate risk factors. Check if athlete and model exist.'}), 404
@@ -247,14 +336,15 @@ def get_athlete_risk_factors():
 @bp.route('/athlete-recommendations', methods=['GET'])
 def get_athlete_recommendations():
     """Get personalized recommendations for athlete."""
-    dataset_id = request.args.get('dataset_id')
-    athlete_id = request.args.get('athlete_id')
-    model_id = request.args.get('model_id')
+    q = analytics_query()
+    dataset_id = q.dataset_id
+    athlete_id = q.athlete_id
+    model_id = q.model_id
 
     if not all([dataset_id, athlete_id, model_id]):
         return jsonify({'error': 'dataset_id, athlete_id, and model_id are required'}), 400
 
-    data = AnalyticsService.get_athlete_recommendations(dataset_id, athlete_id, model_id)
+    data = analytics_service().get_athlete_recommendations(dataset_id, athlete_id, model_id)
 
     if not data:
         return jsonify({'error': 'Could not generate recommendations. Check if athlete and model exist.'}), 404
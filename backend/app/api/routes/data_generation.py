@@ -1,21 +1,57 @@
 import re
-from flask import Blueprint, request, jsonify
+import threading
+import time
+from flask import Blueprint, current_app, request, jsonify
 from ...services.data_generation_service import DataGenerationService
 from ..schemas import DataGenerationSchema
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 bp = Blueprint('data_generation', __name__)
 
 # Regex pattern for valid dataset_id format (prevents path traversal)
 VALID_DATASET_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
 
+# Validator built once per process rather than per request
+_GENERATION_ADAPTER = TypeAdapter(DataGenerationSchema)
+
+# Short-lived cache for the listings the frontend polls. Cleared on mutations made
+# through this process; the TTL bounds staleness for changes made by Celery workers.
+LISTING_CACHE_TTL = 1.0
+LISTING_CACHE_SIZE = 64
+_listing_cache = {}
+_listing_cache_lock = threading.Lock()
+
+
+def _cached_listing(name, loader):
+    """Return loader() for a listing, reusing the result for LISTING_CACHE_TTL seconds."""
+    now = time.monotonic()
+    with _listing_cache_lock:
+        entry = _listing_cache.get(name)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+    value = loader()
+    with _listing_cache_lock:
+        # Keys include client-chosen values (?limit=), so bound the entry count
+        if len(_listing_cache) >= LISTING_CACHE_SIZE:
+            for key in [k for k, (_, expires) in _listing_cache.items() if expires <= now]:
+                del _listing_cache[key]
+            if len(_listing_cache) >= LISTING_CACHE_SIZE:
+                _listing_cache.clear()
+        _listing_cache[name] = (value, now + LISTING_CACHE_TTL)
+    return value
+
+
+def _invalidate_listings():
+    with _listing_cache_lock:
+        _listing_cache.clear()
+
 
 @bp.route('/generate', methods=['POST'])
 def generate_dataset():
     """Start generating a new synthetic dataset."""
     try:
         data = request.get_json() or {}
-        schema = DataGenerationSchema(**data)
+        schema = _GENERATION_ADAPTER.validate_python(data)
     except ValidationError as e:
         return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
@@ -26,6 +62,7 @@ def generate_dataset():
         random_seed=schema.random_seed,
         injury_config=schema.injury_config
     )
+    _invalidate_listings()
 
     return jsonify({
         'job_id': job_id,
@@ -49,6 +86,7 @@ def get_generation_status(job_id):
 def cancel_generation(job_id):
     """Cancel a running data generation job."""
     success = DataGenerationService.cancel_generation(job_id)
+    _invalidate_listings()
 
     if success:
         return jsonify({'status': 'cancelled', 'message': 'Job cancelled successfully'}), 200
@@ -59,7 +97,7 @@ def cancel_generation(job_id):
 @bp.route('/datasets', methods=['GET'])
 def list_datasets():
     """List all available datasets."""
-    datasets = DataGenerationService.list_datasets()
+    datasets = _cached_listing('datasets', DataGenerationService.list_datasets)
     return jsonify({'datasets': datasets}), 200
 
 
@@ -86,6 +124,7 @@ def delete_dataset(dataset_id):
         return jsonify({'error': 'Invalid dataset_id format'}), 400
 
     success = DataGenerationService.delete_dataset(dataset_id)
+    _invalidate_listings()
 
     if success:
         return jsonify({'status': 'deleted', 'message': 'Dataset deleted successfully'}), 200
@@ -122,5 +161,6 @@ def get_dataset_sample(dataset_id):
 def list_jobs():
     """List all data generation jobs."""
     from ...utils.progress_tracker import ProgressTracker
-    jobs = ProgressTracker.get_all_jobs('data_generation')
-    return jsonify({'jobs': jobs}), 200
+    limit = request.args.get('limit', type=int)
+    body = _cached_listing(('jobs', limit), lambda: ProgressTracker.get_all_jobs_json('data_generation', limit=limit))
+    return current_app.response_class(body, mimetype='application/json')
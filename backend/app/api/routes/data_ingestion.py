@@ -1,18 +1,25 @@
 from flask import Blueprint, request, jsonify, current_app
 from ...services.ingestion_service import IngestionService
 from ..schemas import IngestionSchema
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 import os
+import shutil
 import uuid
 
 bp = Blueprint('data_ingestion', __name__)
 
+# Chunk size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Validator built once per process rather than per request
+_INGESTION_ADAPTER = TypeAdapter(IngestionSchema)
+
 @bp.route('/ingest', methods=['POST'])
 def ingest_real_data():
     """Endpoint to ingest real-world athlete data (FIT, CSV, etc)."""
     try:
         form_data = request.form.to_dict()
-        schema = IngestionSchema(**form_data)
+        schema = _INGESTION_ADAPTER.validate_python(form_data)
     except ValidationError as e:
         return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
@@ -30,7 +37,9 @@ def ingest_real_data():
     file_id = str(uuid.uuid4())
     ext = os.path.splitext(file.filename)[1]
     file_path = os.path.join(temp_dir, f"{file_id}{ext}")
-    file.save(file_path)
+    # Stream the upload to disk in 1 MiB chunks
+    with open(file_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as out:
+        shutil.copyfileobj(file.stream, out, UPLOAD_CHUNK_SIZE)
     
     # Start async ingestion
     job_id = IngestionService.ingest_data_async(schema.dataset_id, file_path, schema.data_type)
@@ -6,20 +6,115 @@ Endpoints for model interpretability:
 - Interaction analysis
 - Counterfactual generation
 - Actionable recommendations
+- Combined bundle (explanation + recommendations + counterfactuals)
 """
 
+import math
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from flask import Blueprint, request, jsonify
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import json
 import joblib
+from joblib import Parallel, delayed
 
+from app.tasks import explain_global_task
 from app.utils.logger import get_logger
+from app.utils.progress_tracker import ProgressTracker
 
 logger = get_logger(__name__)
 
 explainability_bp = Blueprint('explainability', __name__, url_prefix='/api/explainability')
 
+# Regex pattern for valid model_id format (prevents path traversal, checked before any disk access)
+VALID_MODEL_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]{1,128}$')
+
+# Minimum rows per chunk when splitting dataset-wide TreeSHAP across threads
+SHAP_MIN_CHUNK_ROWS = 128
+
+# Loaded models and their SHAP explainers, keyed by (model path, mtime) and
+# evicted least-recently-used first
+MODEL_CACHE_SIZE = 8
+_MODEL_CACHE: OrderedDict = OrderedDict()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# SHAP values of the seeded test-set sample per (model, split, sample_size)
+SHAP_CACHE_SIZE = 8
+_SHAP_CACHE: OrderedDict = OrderedDict()
+_SHAP_CACHE_LOCK = threading.Lock()
+
+# Optional process pool for the dataset-wide SHAP endpoints (global, interactions).
+# 0 keeps the work on the request thread.
+EXPLAINER_POOL_WORKERS = int(os.environ.get('EXPLAINER_POOL_WORKERS', 0))
+_explainer_pool = None
+_explainer_pool_lock = threading.Lock()
+
+# Short-lived cache of model file existence checks, to collapse bursts of polling requests
+EXISTS_CACHE_TTL = 2.0
+EXISTS_CACHE_MAX_ENTRIES = 1024
+_exists_cache: dict[str, tuple[bool, float]] = {}
+
+
+def _exists_cached(path: Path, ttl: float = EXISTS_CACHE_TTL) -> bool:
+    """Path.exists() with results reused for `ttl` seconds."""
+    key = str(path)
+    now = time.monotonic()
+    cached = _exists_cache.get(key)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+    exists = path.exists()
+    if len(_exists_cache) >= EXISTS_CACHE_MAX_ENTRIES:
+        _exists_cache.clear()
+    _exists_cache[key] = (exists, now + ttl)
+    return exists
+
+
+def prewarm_shap():
+    """
+    Import shap ahead of the first explainability request.
+
+    Called when a gunicorn worker or explainer pool process starts. The module
+    itself does not import shap, so create_app() stays cheap for Celery
+    workers and scripts that never explain anything.
+    """
+    import shap  # noqa: F401
+
+
+def _get_explainer_pool() -> ProcessPoolExecutor:
+    global _explainer_pool
+    if _explainer_pool is None:
+        with _explainer_pool_lock:
+            if _explainer_pool is None:
+                # spawn: forking a multi-threaded server process is unsafe
+                _explainer_pool = ProcessPoolExecutor(
+                    max_workers=EXPLAINER_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=prewarm_shap,
+                )
+    return _explainer_pool
+
+
+def run_explainer_job(fn, *args):
+    """
+    Run a (payload, status) explainability computation.
+
+    With EXPLAINER_POOL_WORKERS set, it runs in a pool process that keeps its
+    own model and SHAP caches, so CPU-bound SHAP work does not hold this
+    worker's GIL; otherwise it runs inline.
+    """
+    if EXPLAINER_POOL_WORKERS <= 0:
+        return fn(*args)
+    return _get_explainer_pool().submit(fn, *args).result()
+
 
 def load_model_info(model_id: str):
     """Load model metadata and paths."""
@@ -27,11 +122,16 @@ def load_model_info(model_id: str):
     metadata_path = models_dir / f"{model_id}.json"
     model_path = models_dir / f"{model_id}.joblib"
 
-    if not metadata_path.exists():
+    if not _exists_cached(metadata_path):
         return None, None, None
 
-    with open(metadata_path) as f:
-        metadata = json.load(f)
+    try:
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+    except FileNotFoundError:
+        # Deleted within the existence-cache TTL
+        _exists_cache.pop(str(metadata_path), None)
+        return None, None, None
 
     split_id = metadata.get('split_id')
     processed_dir = Path("/data/processed") / split_id if split_id else None
@@ -39,13 +139,18 @@ def load_model_info(model_id: str):
     return metadata, model_path, processed_dir
 
 
+def _read_parquet_mmap(path: Path) -> pd.DataFrame:
+    """Read a parquet file through a memory map, releasing Arrow buffers as columns convert."""
+    return pq.read_table(path, memory_map=True).to_pandas(self_destruct=True)
+
+
 def load_test_data(processed_dir: Path):
     """Load test data from processed directory."""
     X_test_path = processed_dir / "X_test.parquet"
     y_test_path = processed_dir / "y_test.parquet"
 
     if X_test_path.exists():
-        X_test = pd.read_parquet(X_test_path)
+        X_test = _read_parquet_mmap(X_test_path)
     else:
         # Try CSV fallback
         X_test_csv = processed_dir / "X_test.csv"
@@ -55,7 +160,7 @@ def load_test_data(processed_dir: Path):
             return None, None
 
     if y_test_path.exists():
-        y_test = pd.read_parquet(y_test_path)
+        y_test = _read_parquet_mmap(y_test_path)
     else:
         y_test_csv = processed_dir / "y_test.csv"
         y_test = pd.read_csv(y_test_csv) if y_test_csv.exists() else None
@@ -63,6 +168,438 @@ def load_test_data(processed_dir: Path):
     return X_test, y_test
 
 
+def _mtime_ns(path: Path) -> int:
+    """Modification time used to invalidate cached artifacts (0 if missing)."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _model_cache_entry(model_path: Path) -> dict:
+    """Return the cache entry for a model file, loading the model on a miss."""
+    path = str(model_path)
+    key = (path, _mtime_ns(model_path))
+    with _MODEL_CACHE_LOCK:
+        entry = _MODEL_CACHE.get(key)
+        if entry is not None:
+            _MODEL_CACHE.move_to_end(key)
+            return entry
+
+    loaded = {'model': joblib.load(model_path, mmap_mode='r'), 'explainer': None, 'importances': None}
+
+    with _MODEL_CACHE_LOCK:
+        # Drop entries for older versions of the same file
+        for stale in [k for k in _MODEL_CACHE if k[0] == path and k != key]:
+            del _MODEL_CACHE[stale]
+        entry = _MODEL_CACHE.setdefault(key, loaded)
+        _MODEL_CACHE.move_to_end(key)
+        while len(_MODEL_CACHE) > MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+    return entry
+
+
+@lru_cache(maxsize=8)
+def _load_test_data_cached(processed_dir: str, mtimes: tuple):
+    return load_test_data(Path(processed_dir))
+
+
+def get_model(model_path: Path):
+    """Load a model, reusing the in-process copy while the file is unchanged."""
+    return _model_cache_entry(model_path)['model']
+
+
+def get_tree_explainer(model_path: Path, model_type: str = 'xgboost'):
+    """
+    Get a SHAP TreeExplainer for a tree-based model file, built once per cached model.
+
+    The model type is known from metadata, so the explainer is constructed
+    directly (native booster for XGBoost, path-dependent raw output) instead of
+    going through SHAP's model auto-detection.
+    """
+    entry = _model_cache_entry(model_path)
+    if entry['explainer'] is None:
+        import shap
+        model = entry['model']
+        if model_type == 'xgboost' and hasattr(model, 'get_booster'):
+            model = model.get_booster()
+        entry['explainer'] = shap.TreeExplainer(
+            model, feature_perturbation='tree_path_dependent', model_output='raw'
+        )
+    return entry['explainer']
+
+
+def get_feature_importances(model_path: Path, n_features: int) -> np.ndarray:
+    """
+    Feature importances of a model file, read once per cached model.
+
+    Models without feature_importances_ get uniform weights. The array is
+    shared between requests and must not be modified.
+    """
+    entry = _model_cache_entry(model_path)
+    importances = entry['importances']
+    if importances is None or len(importances) != n_features:
+        model = entry['model']
+        if hasattr(model, 'feature_importances_'):
+            importances = np.array(model.feature_importances_)
+        else:
+            importances = np.ones(n_features) / n_features
+        importances.flags.writeable = False
+        entry['importances'] = importances
+    return importances
+
+
+def _positive_class(values):
+    """Positive-class SHAP values from per-class lists or (rows, features, classes) arrays."""
+    if isinstance(values, list):
+        return values[1]
+    if getattr(values, 'ndim', 0) == 3:
+        return values[..., 1]
+    return values
+
+
+def _positive_class_base(base_value):
+    """Positive-class expected value from a per-class list/array, or the scalar itself."""
+    if isinstance(base_value, list) or np.ndim(base_value) == 1 and len(base_value) > 1:
+        return base_value[1]
+    return base_value
+
+
+def get_test_data(processed_dir: Path):
+    """
+    Load test data, reusing the in-process copy while the files are unchanged.
+
+    The returned DataFrames are shared between requests and must not be modified.
+    """
+    return _load_test_data_cached(str(processed_dir), _test_data_mtimes(processed_dir))
+
+
+def _test_data_mtimes(processed_dir: Path) -> tuple:
+    return tuple(
+        _mtime_ns(processed_dir / name)
+        for name in ("X_test.parquet", "X_test.csv", "y_test.parquet", "y_test.csv")
+    )
+
+
+@lru_cache(maxsize=32)
+def _sample_positions(n_rows: int, sample_size: int) -> np.ndarray:
+    """Row positions picked by DataFrame.sample(n=sample_size, random_state=42)."""
+    positions = np.random.RandomState(42).choice(n_rows, size=sample_size, replace=False)
+    positions.flags.writeable = False
+    return positions
+
+
+def _sample_test_rows(X_test: pd.DataFrame, sample_size: int) -> pd.DataFrame:
+    """Seeded test-set sample; the row positions are computed once per (size, sample_size)."""
+    if len(X_test) > sample_size:
+        return X_test.iloc[_sample_positions(len(X_test), sample_size)]
+    return X_test
+
+
+def _get_sample_shap(metadata: dict, model_path: Path, processed_dir: Path, sample_size: int):
+    """
+    SHAP values for the seeded test-set sample, cached per model and sample size.
+
+    Returns (X_sample, shap_values), or (None, None) if there is no test data.
+    Entries are keyed on the model and test-data modification times, so a
+    retrained model or re-processed split is recomputed. Both arrays are
+    shared between requests and must not be modified.
+    """
+    key = (str(model_path), _mtime_ns(model_path),
+           str(processed_dir), _test_data_mtimes(processed_dir), sample_size)
+    with _SHAP_CACHE_LOCK:
+        cached = _SHAP_CACHE.get(key)
+        if cached is not None:
+            _SHAP_CACHE.move_to_end(key)
+            return cached
+
+    X_test, _ = get_test_data(processed_dir)
+    if X_test is None:
+        return None, None
+
+    # Sample data if too large
+    X_sample = _sample_test_rows(X_test, sample_size)
+
+    model_type = metadata.get('model_type', 'xgboost')
+
+    if model_type in ['xgboost', 'random_forest']:
+        explainer = get_tree_explainer(model_path, model_type)
+        shap_values = _parallel_shap_values(explainer, _tree_shap_input(X_sample))
+    else:
+        import shap
+        explainer = shap.LinearExplainer(get_model(model_path), X_sample)
+        shap_values = explainer.shap_values(X_sample)
+
+    with _SHAP_CACHE_LOCK:
+        _SHAP_CACHE[key] = (X_sample, shap_values)
+        while len(_SHAP_CACHE) > SHAP_CACHE_SIZE:
+            _SHAP_CACHE.popitem(last=False)
+    return X_sample, shap_values
+
+
+def _tree_shap_input(X_sample: pd.DataFrame) -> np.ndarray:
+    """
+    float32 copy of a dataset-wide sample for TreeSHAP.
+
+    Tree models split on float32 thresholds, so this matches what they see at
+    prediction time while halving the memory traffic of the tree traversal.
+    """
+    return X_sample.to_numpy(dtype=np.float32)
+
+
+def _parallel_shap_values(explainer, X: np.ndarray):
+    """
+    Compute TreeSHAP values for many rows, split into chunks across threads.
+
+    Tree explainers are row-parallel and their native kernels release the GIL,
+    so each thread works on its own slice; results are stacked in row order.
+    """
+    n_jobs = min(os.cpu_count() or 1, max(1, len(X) // SHAP_MIN_CHUNK_ROWS))
+
+    if n_jobs == 1:
+        return _positive_class(explainer.shap_values(X))
+
+    chunks = np.array_split(np.arange(len(X)), n_jobs)
+    results = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(explainer.shap_values)(X[idx]) for idx in chunks
+    )
+    return np.concatenate([_positive_class(r) for r in results], axis=0)
+
+
+def _prepare_instance(metadata: dict, athlete_data: dict):
+    """Build a single-row (1, n_features) array aligned to the model's features."""
+    feature_names = metadata.get('feature_names', list(athlete_data.keys()))
+    # Missing features default to 0
+    X = np.fromiter((athlete_data.get(f, 0) for f in feature_names),
+                    dtype=np.float64, count=len(feature_names)).reshape(1, -1)
+    return X, feature_names
+
+
+def _model_input(model, X: np.ndarray, feature_names):
+    """
+    Feature matrix in the form the model predicts from without extra overhead.
+
+    XGBoost (and models fitted without column names) take the ndarray as-is;
+    scikit-learn estimators fitted on DataFrames warn on unnamed input, so
+    they get a zero-copy frame over the same buffer.
+    """
+    if hasattr(model, 'get_booster') or not hasattr(model, 'feature_names_in_'):
+        return X
+    return pd.DataFrame(X, columns=feature_names, copy=False)
+
+
+def _predict_risks(model, X: np.ndarray, feature_names) -> np.ndarray:
+    """Positive-class probability (or raw prediction) for every row of X."""
+    X = _model_input(model, X, feature_names)
+    if hasattr(model, 'predict_proba'):
+        return model.predict_proba(X)[:, 1]
+    return np.asarray(model.predict(X))
+
+
+def _predict_risk(model, X: np.ndarray, feature_names) -> float:
+    """Positive-class probability (or raw prediction) for the first row of X."""
+    return float(_predict_risks(model, X, feature_names)[0])
+
+
+def _instance_shap_values(model, model_path: Path, metadata: dict, X: np.ndarray):
+    """Compute SHAP values for a single instance, returning (shap_vals, base_value)."""
+    model_type = metadata.get('model_type', 'xgboost')
+
+    if model_type in ['xgboost', 'random_forest']:
+        explainer = get_tree_explainer(model_path, model_type)
+
+        # Handle different SHAP output formats (binary classification: positive class)
+        shap_values = _positive_class(explainer.shap_values(X))
+        base_value = _positive_class_base(explainer.expected_value)
+    else:
+        # Linear model
+        import shap
+        explainer = shap.LinearExplainer(model, X)
+        shap_values = explainer.shap_values(X)
+        base_value = explainer.expected_value
+
+    shap_vals = shap_values[0] if len(shap_values.shape) > 1 else shap_values
+    return shap_vals, base_value
+
+
+def _sigmoid(x: float) -> float:
+    """Logistic function, written to avoid overflow for large |x|."""
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
+
+
+def explain_instance(metadata: dict, model_path: Path, X: np.ndarray, feature_names):
+    """
+    Everything the per-athlete endpoints need from the model, in one place.
+
+    Uses the cached model, explainer and importances and returns
+    (prediction, shap_vals, base_value, importances). For tree models the
+    prediction is reconstructed from the SHAP values instead of running the
+    ensemble a second time.
+    """
+    model = get_model(model_path)
+    shap_vals, base_value = _instance_shap_values(model, model_path, metadata, X)
+
+    model_type = metadata.get('model_type', 'xgboost')
+    if model_type in ['xgboost', 'random_forest']:
+        # TreeSHAP efficiency: base value + sum of SHAP values is the raw model
+        # output, i.e. log-odds for XGBoost and probability for random forests
+        margin = float(base_value) + float(np.sum(shap_vals, dtype=np.float64))
+        if model_type == 'xgboost':
+            prediction = _sigmoid(margin)
+        else:
+            prediction = min(max(margin, 0.0), 1.0)
+    else:
+        prediction = _predict_risk(model, X, feature_names)
+    importances = get_feature_importances(model_path, len(feature_names))
+    return prediction, shap_vals, base_value, importances
+
+
+def _build_waterfall(shap_vals, base_value, X, feature_names, prediction: float, max_display: int) -> dict:
+    """Waterfall explanation of the top `max_display` features by |SHAP|."""
+    shap_vals = np.asarray(shap_vals, dtype=np.float64)
+    feature_vals = X[0]
+
+    # Top-k by |SHAP| without sorting every feature; ties keep feature order
+    abs_sv = np.abs(shap_vals)
+    k = max(0, min(int(max_display), abs_sv.size))
+    if k < abs_sv.size:
+        top = np.argpartition(-abs_sv, k)[:k]
+    else:
+        top = np.arange(abs_sv.size)
+    top = top[np.lexsort((top, -abs_sv[top]))]
+
+    return {
+        "base_value": float(base_value) if hasattr(base_value, 'item') else base_value,
+        "shap_values": shap_vals[top].tolist(),
+        "feature_values": np.asarray(feature_vals[top], dtype=np.float64).tolist(),
+        "feature_names": [feature_names[i] for i in top],
+        "prediction": prediction,
+        "explanation_type": "waterfall"
+    }
+
+
+@lru_cache(maxsize=32)
+def _feature_actions(feature_names: tuple) -> dict:
+    """Recommendation text and target multiplier per feature, derived once per feature set."""
+    actions = {}
+    for feature in feature_names:
+        name = feature.lower()
+        label = feature.replace('_', ' ')
+        if 'stress' in name:
+            actions[feature] = (f"Reduce {label}", 0.8)
+        elif 'sleep' in name:
+            actions[feature] = (f"Increase {label}", 1.2)
+        elif 'load' in name or 'tss' in name:
+            actions[feature] = (f"Reduce {label}", 0.85)
+        else:
+            actions[feature] = (f"Optimize {label}", 0.9)
+    return actions
+
+
+def _build_recommendations(shap_vals, X, feature_names, current_risk: float) -> dict:
+    """Actionable recommendations from the features that increase risk."""
+    # Determine risk level
+    if current_risk >= 0.5:
+        risk_level = "high"
+    elif current_risk >= 0.3:
+        risk_level = "moderate"
+    else:
+        risk_level = "low"
+
+    # Generate recommendations based on positive SHAP values (increasing risk)
+    feature_actions = _feature_actions(tuple(feature_names))
+    shap_vals = np.asarray(shap_vals)
+    # Only the few features that increase risk, strongest first (stable on ties)
+    positions = np.flatnonzero(shap_vals > 0.01)
+    positions = positions[np.argsort(-shap_vals[positions], kind='stable')][:5]  # Top 5 recommendations
+
+    actions = []
+    for i in positions:
+        feature = feature_names[i]
+        shap_val = float(shap_vals[i])
+        current_value = float(X[0, i])
+
+        # Generate recommendation
+        action, multiplier = feature_actions[feature]
+        recommended_value = current_value * multiplier
+
+        actions.append({
+            "feature": feature,
+            "current_value": current_value,
+            "recommended_value": recommended_value,
+            "action": action,
+            "impact": shap_val,
+            "priority": "high" if shap_val > 0.05 else "medium"
+        })
+
+    return {
+        "current_risk": current_risk,
+        "risk_level": risk_level,
+        "message": f"Found {len(actions)} actionable recommendations to reduce injury risk.",
+        "actions": actions
+    }
+
+
+def _build_counterfactuals(model, X, feature_names, original_pred: float, importances,
+                           desired_class: int, total_cfs: int) -> dict:
+    """What-if scenarios from perturbing the model's most important features."""
+    # Generate simple counterfactuals by modifying important features
+    # This is a simplified approach - for production, use dice-ml
+    counterfactuals = []
+
+    # Top features by importance (stable, so ties keep feature order)
+    n_features = max(0, min(int(total_cfs), len(feature_names)))
+    if n_features == 0:
+        return {
+            "counterfactuals": counterfactuals,
+            "original_prediction": original_pred,
+            "total_scenarios": 0
+        }
+    top = np.argsort(-importances, kind='stable')[:n_features]
+
+    # One candidate row per (feature, direction), scored in a single predict call
+    row = X[0]
+    original_values = row[top][:, None]
+    directions = np.array([-1, 1])
+    new_values = np.where(original_values > 0,
+                          original_values * (1 + directions * 0.2),
+                          original_values + directions * 10)
+
+    candidates = np.repeat(X, 2 * n_features, axis=0)
+    candidates[np.arange(2 * n_features), np.repeat(top, 2)] = new_values.ravel()
+    new_preds = _predict_risks(model, candidates, feature_names).reshape(-1, 2)
+
+    for f, feature_idx in enumerate(top):
+        # Take the first direction that moves toward the desired class
+        for d in range(2):
+            new_pred = float(new_preds[f, d])
+            if (desired_class == 0 and new_pred < original_pred) or \
+               (desired_class == 1 and new_pred > original_pred):
+                original_value = float(row[feature_idx])
+                new_value = float(new_values[f, d])
+                counterfactuals.append({
+                    "changes": {
+                        feature_names[feature_idx]: {
+                            "from": original_value,
+                            "to": new_value,
+                            "change": float(new_values[f, d] - row[feature_idx])
+                        }
+                    },
+                    "predicted_risk": new_pred,
+                    "risk_reduction": original_pred - new_pred
+                })
+                break
+
+    return {
+        "counterfactuals": counterfactuals,
+        "original_prediction": original_pred,
+        "total_scenarios": len(counterfactuals)
+    }
+
+
 @explainability_bp.route('/sample/<model_id>', methods=['GET'])
 def get_sample_data(model_id: str):
     """
@@ -71,6 +608,9 @@ def get_sample_data(model_id: str):
     Returns a random high-risk sample for demonstration.
     """
     try:
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
         metadata, model_path, processed_dir = load_model_info(model_id)
 
         if not metadata:
@@ -79,7 +619,7 @@ def get_sample_data(model_id: str):
         if not processed_dir or not processed_dir.exists():
             return jsonify({"error": "Processed data not found for this model"}), 404
 
-        X_test, y_test = load_test_data(processed_dir)
+        X_test, y_test = get_test_data(processed_dir)
 
         if X_test is None:
             return jsonify({"error": "Test data not found"}), 404
@@ -93,15 +633,19 @@ def get_sample_data(model_id: str):
             if high_risk_indices:
                 # Get a high-risk sample
                 idx = high_risk_indices[len(high_risk_indices) // 2]  # Middle sample
-                sample = X_test.loc[idx].to_dict()
+                row = X_test.loc[idx]
             else:
                 # Just get the last sample
-                sample = X_test.iloc[-1].to_dict()
+                row = X_test.iloc[-1]
         else:
-            sample = X_test.iloc[-1].to_dict()
+            row = X_test.iloc[-1]
 
         # Convert numpy types to Python types for JSON serialization
-        sample = {k: float(v) if hasattr(v, 'item') else v for k, v in sample.items()}
+        values = row.to_numpy()
+        if values.dtype.kind in 'biuf':
+            sample = dict(zip(row.index, values.astype(np.float64).tolist()))
+        else:
+            sample = {k: float(v) if hasattr(v, 'item') else v for k, v in row.items()}
 
         return jsonify({
             "sample": sample,
@@ -120,8 +664,6 @@ def explain_prediction():
     Generate SHAP explanation for a single prediction (Waterfall plot).
     """
     try:
-        import shap
-
         data = request.json
         model_id = data.get('model_id')
         athlete_data = data.get('athlete_data')
@@ -133,62 +675,20 @@ def explain_prediction():
         if not athlete_data:
             return jsonify({"error": "athlete_data is required"}), 400
 
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
         metadata, model_path, processed_dir = load_model_info(model_id)
 
         if not metadata:
             return jsonify({"error": f"Model not found: {model_id}"}), 404
 
-        # Load model
-        model = joblib.load(model_path)
-
         # Prepare data
-        X = pd.DataFrame([athlete_data])
-
-        # Ensure columns match model's expected features
-        feature_names = metadata.get('feature_names', list(X.columns))
-        X = X.reindex(columns=feature_names, fill_value=0)
-
-        # Create SHAP explainer
-        model_type = metadata.get('model_type', 'xgboost')
+        X, feature_names = _prepare_instance(metadata, athlete_data)
 
-        if model_type in ['xgboost', 'random_forest']:
-            explainer = shap.TreeExplainer(model)
-            shap_values = explainer.shap_values(X)
-            base_value = explainer.expected_value
+        prediction, shap_vals, base_value, _ = explain_instance(metadata, model_path, X, feature_names)
 
-            # Handle different SHAP output formats
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]  # For binary classification, get positive class
-            if isinstance(base_value, list):
-                base_value = base_value[1]
-        else:
-            # Linear model
-            explainer = shap.LinearExplainer(model, X)
-            shap_values = explainer.shap_values(X)
-            base_value = explainer.expected_value
-
-        # Get prediction
-        if hasattr(model, 'predict_proba'):
-            prediction = float(model.predict_proba(X)[0, 1])
-        else:
-            prediction = float(model.predict(X)[0])
-
-        # Sort by absolute SHAP value
-        shap_vals = shap_values[0] if len(shap_values.shape) > 1 else shap_values
-        feature_vals = X.values[0]
-
-        sorted_indices = sorted(range(len(shap_vals)),
-                               key=lambda i: abs(shap_vals[i]),
-                               reverse=True)[:max_display]
-
-        response = {
-            "base_value": float(base_value) if hasattr(base_value, 'item') else base_value,
-            "shap_values": [float(shap_vals[i]) for i in sorted_indices],
-            "feature_values": [float(feature_vals[i]) for i in sorted_indices],
-            "feature_names": [feature_names[i] for i in sorted_indices],
-            "prediction": prediction,
-            "explanation_type": "waterfall"
-        }
+        response = _build_waterfall(shap_vals, base_value, X, feature_names, prediction, max_display)
 
         return jsonify(response), 200
 
@@ -199,70 +699,85 @@ def explain_prediction():
         return jsonify({"error": str(e)}), 500
 
 
-@explainability_bp.route('/explain/global', methods=['POST'])
-def explain_global():
+def compute_global_explanation(model_id: str, sample_size: int = 500):
     """
-    Generate global SHAP explanation (feature importance).
+    Compute the global SHAP explanation for a model.
+
+    Shared by the synchronous endpoint and the background task.
+    Returns (payload, status_code).
     """
-    try:
-        import shap
-        import numpy as np
+    metadata, model_path, processed_dir = load_model_info(model_id)
 
-        data = request.json
-        model_id = data.get('model_id')
-        sample_size = data.get('sample_size', 500)
+    if not metadata:
+        return {"error": f"Model not found: {model_id}"}, 404
 
-        if not model_id:
-            return jsonify({"error": "model_id is required"}), 400
+    # Importances precomputed at training time for the same sample size
+    precomputed = metadata.get('global_shap')
+    if precomputed and precomputed.get('sample_size') == sample_size:
+        return _global_explanation_response(
+            np.asarray(precomputed['mean_abs_shap']), precomputed['feature_names']
+        ), 200
 
-        metadata, model_path, processed_dir = load_model_info(model_id)
+    if not processed_dir or not processed_dir.exists():
+        return {"error": "Processed data not found"}, 404
 
-        if not metadata:
-            return jsonify({"error": f"Model not found: {model_id}"}), 404
+    # SHAP values of the test sample, shared with the interactions endpoint
+    X_sample, shap_values = _get_sample_shap(metadata, model_path, processed_dir, sample_size)
 
-        if not processed_dir or not processed_dir.exists():
-            return jsonify({"error": "Processed data not found"}), 404
+    if X_sample is None:
+        return {"error": "Test data not found"}, 404
 
-        # Load model and data
-        model = joblib.load(model_path)
-        X_test, _ = load_test_data(processed_dir)
+    # Calculate mean absolute SHAP values
+    mean_shap = np.abs(shap_values).mean(axis=0)
+    return _global_explanation_response(mean_shap, list(X_sample.columns)), 200
 
-        if X_test is None:
-            return jsonify({"error": "Test data not found"}), 404
 
-        # Sample data if too large
-        if len(X_test) > sample_size:
-            X_sample = X_test.sample(n=sample_size, random_state=42)
-        else:
-            X_sample = X_test
+def _global_explanation_response(mean_shap, feature_names) -> dict:
+    """Global explanation payload with features sorted by mean |SHAP|."""
+    sorted_indices = np.argsort(mean_shap)[::-1]
 
-        # Create SHAP explainer
-        model_type = metadata.get('model_type', 'xgboost')
+    return {
+        "mean_shap_values": np.asarray(mean_shap, dtype=np.float64)[sorted_indices],
+        "feature_names": [feature_names[i] for i in sorted_indices],
+        "explanation_type": "global"
+    }
 
-        if model_type in ['xgboost', 'random_forest']:
-            explainer = shap.TreeExplainer(model)
-            shap_values = explainer.shap_values(X_sample)
 
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]
-        else:
-            explainer = shap.LinearExplainer(model, X_sample)
-            shap_values = explainer.shap_values(X_sample)
+@explainability_bp.route('/explain/global', methods=['POST'])
+def explain_global():
+    """
+    Generate global SHAP explanation (feature importance).
+
+    With "async": true in the body, the computation is queued as a background
+    job and a job_id is returned (202); poll /explain/global/<job_id>/status.
+    """
+    try:
+        data = request.json
+        model_id = data.get('model_id')
+        sample_size = data.get('sample_size', 500)
 
-        # Calculate mean absolute SHAP values
-        mean_shap = np.abs(shap_values).mean(axis=0)
-        feature_names = list(X_sample.columns)
+        if not model_id:
+            return jsonify({"error": "model_id is required"}), 400
 
-        # Sort by importance
-        sorted_indices = np.argsort(mean_shap)[::-1]
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
 
-        response = {
-            "mean_shap_values": [float(mean_shap[i]) for i in sorted_indices],
-            "feature_names": [feature_names[i] for i in sorted_indices],
-            "explanation_type": "global"
-        }
+        if data.get('async'):
+            metadata, _, _ = load_model_info(model_id)
+            if not metadata:
+                return jsonify({"error": f"Model not found: {model_id}"}), 404
 
-        return jsonify(response), 200
+            job_id = ProgressTracker.create_job('explain_global')
+            explain_global_task.delay(job_id, model_id, sample_size)
+
+            return jsonify({
+                "job_id": job_id,
+                "model_id": model_id,
+                "status": "pending"
+            }), 202
+
+        response, status = run_explainer_job(compute_global_explanation, model_id, sample_size)
+        return jsonify(response), status
 
     except Exception as e:
         logger.error(f"Error in explain_global: {str(e)}")
@@ -271,91 +786,101 @@ def explain_global():
         return jsonify({"error": str(e)}), 500
 
 
-@explainability_bp.route('/explain/interactions', methods=['POST'])
-def explain_interactions():
+@explainability_bp.route('/explain/global/<job_id>/status', methods=['GET'])
+def get_global_explanation_status(job_id: str):
     """
-    Generate SHAP dependence plot for interaction analysis.
+    Get status of a background global explanation job.
+
+    The explanation is under "result" once the job has completed.
     """
     try:
-        import shap
-        import numpy as np
+        job = ProgressTracker.get_job(job_id)
+        if not job or job.get('type') != 'explain_global':
+            return jsonify({"error": "Job not found"}), 404
 
-        data = request.json
-        model_id = data.get('model_id')
-        feature1 = data.get('feature1')
-        feature2 = data.get('feature2')
-        sample_size = data.get('sample_size', 500)
-
-        if not model_id or not feature1:
-            return jsonify({"error": "model_id and feature1 are required"}), 400
+        return jsonify(job), 200
 
-        metadata, model_path, processed_dir = load_model_info(model_id)
+    except Exception as e:
+        logger.error(f"Error getting explanation job status: {str(e)}")
+        return jsonify({"error": str(e)}), 500
 
-        if not metadata:
-            return jsonify({"error": f"Model not found: {model_id}"}), 404
 
-        if not processed_dir or not processed_dir.exists():
-            return jsonify({"error": "Processed data not found"}), 404
+def compute_interactions(model_id: str, feature1: str, feature2=None, sample_size: int = 500):
+    """
+    Compute SHAP dependence data for feature1, with feature2 or the most
+    interacting feature as the colour axis. Returns (payload, status_code).
+    """
+    metadata, model_path, processed_dir = load_model_info(model_id)
 
-        # Load model and data
-        model = joblib.load(model_path)
-        X_test, _ = load_test_data(processed_dir)
+    if not metadata:
+        return {"error": f"Model not found: {model_id}"}, 404
 
-        if X_test is None:
-            return jsonify({"error": "Test data not found"}), 404
+    if not processed_dir or not processed_dir.exists():
+        return {"error": "Processed data not found"}, 404
 
-        # Check if feature exists
-        if feature1 not in X_test.columns:
-            return jsonify({"error": f"Feature '{feature1}' not found in data"}), 400
+    # SHAP values of the test sample, reused across feature pairs
+    X_sample, shap_values = _get_sample_shap(metadata, model_path, processed_dir, sample_size)
 
-        # Sample data if too large
-        if len(X_test) > sample_size:
-            X_sample = X_test.sample(n=sample_size, random_state=42)
-        else:
-            X_sample = X_test
+    if X_sample is None:
+        return {"error": "Test data not found"}, 404
 
-        # Create SHAP explainer
-        model_type = metadata.get('model_type', 'xgboost')
+    # Check if feature exists
+    if feature1 not in X_sample.columns:
+        return {"error": f"Feature '{feature1}' not found in data"}, 400
 
-        if model_type in ['xgboost', 'random_forest']:
-            explainer = shap.TreeExplainer(model)
-            shap_values = explainer.shap_values(X_sample)
+    # Get feature index
+    feature1_idx = list(X_sample.columns).index(feature1)
+    feature1_values = X_sample[feature1].values
+    feature1_shap = shap_values[:, feature1_idx]
 
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]
+    # Get interaction feature
+    if feature2 and feature2 in X_sample.columns:
+        feature2_values = X_sample[feature2].values
+    else:
+        # Auto-detect most interacting feature: |corr| of feature1's SHAP values
+        # with every column, computed in a single corrcoef call
+        if X_sample.shape[1] > 1:
+            stacked = np.column_stack([feature1_shap, X_sample.to_numpy(dtype=np.float64)])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlations = np.abs(np.corrcoef(stacked, rowvar=False)[0, 1:])
+            correlations = np.nan_to_num(correlations, nan=0.0)
+            correlations[feature1_idx] = -1.0
+            feature2 = X_sample.columns[int(np.argmax(correlations))]
         else:
-            explainer = shap.LinearExplainer(model, X_sample)
-            shap_values = explainer.shap_values(X_sample)
+            feature2 = feature1
+        feature2_values = X_sample[feature2].values
 
-        # Get feature index
-        feature1_idx = list(X_sample.columns).index(feature1)
-        feature1_values = X_sample[feature1].values
-        feature1_shap = shap_values[:, feature1_idx]
+    # ndarrays are encoded directly by the app's orjson JSON provider
+    return {
+        "feature1_values": np.ascontiguousarray(feature1_values, dtype=np.float64),
+        "shap_values": np.ascontiguousarray(feature1_shap, dtype=np.float64),
+        "interaction_values": np.ascontiguousarray(feature2_values, dtype=np.float64),
+        "feature1_name": feature1,
+        "feature2_name": feature2,
+        "explanation_type": "dependence"
+    }, 200
 
-        # Get interaction feature
-        if feature2 and feature2 in X_sample.columns:
-            feature2_values = X_sample[feature2].values
-        else:
-            # Auto-detect most interacting feature
-            correlations = []
-            for col in X_sample.columns:
-                if col != feature1:
-                    corr = np.corrcoef(feature1_shap, X_sample[col].values)[0, 1]
-                    correlations.append((col, abs(corr) if not np.isnan(corr) else 0))
-            correlations.sort(key=lambda x: x[1], reverse=True)
-            feature2 = correlations[0][0] if correlations else feature1
-            feature2_values = X_sample[feature2].values
 
-        response = {
-            "feature1_values": [float(v) for v in feature1_values],
-            "shap_values": [float(v) for v in feature1_shap],
-            "interaction_values": [float(v) for v in feature2_values],
-            "feature1_name": feature1,
-            "feature2_name": feature2,
-            "explanation_type": "dependence"
-        }
+@explainability_bp.route('/explain/interactions', methods=['POST'])
+def explain_interactions():
+    """
+    Generate SHAP dependence plot for interaction analysis.
+    """
+    try:
+        data = request.json
+        model_id = data.get('model_id')
+        feature1 = data.get('feature1')
+        feature2 = data.get('feature2')
+        sample_size = data.get('sample_size', 500)
 
-        return jsonify(response), 200
+        if not model_id or not feature1:
+            return jsonify({"error": "model_id and feature1 are required"}), 400
+
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
+        response, status = run_explainer_job(compute_interactions, model_id, feature1, feature2, sample_size)
+        return jsonify(response), status
 
     except Exception as e:
         logger.error(f"Error in explain_interactions: {str(e)}")
@@ -370,8 +895,6 @@ def generate_counterfactuals():
     Generate counterfactual explanations (What-If scenarios).
     """
     try:
-        import numpy as np
-
         data = request.json
         model_id = data.get('model_id')
         athlete_data = data.get('athlete_data')
@@ -381,85 +904,24 @@ def generate_counterfactuals():
         if not model_id or not athlete_data:
             return jsonify({"error": "model_id and athlete_data are required"}), 400
 
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
         metadata, model_path, processed_dir = load_model_info(model_id)
 
         if not metadata:
             return jsonify({"error": f"Model not found: {model_id}"}), 404
 
         # Load model
-        model = joblib.load(model_path)
+        model = get_model(model_path)
 
         # Prepare data
-        feature_names = metadata.get('feature_names', list(athlete_data.keys()))
-        X = pd.DataFrame([athlete_data]).reindex(columns=feature_names, fill_value=0)
-
-        # Get original prediction
-        if hasattr(model, 'predict_proba'):
-            original_pred = float(model.predict_proba(X)[0, 1])
-        else:
-            original_pred = float(model.predict(X)[0])
+        X, feature_names = _prepare_instance(metadata, athlete_data)
 
-        # Generate simple counterfactuals by modifying important features
-        # This is a simplified approach - for production, use dice-ml
-        counterfactuals = []
-
-        # Get feature importance from model or SHAP
-        if hasattr(model, 'feature_importances_'):
-            importances = model.feature_importances_
-        else:
-            importances = np.ones(len(feature_names)) / len(feature_names)
-
-        # Sort features by importance
-        sorted_features = sorted(zip(feature_names, importances),
-                                key=lambda x: x[1], reverse=True)
-
-        # Try modifying top features
-        for i in range(min(total_cfs, len(sorted_features))):
-            feature_name = sorted_features[i][0]
-            original_value = X[feature_name].values[0]
-
-            # Try different modifications
-            for direction in [-1, 1]:
-                X_cf = X.copy()
-
-                # Modify the feature
-                if original_value > 0:
-                    new_value = original_value * (1 + direction * 0.2)
-                else:
-                    new_value = original_value + direction * 10
-
-                X_cf[feature_name] = new_value
-
-                # Check if prediction changes
-                if hasattr(model, 'predict_proba'):
-                    new_pred = float(model.predict_proba(X_cf)[0, 1])
-                else:
-                    new_pred = float(model.predict(X_cf)[0])
-
-                # If this moves toward desired class, add it
-                if (desired_class == 0 and new_pred < original_pred) or \
-                   (desired_class == 1 and new_pred > original_pred):
-                    counterfactuals.append({
-                        "changes": {
-                            feature_name: {
-                                "from": float(original_value),
-                                "to": float(new_value),
-                                "change": float(new_value - original_value)
-                            }
-                        },
-                        "predicted_risk": new_pred,
-                        "risk_reduction": original_pred - new_pred
-                    })
-                    break
-
-            if len(counterfactuals) >= total_cfs:
-                break
-
-        response = {
-            "counterfactuals": counterfactuals,
-            "original_prediction": original_pred,
-            "total_scenarios": len(counterfactuals)
-        }
+        original_pred = _predict_risk(model, X, feature_names)
+        importances = get_feature_importances(model_path, len(feature_names))
+        response = _build_counterfactuals(model, X, feature_names, original_pred, importances,
+                                          desired_class, total_cfs)
 
         return jsonify(response), 200
 
@@ -476,9 +938,6 @@ def get_recommendations():
     Generate actionable recommendations based on SHAP analysis.
     """
     try:
-        import shap
-        import numpy as np
-
         data = request.json
         model_id = data.get('model_id')
         athlete_data = data.get('athlete_data')
@@ -487,90 +946,78 @@ def get_recommendations():
         if not model_id or not athlete_data:
             return jsonify({"error": "model_id and athlete_data are required"}), 400
 
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
         metadata, model_path, processed_dir = load_model_info(model_id)
 
         if not metadata:
             return jsonify({"error": f"Model not found: {model_id}"}), 404
 
-        # Load model
-        model = joblib.load(model_path)
-
         # Prepare data
-        feature_names = metadata.get('feature_names', list(athlete_data.keys()))
-        X = pd.DataFrame([athlete_data]).reindex(columns=feature_names, fill_value=0)
+        X, feature_names = _prepare_instance(metadata, athlete_data)
 
-        # Get prediction
-        if hasattr(model, 'predict_proba'):
-            current_risk = float(model.predict_proba(X)[0, 1])
-        else:
-            current_risk = float(model.predict(X)[0])
+        current_risk, shap_vals, _, _ = explain_instance(metadata, model_path, X, feature_names)
 
-        # Get SHAP values
-        model_type = metadata.get('model_type', 'xgboost')
+        response = _build_recommendations(shap_vals, X, feature_names, current_risk)
 
-        if model_type in ['xgboost', 'random_forest']:
-            explainer = shap.TreeExplainer(model)
-            shap_values = explainer.shap_values(X)
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]
-        else:
-            explainer = shap.LinearExplainer(model, X)
-            shap_values = explainer.shap_values(X)
+        return jsonify(response), 200
 
-        shap_vals = shap_values[0] if len(shap_values.shape) > 1 else shap_values
+    except Exception as e:
+        logger.error(f"Error in get_recommendations: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
 
-        # Determine risk level
-        if current_risk >= 0.5:
-            risk_level = "high"
-        elif current_risk >= 0.3:
-            risk_level = "moderate"
-        else:
-            risk_level = "low"
-
-        # Generate recommendations based on positive SHAP values (increasing risk)
-        actions = []
-        for i, (feature, shap_val) in enumerate(zip(feature_names, shap_vals)):
-            if shap_val > 0.01:  # Feature increases risk
-                current_value = float(X[feature].values[0])
-
-                # Generate recommendation
-                if 'stress' in feature.lower():
-                    action = f"Reduce {feature.replace('_', ' ')}"
-                    recommended_value = current_value * 0.8
-                elif 'sleep' in feature.lower():
-                    action = f"Increase {feature.replace('_', ' ')}"
-                    recommended_value = current_value * 1.2
-                elif 'load' in feature.lower() or 'tss' in feature.lower():
-                    action = f"Reduce {feature.replace('_', ' ')}"
-                    recommended_value = current_value * 0.85
-                else:
-                    action = f"Optimize {feature.replace('_', ' ')}"
-                    recommended_value = current_value * 0.9
-
-                actions.append({
-                    "feature": feature,
-                    "current_value": current_value,
-                    "recommended_value": recommended_value,
-                    "action": action,
-                    "impact": float(shap_val),
-                    "priority": "high" if shap_val > 0.05 else "medium"
-                })
 
-        # Sort by impact
-        actions.sort(key=lambda x: x['impact'], reverse=True)
-        actions = actions[:5]  # Top 5 recommendations
+@explainability_bp.route('/explain/bundle', methods=['POST'])
+def explain_bundle():
+    """
+    Generate the waterfall explanation, recommendations and counterfactuals
+    for one athlete in a single call, sharing one prediction and SHAP pass.
+    """
+    try:
+        data = request.json
+        model_id = data.get('model_id')
+        athlete_data = data.get('athlete_data')
+        max_display = data.get('max_display', 10)
+        desired_class = data.get('desired_class', 0)
+        total_cfs = data.get('total_cfs', 3)
+
+        if not model_id or not athlete_data:
+            return jsonify({"error": "model_id and athlete_data are required"}), 400
+
+        if not VALID_MODEL_ID_PATTERN.match(str(model_id)):
+            return jsonify({"error": "Invalid model_id format"}), 400
+
+        metadata, model_path, processed_dir = load_model_info(model_id)
+
+        if not metadata:
+            return jsonify({"error": f"Model not found: {model_id}"}), 404
+
+        # Load model
+        model = get_model(model_path)
+
+        # Prepare data
+        X, feature_names = _prepare_instance(metadata, athlete_data)
+
+        prediction, shap_vals, base_value, importances = explain_instance(
+            metadata, model_path, X, feature_names
+        )
 
         response = {
-            "current_risk": current_risk,
-            "risk_level": risk_level,
-            "message": f"Found {len(actions)} actionable recommendations to reduce injury risk.",
-            "actions": actions
+            "explanation": _build_waterfall(shap_vals, base_value, X, feature_names,
+                                            prediction, max_display),
+            "recommendations": _build_recommendations(shap_vals, X, feature_names, prediction),
+            "counterfactuals": _build_counterfactuals(model, X, feature_names, prediction,
+                                                      importances, desired_class, total_cfs),
+            "model_id": model_id
         }
 
         return jsonify(response), 200
 
     except Exception as e:
-        logger.error(f"Error in get_recommendations: {str(e)}")
+        logger.error(f"Error in explain_bundle: {str(e)}")
         import traceback
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
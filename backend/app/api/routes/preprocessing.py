@@ -1,17 +1,20 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from ...services.preprocessing_service import PreprocessingService
 from ..schemas import PreprocessingSchema
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 bp = Blueprint('preprocessing', __name__)
 
+# Validator built once per process rather than per request
+_PREPROCESSING_ADAPTER = TypeAdapter(PreprocessingSchema)
+
 
 @bp.route('/run', methods=['POST'])
 def run_preprocessing():
     """Start preprocessing pipeline."""
     try:
         data = request.get_json() or {}
-        schema = PreprocessingSchema(**data)
+        schema = _PREPROCESSING_ADAPTER.validate_python(data)
     except ValidationError as e:
         return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
@@ -63,5 +66,5 @@ def get_split(split_id):
 def list_jobs():
     """List all preprocessing jobs."""
     from ...utils.progress_tracker import ProgressTracker
-    jobs = ProgressTracker.get_all_jobs('preprocessing')
-    return jsonify({'jobs': jobs}), 200
+    body = ProgressTracker.get_all_jobs_json('preprocessing', limit=request.args.get('limit', type=int))
+    return current_app.response_class(body, mimetype='application/json')
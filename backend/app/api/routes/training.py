@@ -1,17 +1,32 @@
-from flask import Blueprint, request, jsonify
+import os
+
+from flask import Blueprint, current_app, request, jsonify, send_file
 from ...services.training_service import TrainingService
-from ..schemas import TrainingSchema
-from pydantic import ValidationError
+from ..schemas import TrainingSchema, CompareSchema
+from pydantic import TypeAdapter, ValidationError
 
 bp = Blueprint('training', __name__)
 
+# Validators built once per process rather than per request
+_TRAINING_ADAPTER = TypeAdapter(TrainingSchema)
+_COMPARE_ADAPTER = TypeAdapter(CompareSchema)
+
+
+def _request_body() -> bytes:
+    """Raw request body for single-pass JSON validation; an empty body reads as {}."""
+    return request.get_data(cache=False) or b'{}'
+
+
+def _resolve_split_id(model_id):
+    """split_id from the query string, falling back to the split the model was trained on."""
+    return request.args.get('split_id') or TrainingService.get_model_split_id(model_id)
+
 
 @bp.route('/train', methods=['POST'])
 def train_models():
     """Start model training."""
     try:
-        data = request.get_json() or {}
-        schema = TrainingSchema(**data)
+        schema = _TRAINING_ADAPTER.validate_json(_request_body())
     except ValidationError as e:
         return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
@@ -60,16 +75,16 @@ def get_model(model_id):
 @bp.route('/models/<model_id>/roc-curve', methods=['GET'])
 def get_roc_curve(model_id):
     """Get ROC curve data."""
-    split_id = request.args.get('split_id')
-    if not split_id:
-        # Try to get from model metadata
-        model = TrainingService.get_model(model_id)
-        if model:
-            split_id = model.get('split_id')
+    split_id = _resolve_split_id(model_id)
 
     if not split_id:
         return jsonify({'error': 'split_id is required'}), 400
 
+    # Serve the curve stored at training time (or by an earlier request)
+    curve_path = TrainingService.get_curve_path(model_id, split_id, 'roc')
+    if curve_path and os.path.exists(curve_path):
+        return send_file(curve_path, mimetype='application/json')
+
     curve_data = TrainingService.get_roc_curve(model_id, split_id)
 
     if not curve_data:
@@ -81,15 +96,16 @@ def get_roc_curve(model_id):
 @bp.route('/models/<model_id>/pr-curve', methods=['GET'])
 def get_pr_curve(model_id):
     """Get Precision-Recall curve data."""
-    split_id = request.args.get('split_id')
-    if not split_id:
-        model = TrainingService.get_model(model_id)
-        if model:
-            split_id = model.get('split_id')
+    split_id = _resolve_split_id(model_id)
 
     if not split_id:
         return jsonify({'error': 'split_id is required'}), 400
 
+    # Serve the curve stored at training time (or by an earlier request)
+    curve_path = TrainingService.get_curve_path(model_id, split_id, 'pr')
+    if curve_path and os.path.exists(curve_path):
+        return send_file(curve_path, mimetype='application/json')
+
     curve_data = TrainingService.get_pr_curve(model_id, split_id)
 
     if not curve_data:
@@ -101,8 +117,10 @@ def get_pr_curve(model_id):
 @bp.route('/compare', methods=['POST'])
 def compare_models():
     """Compare multiple models."""
-    data = request.get_json() or {}
-    model_ids = data.get('model_ids', [])
+    try:
+        model_ids = _COMPARE_ADAPTER.validate_json(_request_body()).model_ids
+    except ValidationError as e:
+        return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
     if len(model_ids) < 2:
         return jsonify({'error': 'At least 2 model_ids required for comparison'}), 400
@@ -121,5 +139,5 @@ def get_model_types():
 def list_jobs():
     """List all training jobs."""
     from ...utils.progress_tracker import ProgressTracker
-    jobs = ProgressTracker.get_all_jobs('training')
-    return jsonify({'jobs': jobs})
+    body = ProgressTracker.get_all_jobs_json('training', limit=request.args.get('limit', type=int))
+    return current_app.response_class(body, mimetype='application/json')
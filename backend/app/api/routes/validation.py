@@ -5,14 +5,100 @@ Provides endpoints to compare synthetic data against real PMData,
 view distribution alignment, and run transfer learning experiments.
 """
 
-from flask import Blueprint, jsonify, request
-
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import orjson
+from flask import Blueprint, current_app, jsonify, request, send_file, stream_with_context
+from pydantic import TypeAdapter, ValidationError
+from werkzeug.exceptions import HTTPException
+
+from ..schemas import RunValidationSchema, MethodologyRunSchema, ScientificRunSchema
 from ...services.validation_service import ValidationService
-from ...utils.progress_tracker import ProgressTracker, numpy_to_python
-from ...tasks import run_validation_task
+from ...services.methodology_validation import MethodologyValidationService
+from ...services.scientific_validation import ScientificValidationService
+from ...utils.progress_tracker import ProgressTracker
+from ...tasks import (
+    run_validation_task,
+    run_methodology_validation_task,
+    run_scientific_validation_task,
+    run_sim2real_task,
+    run_pmdata_analysis_task,
+)
 
 validation_bp = Blueprint('validation', __name__)
 
+# Validators built once per process rather than per request
+_RUN_VALIDATION_ADAPTER = TypeAdapter(RunValidationSchema)
+_METHODOLOGY_RUN_ADAPTER = TypeAdapter(MethodologyRunSchema)
+_SCIENTIFIC_RUN_ADAPTER = TypeAdapter(ScientificRunSchema)
+
+# Accepted names for the methodology and scientific validation suites
+_VALID_VALIDATION_TYPES = frozenset({'loso', 'sensitivity', 'equivalence'})
+_VALID_SCIENTIFIC_TASKS = frozenset({
+    'reproducibility', 'permutation', 'sensitivity',
+    'adversarial', 'null_models', 'subgroups'
+})
+
+# Error envelopes are built with orjson directly; the most frequent bodies
+# (job polling misses, missing dataset_id) are encoded once at import time.
+_JOB_NOT_FOUND = orjson.dumps({'error': 'Job not found'})
+_DATASET_ID_REQUIRED = orjson.dumps({'error': 'dataset_id is required'})
+
+
+def _err(error, code, **fields):
+    """JSON error response for a message (plus extra fields) or a pre-encoded body."""
+    if not isinstance(error, bytes):
+        error = orjson.dumps({'error': error, **fields}, option=orjson.OPT_SORT_KEYS)
+    return current_app.response_class(error, status=code, mimetype='application/json')
+
+
+@validation_bp.errorhandler(ValidationError)
+def handle_request_validation_error(e):
+    return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
+
+
+@validation_bp.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Report unhandled errors from any validation route as a 500 error envelope."""
+    if isinstance(e, HTTPException):
+        return e
+    return _err(str(e), 500)
+
+
+# In-process cache of the Sim2Real analysis responses. Entries are keyed on the
+# endpoint, its arguments and the synthetic/PMData file revision, so a
+# regenerated dataset is never served from the cache.
+RESPONSE_CACHE_SIZE = 32
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def cached_by_data_revision(view):
+    """Cache successful JSON responses of an endpoint computed from the default datasets."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.endpoint, tuple(sorted(kwargs.items())), ValidationService.data_revision())
+        with _response_cache_lock:
+            body = _response_cache.get(key)
+            if body is not None:
+                _response_cache.move_to_end(key)
+        if body is not None:
+            return current_app.response_class(body, mimetype='application/json')
+
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            with _response_cache_lock:
+                _response_cache[key] = response.get_data()
+                while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                    _response_cache.popitem(last=False)
+        return response
+    return wrapper
+
 
 # =========================================================================
 # ASYNC VALIDATION ENDPOINTS (New)
@@ -30,17 +116,16 @@ def start_validation():
         JSON with job_id and status.
     """
     try:
-        data = request.get_json() or {}
-        dataset_id = data.get('dataset_id')
+        body = request.get_data(cache=False) or b'{}'
+        dataset_id = _RUN_VALIDATION_ADAPTER.validate_json(body).dataset_id
 
         if not dataset_id:
-            return jsonify({'error': 'dataset_id is required'}), 400
+            return _err(_DATASET_ID_REQUIRED, 400)
 
         # Check if dataset exists
-        from ...services.validation_service import ValidationService
         df = ValidationService.load_synthetic_by_id(dataset_id)
         if df is None:
-            return jsonify({'error': f'Dataset {dataset_id} not found'}), 404
+            return _err(f'Dataset {dataset_id} not found', 404)
 
         # Create job and start async task
         job_id = ProgressTracker.create_job('validation')
@@ -52,8 +137,8 @@ def start_validation():
             'status': 'pending'
         }), 202
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    except ValidationError as e:
+        return jsonify({'error': 'Validation Error', 'details': e.errors()}), 400
 
 
 @validation_bp.route('/jobs/<job_id>/status', methods=['GET'])
@@ -64,15 +149,11 @@ def get_validation_job_status(job_id):
     Returns:
         JSON with job status, progress, and result if completed.
     """
-    try:
-        job = ProgressTracker.get_job(job_id)
-        if not job:
-            return jsonify({'error': 'Job not found'}), 404
+    job = ProgressTracker.get_job(job_id)
+    if not job:
+        return _err(_JOB_NOT_FOUND, 404)
 
-        return jsonify(job), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify(job), 200
 
 
 @validation_bp.route('/results', methods=['GET'])
@@ -83,11 +164,8 @@ def list_cached_validations():
     Returns:
         JSON with list of validation summaries.
     """
-    try:
-        validations = ValidationService.list_cached_validations()
-        return jsonify({'validations': validations}), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    validations = ValidationService.list_cached_validations()
+    return jsonify({'validations': validations}), 200
 
 
 @validation_bp.route('/results/<dataset_id>', methods=['GET'])
@@ -98,20 +176,12 @@ def get_cached_results(dataset_id):
     Returns:
         JSON with full validation results or 404 if not cached.
     """
-    try:
-        results = ValidationService.get_cached_results(dataset_id)
-        if not results:
-            return jsonify({
-                'error': 'No cached results found',
-                'dataset_id': dataset_id,
-                'cached': False
-            }), 404
+    results_path = ValidationService.get_cached_results_path(dataset_id)
+    if not results_path:
+        return _err('No cached results found', 404, dataset_id=dataset_id, cached=False)
 
-        results['cached'] = True
-        return jsonify(results), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # Pre-serialized body, sent straight from disk
+    return send_file(results_path, mimetype='application/json')
 
 
 @validation_bp.route('/results/<dataset_id>', methods=['DELETE'])
@@ -122,14 +192,11 @@ def delete_cached_results(dataset_id):
     Returns:
         JSON with success status.
     """
-    try:
-        deleted = ValidationService.delete_cached_results(dataset_id)
-        return jsonify({
-            'deleted': deleted,
-            'dataset_id': dataset_id
-        }), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    deleted = ValidationService.delete_cached_results(dataset_id)
+    return jsonify({
+        'deleted': deleted,
+        'dataset_id': dataset_id
+    }), 200
 
 
 @validation_bp.route('/jobs', methods=['GET'])
@@ -140,11 +207,8 @@ def list_validation_jobs():
     Returns:
         JSON with list of jobs.
     """
-    try:
-        jobs = ProgressTracker.get_all_jobs('validation')
-        return jsonify({'jobs': jobs}), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    body = ProgressTracker.get_all_jobs_json('validation', limit=request.args.get('limit', type=int))
+    return current_app.response_class(body, mimetype='application/json')
 
 
 # =========================================================================
@@ -163,35 +227,28 @@ def run_methodology_validation():
     Returns:
         JSON with job_id and status.
     """
-    try:
-        from ...tasks import run_methodology_validation_task
-
-        data = request.get_json() or {}
-        dataset_id = data.get('dataset_id')
-        validation_types = data.get('validation_types', ['loso', 'sensitivity', 'equivalence'])
-
-        if not dataset_id:
-            return jsonify({'error': 'dataset_id is required'}), 400
+    body = _METHODOLOGY_RUN_ADAPTER.validate_json(request.get_data(cache=False) or b'{}')
+    dataset_id = body.dataset_id
+    validation_types = body.validation_types
 
-        # Validate types
-        valid_types = {'loso', 'sensitivity', 'equivalence'}
-        invalid = set(validation_types) - valid_types
-        if invalid:
-            return jsonify({'error': f'Invalid validation types: {invalid}'}), 400
+    if not dataset_id:
+        return _err(_DATASET_ID_REQUIRED, 400)
 
-        # Create job and start async task
-        job_id = ProgressTracker.create_job('methodology_validation')
-        run_methodology_validation_task.delay(job_id, dataset_id, validation_types)
+    # Validate types
+    invalid = [t for t in validation_types if t not in _VALID_VALIDATION_TYPES]
+    if invalid:
+        return _err(f'Invalid validation types: {invalid}', 400)
 
-        return jsonify({
-            'job_id': job_id,
-            'dataset_id': dataset_id,
-            'validation_types': validation_types,
-            'status': 'pending'
-        }), 202
+    # Create job and start async task
+    job_id = ProgressTracker.create_job('methodology_validation')
+    run_methodology_validation_task.delay(job_id, dataset_id, validation_types)
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'job_id': job_id,
+        'dataset_id': dataset_id,
+        'validation_types': validation_types,
+        'status': 'pending'
+    }), 202
 
 
 @validation_bp.route('/methodology/summary/<dataset_id>', methods=['GET'])
@@ -201,57 +258,51 @@ def get_methodology_summary(dataset_id):
 
     Returns cached results for LOSO, Sensitivity Analysis, and Equivalence Check.
     """
-    try:
-        from ...services.methodology_validation import MethodologyValidationService
-        summary = MethodologyValidationService.get_methodology_summary(dataset_id)
-        return jsonify(summary), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    summary = MethodologyValidationService.get_methodology_summary(dataset_id)
+    return jsonify(summary), 200
 
 
 @validation_bp.route('/methodology/loso/<dataset_id>', methods=['GET'])
 def get_loso_results(dataset_id):
     """Get LOSO Cross-Validation results for a dataset."""
-    try:
-        from ...services.methodology_validation import MethodologyValidationService
-        summary = MethodologyValidationService.get_methodology_summary(dataset_id)
-        if summary['loso']['status'] == 'not_run':
-            return jsonify({'error': 'LOSO validation not yet run', 'status': 'not_run'}), 404
-        return jsonify(summary['loso']), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    summary = MethodologyValidationService.get_methodology_summary(dataset_id)
+    if summary['loso']['status'] == 'not_run':
+        return _err('LOSO validation not yet run', 404, status='not_run')
+    return jsonify(summary['loso']), 200
 
 
 @validation_bp.route('/methodology/sensitivity/<dataset_id>', methods=['GET'])
 def get_sensitivity_results(dataset_id):
     """Get Sensitivity Analysis results for a dataset."""
-    try:
-        from ...services.methodology_validation import MethodologyValidationService
-        summary = MethodologyValidationService.get_methodology_summary(dataset_id)
-        if summary['sensitivity']['status'] == 'not_run':
-            return jsonify({'error': 'Sensitivity analysis not yet run', 'status': 'not_run'}), 404
-        return jsonify(summary['sensitivity']), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    summary = MethodologyValidationService.get_methodology_summary(dataset_id)
+    if summary['sensitivity']['status'] == 'not_run':
+        return _err('Sensitivity analysis not yet run', 404, status='not_run')
+    return jsonify(summary['sensitivity']), 200
 
 
 @validation_bp.route('/methodology/equivalence', methods=['GET'])
 def get_equivalence_results():
     """Get Rust-Python Equivalence Check results."""
+    # Equivalence is not dataset-specific; the latest run is kept in a pointer file
+    pointer = MethodologyValidationService.get_equivalence_pointer_path()
     try:
-        from ...services.methodology_validation import MethodologyValidationService
-        # Equivalence is not dataset-specific, check any dataset
-        import os
-        cache_base = '/home/rodrigues/injury-prediction/data/validation'
-        if os.path.exists(cache_base):
-            for ds in os.listdir(cache_base):
-                summary = MethodologyValidationService.get_methodology_summary(ds)
-                if summary['equivalence']['status'] == 'complete':
-                    return jsonify(summary['equivalence']), 200
-
-        return jsonify({'error': 'Equivalence check not yet run', 'status': 'not_run'}), 404
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        with open(pointer, 'rb') as f:
+            return current_app.response_class(f.read(), mimetype='application/json')
+    except FileNotFoundError:
+        pass
+
+    # Results saved before the pointer file existed: check any dataset
+    # (_-prefixed directories hold other caches, e.g. the default analyses)
+    cache_base = MethodologyValidationService.get_cache_base()
+    if os.path.isdir(cache_base):
+        with os.scandir(cache_base) as entries:
+            datasets = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith('_')]
+        for ds in datasets:
+            summary = MethodologyValidationService.get_methodology_summary(ds)
+            if summary['equivalence']['status'] == 'complete':
+                return jsonify(summary['equivalence']), 200
+
+    return _err('Equivalence check not yet run', 404, status='not_run')
 
 
 # =========================================================================
@@ -260,6 +311,7 @@ def get_equivalence_results():
 
 
 @validation_bp.route('/summary', methods=['GET'])
+@cached_by_data_revision
 def get_validation_summary():
     """
     Get complete validation summary including distributions, Sim2Real, and PMData analysis.
@@ -267,14 +319,12 @@ def get_validation_summary():
     Returns:
         JSON with overall scores, distribution comparison, sim2real results, and PMData analysis.
     """
-    try:
-        summary = ValidationService.get_validation_summary()
-        return jsonify(summary), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    summary = ValidationService.get_validation_summary()
+    return jsonify(summary), 200
 
 
 @validation_bp.route('/distributions', methods=['GET'])
+@cached_by_data_revision
 def get_distributions():
     """
     Compare distributions between synthetic and real PMData.
@@ -282,52 +332,97 @@ def get_distributions():
     Returns:
         JSON with JS divergence and histogram data for each feature.
     """
-    try:
-        result = ValidationService.get_distribution_comparison()
-        if 'error' in result and not result.get('has_synthetic') or not result.get('has_pmdata'):
-            return jsonify(numpy_to_python(result)), 404
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    result = ValidationService.get_distribution_comparison()
+    if 'error' in result and not result.get('has_synthetic') or not result.get('has_pmdata'):
+        return jsonify(result), 404
+    return jsonify(result), 200
+
+
+def _start_analysis_job(job_type, task):
+    """Create a job for a default-dataset analysis and hand it to the Celery worker."""
+    job_id = ProgressTracker.create_job(job_type)
+    task.delay(job_id)
+    return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+
+
+def _analysis_job_status(job_id):
+    """Return a default-dataset analysis job as JSON, or 404 if unknown."""
+    job = ProgressTracker.get_job(job_id)
+    if not job:
+        return _err(_JOB_NOT_FOUND, 404)
+    return jsonify(job), 200
+
+
+def _stored_analysis_result(name, start_endpoint):
+    """Serve the stored result for the current data, or 409 until a job has computed it."""
+    result_path = ValidationService.get_analysis_result_path(name)
+    if os.path.exists(result_path):
+        return send_file(result_path, mimetype='application/json')
+    return _err(f'No result for the current data; POST {start_endpoint} to compute it', 409)
+
+
+@validation_bp.route('/sim2real', methods=['POST'])
+def start_sim2real():
+    """
+    Start the Sim2Real transfer learning experiment as an async job.
+
+    Trains model on synthetic data, evaluates on real PMData.
+
+    Returns:
+        JSON with job_id and status.
+    """
+    return _start_analysis_job('sim2real', run_sim2real_task)
+
+
+@validation_bp.route('/sim2real/jobs/<job_id>', methods=['GET'])
+def get_sim2real_job_status(job_id):
+    """Get status of a Sim2Real job, with its result once completed."""
+    return _analysis_job_status(job_id)
 
 
 @validation_bp.route('/sim2real', methods=['GET'])
 def run_sim2real():
     """
-    Run Sim2Real transfer learning experiment.
+    Get the Sim2Real experiment result for the current data.
 
-    Trains model on synthetic data, evaluates on real PMData.
+    Returns:
+        JSON with AUC, average precision, and interpretation, or 409 if the
+        experiment has not been run since the data last changed.
+    """
+    return _stored_analysis_result('sim2real', '/api/validation/sim2real')
+
+
+@validation_bp.route('/pmdata-analysis', methods=['POST'])
+def start_pmdata_analysis():
+    """
+    Start the PMData injury pattern analysis as an async job.
 
     Returns:
-        JSON with AUC, average precision, and interpretation.
+        JSON with job_id and status.
     """
-    try:
-        result = ValidationService.run_sim2real_experiment()
-        if 'error' in result:
-            return jsonify(numpy_to_python(result)), 400
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _start_analysis_job('pmdata_analysis', run_pmdata_analysis_task)
+
+
+@validation_bp.route('/pmdata-analysis/jobs/<job_id>', methods=['GET'])
+def get_pmdata_analysis_job_status(job_id):
+    """Get status of a PMData analysis job, with its result once completed."""
+    return _analysis_job_status(job_id)
 
 
 @validation_bp.route('/pmdata-analysis', methods=['GET'])
 def get_pmdata_analysis():
     """
-    Analyze real PMData injury patterns.
+    Get the PMData analysis for the current data.
 
     Returns:
-        JSON with correlations, injury signature, and feature importance.
+        JSON with correlations, injury signature, and feature importance, or
+        409 if the analysis has not been run since the data last changed.
     """
-    try:
-        result = ValidationService.get_pmdata_analysis()
-        if 'error' in result:
-            return jsonify(numpy_to_python(result)), 404
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _stored_analysis_result('pmdata_analysis', '/api/validation/pmdata-analysis')
 
 
 @validation_bp.route('/model-evaluation', methods=['GET'])
+@cached_by_data_revision
 def get_model_evaluation():
     """
     Evaluate XGBoost models on PMData with different feature sets.
@@ -337,13 +432,22 @@ def get_model_evaluation():
     Returns:
         JSON with AUC for each model and feature importance.
     """
-    try:
-        result = ValidationService.evaluate_pmdata_model()
-        if 'error' in result:
-            return jsonify(numpy_to_python(result)), 400
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    result = ValidationService.evaluate_pmdata_model()
+    if 'error' in result:
+        return jsonify(result), 400
+    return jsonify(result), 200
+
+
+# The four possible /status bodies, encoded once
+_STATUS_BODIES = {
+    (has_synthetic, has_pmdata): orjson.dumps({
+        'has_synthetic': has_synthetic,
+        'has_pmdata': has_pmdata,
+        'ready': has_synthetic and has_pmdata
+    }, option=orjson.OPT_SORT_KEYS)
+    for has_synthetic in (True, False)
+    for has_pmdata in (True, False)
+}
 
 
 @validation_bp.route('/status', methods=['GET'])
@@ -351,20 +455,19 @@ def get_validation_status():
     """
     Quick status check for validation data availability.
 
+    Only checks that the data files exist; the result may be up to
+    AVAILABILITY_CACHE_TTL (5 s) stale.
+
     Returns:
         JSON indicating if synthetic and PMData are available.
     """
     try:
-        has_synthetic = ValidationService.load_synthetic() is not None
-        has_pmdata = ValidationService.load_pmdata() is not None
+        has_synthetic = ValidationService.synthetic_available()
+        has_pmdata = ValidationService.pmdata_available()
 
-        return jsonify({
-            'has_synthetic': has_synthetic,
-            'has_pmdata': has_pmdata,
-            'ready': has_synthetic and has_pmdata
-        })
+        return current_app.response_class(_STATUS_BODIES[has_synthetic, has_pmdata], mimetype='application/json')
     except Exception as e:
-        return jsonify({'error': str(e), 'ready': False}), 500
+        return _err(str(e), 500, ready=False)
 
 
 # =========================================================================
@@ -372,6 +475,7 @@ def get_validation_status():
 # =========================================================================
 
 @validation_bp.route('/causal-mechanism', methods=['GET'])
+@cached_by_data_revision
 def get_causal_mechanism():
     """
     Get comprehensive causal mechanism analysis for synthetic data.
@@ -387,16 +491,14 @@ def get_causal_mechanism():
     Returns:
         JSON with complete causal mechanism analysis.
     """
-    try:
-        result = ValidationService.get_causal_mechanism_analysis()
-        if 'error' in result:
-            return jsonify(numpy_to_python(result)), 404
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    result = ValidationService.get_causal_mechanism_analysis()
+    if 'error' in result:
+        return jsonify(result), 404
+    return jsonify(result), 200
 
 
 @validation_bp.route('/three-pillars', methods=['GET'])
+@cached_by_data_revision
 def get_three_pillars():
     """
     Get summary aligned with the Three Pillars of Validity framework.
@@ -408,14 +510,12 @@ def get_three_pillars():
     Returns:
         JSON with pillar scores and overall publication readiness.
     """
-    try:
-        result = ValidationService.get_three_pillars_summary()
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    result = ValidationService.get_three_pillars_summary()
+    return jsonify(result), 200
 
 
 @validation_bp.route('/raincloud/<feature>', methods=['GET'])
+@cached_by_data_revision
 def get_raincloud_data(feature):
     """
     Get data for raincloud plot comparing synthetic vs real distributions.
@@ -426,13 +526,10 @@ def get_raincloud_data(feature):
     Returns:
         JSON with density, box stats, and sample points for both datasets.
     """
-    try:
-        result = ValidationService.get_raincloud_data(feature)
-        if 'error' in result:
-            return jsonify(numpy_to_python(result)), 404
-        return jsonify(numpy_to_python(result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    result = ValidationService.get_raincloud_data(feature)
+    if 'error' in result:
+        return jsonify(result), 404
+    return jsonify(result), 200
 
 
 # =========================================================================
@@ -459,42 +556,29 @@ def run_scientific_validation():
     Returns:
         JSON with job_id and status.
     """
-    try:
-        from ...tasks import run_scientific_validation_task
-
-        data = request.get_json() or {}
-        dataset_id = data.get('dataset_id')
-        tasks = data.get('tasks', [
-            'reproducibility', 'permutation', 'sensitivity',
-            'adversarial', 'null_models', 'subgroups'
-        ])
+    body = _SCIENTIFIC_RUN_ADAPTER.validate_json(request.get_data(cache=False) or b'{}')
+    dataset_id = body.dataset_id
+    tasks = body.tasks
 
-        if not dataset_id:
-            return jsonify({'error': 'dataset_id is required'}), 400
-
-        # Validate task names
-        valid_tasks = {
-            'reproducibility', 'permutation', 'sensitivity',
-            'adversarial', 'null_models', 'subgroups'
-        }
-        invalid = set(tasks) - valid_tasks
-        if invalid:
-            return jsonify({'error': f'Invalid tasks: {invalid}'}), 400
+    if not dataset_id:
+        return _err(_DATASET_ID_REQUIRED, 400)
 
-        # Create job and start async task
-        job_id = ProgressTracker.create_job('scientific_validation')
-        run_scientific_validation_task.delay(job_id, dataset_id, tasks)
+    # Validate task names
+    invalid = [t for t in tasks if t not in _VALID_SCIENTIFIC_TASKS]
+    if invalid:
+        return _err(f'Invalid tasks: {invalid}', 400)
 
-        return jsonify({
-            'job_id': job_id,
-            'dataset_id': dataset_id,
-            'tasks': tasks,
-            'status': 'pending',
-            'estimated_runtime': '15-30 minutes for full suite'
-        }), 202
+    # Create job and start async task
+    job_id = ProgressTracker.create_job('scientific_validation')
+    run_scientific_validation_task.delay(job_id, dataset_id, tasks)
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'job_id': job_id,
+        'dataset_id': dataset_id,
+        'tasks': tasks,
+        'status': 'pending',
+        'estimated_runtime': '15-30 minutes for full suite'
+    }), 202
 
 
 @validation_bp.route('/scientific/jobs/<job_id>/status', methods=['GET'])
@@ -505,15 +589,11 @@ def get_scientific_job_status(job_id):
     Returns:
         JSON with job status, progress, current task, and results if completed.
     """
-    try:
-        job = ProgressTracker.get_job(job_id)
-        if not job:
-            return jsonify({'error': 'Job not found'}), 404
+    job = ProgressTracker.get_job(job_id)
+    if not job:
+        return _err(_JOB_NOT_FOUND, 404)
 
-        return jsonify(job), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify(job), 200
 
 
 @validation_bp.route('/scientific/results/<dataset_id>', methods=['GET'])
@@ -524,22 +604,12 @@ def get_scientific_results(dataset_id):
     Returns:
         JSON with full scientific validation results or 404 if not cached.
     """
-    try:
-        from ...services.scientific_validation import ScientificValidationService
-
-        results = ScientificValidationService.get_cached_results(dataset_id)
-        if not results:
-            return jsonify({
-                'error': 'No cached results found',
-                'dataset_id': dataset_id,
-                'cached': False
-            }), 404
+    results = ScientificValidationService.get_cached_results(dataset_id)
+    if not results:
+        return _err('No cached results found', 404, dataset_id=dataset_id, cached=False)
 
-        results['cached'] = True
-        return jsonify(results), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    results['cached'] = True
+    return jsonify(results), 200
 
 
 @validation_bp.route('/scientific/results', methods=['GET'])
@@ -547,39 +617,38 @@ def list_scientific_validations():
     """
     List all datasets with cached scientific validation results.
 
+    Summaries are streamed as newline-delimited JSON while the cache
+    directory is walked, one object per line.
+
     Returns:
-        JSON with list of validation summaries.
+        NDJSON stream of validation summaries.
     """
+    cache_base = ScientificValidationService.CACHE_BASE
     try:
-        import os
-        from ...services.scientific_validation import ScientificValidationService
-
-        cache_base = ScientificValidationService.CACHE_BASE
-        validations = []
-
-        if os.path.exists(cache_base):
-            for dataset_id in os.listdir(cache_base):
-                dataset_dir = os.path.join(cache_base, dataset_id)
-                summary_path = os.path.join(dataset_dir, 'summary.json')
-
-                if os.path.isdir(dataset_dir) and os.path.exists(summary_path):
-                    try:
-                        import json
-                        with open(summary_path, 'r') as f:
-                            summary = json.load(f)
-                        validations.append({
-                            'dataset_id': dataset_id,
-                            'computed_at': summary.get('computed_at'),
-                            'pass_rate': summary.get('pass_rate', 0),
-                            'publication_ready': summary.get('publication_ready', False)
-                        })
-                    except Exception:
-                        pass
-
-        return jsonify({'validations': validations}), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        entries = os.scandir(cache_base)
+    except FileNotFoundError:
+        entries = None
+
+    def generate():
+        if entries is None:
+            return
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    with open(os.path.join(entry.path, 'summary.json'), 'rb') as f:
+                        summary = orjson.loads(f.read())
+                    yield orjson.dumps({
+                        'dataset_id': entry.name,
+                        'computed_at': summary.get('computed_at'),
+                        'pass_rate': summary.get('pass_rate', 0),
+                        'publication_ready': summary.get('publication_ready', False)
+                    }, option=orjson.OPT_APPEND_NEWLINE)
+                except Exception:
+                    pass
+
+    return current_app.response_class(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 
 @validation_bp.route('/scientific/results/<dataset_id>', methods=['DELETE'])
@@ -590,28 +659,20 @@ def delete_scientific_results(dataset_id):
     Returns:
         JSON with success status.
     """
-    try:
-        import os
-        import shutil
-        from ...services.scientific_validation import ScientificValidationService
-
-        cache_dir = ScientificValidationService.get_cache_dir(dataset_id)
-
-        if os.path.exists(cache_dir):
-            shutil.rmtree(cache_dir)
-            return jsonify({
-                'deleted': True,
-                'dataset_id': dataset_id
-            }), 200
-        else:
-            return jsonify({
-                'deleted': False,
-                'dataset_id': dataset_id,
-                'message': 'No cached results found'
-            }), 200
+    cache_dir = ScientificValidationService.get_cache_dir(dataset_id)
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+        return jsonify({
+            'deleted': True,
+            'dataset_id': dataset_id
+        }), 200
+    else:
+        return jsonify({
+            'deleted': False,
+            'dataset_id': dataset_id,
+            'message': 'No cached results found'
+        }), 200
 
 
 @validation_bp.route('/scientific/jobs', methods=['GET'])
@@ -622,103 +683,142 @@ def list_scientific_jobs():
     Returns:
         JSON with list of jobs.
     """
-    try:
-        jobs = ProgressTracker.get_all_jobs('scientific_validation')
-        return jsonify({'jobs': jobs}), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    body = ProgressTracker.get_all_jobs_json('scientific_validation', limit=request.args.get('limit', type=int))
+    return current_app.response_class(body, mimetype='application/json')
 
 
 # =========================================================================
 # LANDING PAGE STATS ENDPOINT
 # =========================================================================
 
+# Encoded landing-page stats, keyed on the modification times of the files
+# they are aggregated from (see _landing_stats_signature).
+_landing_stats_cache = {}
+_landing_stats_lock = threading.Lock()
+
+
+def _mtime(path):
+    """Return a file's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _landing_stats_signature(validation_dir, models_dir):
+    """Return the mtimes of every file the landing-page stats are built from."""
+    try:
+        with os.scandir(models_dir) as entries:
+            model_files = tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries if entry.name.endswith('.json')
+            ))
+    except FileNotFoundError:
+        model_files = None
+    return (
+        validation_dir,
+        _mtime(os.path.join(validation_dir, 'three_pillars.json')),
+        _mtime(os.path.join(validation_dir, 'causal_mechanism.json')),
+        models_dir,
+        model_files,
+    )
+
+
 @validation_bp.route('/landing-stats', methods=['GET'])
 def get_landing_stats():
     """
     Get aggregated stats for the landing page from pre-seeded validation data.
     Uses dataset_pmdata_calibrated as the reference dataset.
 
+    The encoded response is reused until one of the source files changes.
+
     Returns:
         JSON with cohort info, ACWR zones, model performance, and three pillars.
     """
-    import os
-    import json
-    from flask import current_app
 
-    try:
-        data_dir = current_app.config.get('DATA_DIR', 'data')
-        validation_dir = os.path.join(data_dir, 'validation', 'dataset_pmdata_calibrated')
-        models_dir = os.path.join(data_dir, 'models')
-
-        stats = {
-            'cohort': {
-                'athletes': 1000,
-                'samples': 366000,
-                'year': 1
-            },
-            'acwr_zones': [],
-            'model_performance': [],
-            'three_pillars': {
-                'statistical_fidelity': {'score': 0, 'status': 'pending'},
-                'causal_fidelity': {'score': 0, 'status': 'pending'},
-                'transferability': {'score': 0, 'status': 'pending'},
-                'overall_score': 0,
-                'pillars_passing': '0/3'
-            }
+    data_dir = current_app.config.get('DATA_DIR', 'data')
+    validation_dir = os.path.join(data_dir, 'validation', 'dataset_pmdata_calibrated')
+    models_dir = os.path.join(data_dir, 'models')
+
+    key = _landing_stats_signature(validation_dir, models_dir)
+    with _landing_stats_lock:
+        body = _landing_stats_cache.get(key)
+    if body is None:
+        body = current_app.json.dumps_bytes(_build_landing_stats(validation_dir, models_dir))
+        with _landing_stats_lock:
+            _landing_stats_cache.clear()
+            _landing_stats_cache[key] = body
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def _build_landing_stats(validation_dir, models_dir):
+    """Aggregate the landing-page stats from the validation and model files."""
+    stats = {
+        'cohort': {
+            'athletes': 1000,
+            'samples': 366000,
+            'year': 1
+        },
+        'acwr_zones': [],
+        'model_performance': [],
+        'three_pillars': {
+            'statistical_fidelity': {'score': 0, 'status': 'pending'},
+            'causal_fidelity': {'score': 0, 'status': 'pending'},
+            'transferability': {'score': 0, 'status': 'pending'},
+            'overall_score': 0,
+            'pillars_passing': '0/3'
         }
+    }
+
+    # Load three pillars data
+    three_pillars_path = os.path.join(validation_dir, 'three_pillars.json')
+    if os.path.exists(three_pillars_path):
+        with open(three_pillars_path, 'r') as f:
+            tp_data = json.load(f)
+            stats['three_pillars'] = {
+                'statistical_fidelity': tp_data.get('pillars', {}).get('statistical_fidelity', {}),
+                'causal_fidelity': tp_data.get('pillars', {}).get('causal_fidelity', {}),
+                'transferability': tp_data.get('pillars', {}).get('transferability', {}),
+                'overall_score': tp_data.get('overall_score', 0),
+                'pillars_passing': tp_data.get('pillars_passing', '0/3')
+            }
 
-        # Load three pillars data
-        three_pillars_path = os.path.join(validation_dir, 'three_pillars.json')
-        if os.path.exists(three_pillars_path):
-            with open(three_pillars_path, 'r') as f:
-                tp_data = json.load(f)
-                stats['three_pillars'] = {
-                    'statistical_fidelity': tp_data.get('pillars', {}).get('statistical_fidelity', {}),
-                    'causal_fidelity': tp_data.get('pillars', {}).get('causal_fidelity', {}),
-                    'transferability': tp_data.get('pillars', {}).get('transferability', {}),
-                    'overall_score': tp_data.get('overall_score', 0),
-                    'pillars_passing': tp_data.get('pillars_passing', '0/3')
-                }
-
-        # Load causal mechanism data for ACWR zones
-        causal_path = os.path.join(validation_dir, 'causal_mechanism.json')
-        if os.path.exists(causal_path):
-            with open(causal_path, 'r') as f:
-                causal_data = json.load(f)
-                stats['acwr_zones'] = causal_data.get('causal_asymmetry', {}).get('zones', [])
-                stats['cohort']['athletes'] = causal_data.get('total_athletes', 1000)
-                stats['cohort']['samples'] = causal_data.get('total_samples', 366000)
-
-        # Load model performance from latest models
-        if os.path.exists(models_dir):
-            model_files = [f for f in os.listdir(models_dir) if f.endswith('.json')]
-            model_results = {}
-
-            for mf in model_files:
-                with open(os.path.join(models_dir, mf), 'r') as f:
-                    model_data = json.load(f)
-                    model_type = model_data.get('model_type', '')
-                    # Keep the latest model for each type
-                    if model_type not in model_results or model_data.get('created_at', '') > model_results[model_type].get('created_at', ''):
-                        model_results[model_type] = model_data
-
-            # Format for landing page
-            model_order = ['xgboost', 'random_forest', 'lasso']
-            model_names = {'xgboost': 'XGBoost', 'random_forest': 'Random Forest', 'lasso': 'Lasso (L1)'}
-            model_colors = {'xgboost': 'blue', 'random_forest': 'emerald', 'lasso': 'purple'}
-
-            for mt in model_order:
-                if mt in model_results:
-                    metrics = model_results[mt].get('metrics', {})
-                    stats['model_performance'].append({
-                        'name': model_names.get(mt, mt),
-                        'type': mt,
-                        'auc': metrics.get('roc_auc', 0),
-                        'color': model_colors.get(mt, 'gray')
-                    })
-
-        return jsonify(stats), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # Load causal mechanism data for ACWR zones
+    causal_path = os.path.join(validation_dir, 'causal_mechanism.json')
+    if os.path.exists(causal_path):
+        with open(causal_path, 'r') as f:
+            causal_data = json.load(f)
+            stats['acwr_zones'] = causal_data.get('causal_asymmetry', {}).get('zones', [])
+            stats['cohort']['athletes'] = causal_data.get('total_athletes', 1000)
+            stats['cohort']['samples'] = causal_data.get('total_samples', 366000)
+
+    # Load model performance from latest models
+    if os.path.exists(models_dir):
+        with os.scandir(models_dir) as entries:
+            model_files = [entry.path for entry in entries if entry.name.endswith('.json')]
+        model_results = {}
+
+        for mf in model_files:
+            with open(mf, 'r') as f:
+                model_data = json.load(f)
+                model_type = model_data.get('model_type', '')
+                # Keep the latest model for each type
+                if model_type not in model_results or model_data.get('created_at', '') > model_results[model_type].get('created_at', ''):
+                    model_results[model_type] = model_data
+
+        # Format for landing page
+        model_order = ['xgboost', 'random_forest', 'lasso']
+        model_names = {'xgboost': 'XGBoost', 'random_forest': 'Random Forest', 'lasso': 'Lasso (L1)'}
+        model_colors = {'xgboost': 'blue', 'random_forest': 'emerald', 'lasso': 'purple'}
+
+        for mt in model_order:
+            if mt in model_results:
+                metrics = model_results[mt].get('metrics', {})
+                stats['model_performance'].append({
+                    'name': model_names.get(mt, mt),
+                    'type': mt,
+                    'auc': metrics.get('roc_auc', 0),
+                    'color': model_colors.get(mt, 'gray')
+                })
+
+    return stats
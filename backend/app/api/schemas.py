@@ -35,7 +35,36 @@ class TrainingSchema(BaseModel):
                 raise ValueError(f'Invalid model type: {mt}. Valid types: {valid_types}')
         return v
 
+class CompareSchema(BaseModel):
+    model_ids: List[str] = Field(default_factory=list)
+
 class IngestionSchema(BaseModel):
     dataset_id: str
     data_type: str = Field(default='garmin_csv')
 
+
+class RunValidationSchema(BaseModel):
+    dataset_id: Optional[str] = None
+
+
+class MethodologyRunSchema(BaseModel):
+    dataset_id: Optional[str] = None
+    validation_types: List[str] = Field(default_factory=lambda: ['loso', 'sensitivity', 'equivalence'])
+
+
+class ScientificRunSchema(BaseModel):
+    dataset_id: Optional[str] = None
+    tasks: List[str] = Field(default_factory=lambda: [
+        'reproducibility', 'permutation', 'sensitivity',
+        'adversarial', 'null_models', 'subgroups'
+    ])
+
+
+class AnalyticsQuery(BaseModel):
+    dataset_id: Optional[str] = None
+    athlete_id: Optional[str] = None
+    model_id: Optional[str] = None
+    feature: Optional[str] = None
+    date: Optional[str] = None
+    bins: int = Field(default=50, ge=1)
+    lookback_days: int = Field(default=14, ge=1)
@@ -32,6 +32,7 @@ celery_app.conf.update(
 
     # Result backend
     result_expires=86400,           # Results expire after 24 hours
+    task_ignore_result=True,        # Job state and results are reported via ProgressTracker
 
     # Task retry defaults
     task_default_retry_delay=60,    # Wait 60 seconds before retry
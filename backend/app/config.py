@@ -14,6 +14,18 @@ class Config:
     PROCESSED_DATA_DIR = os.path.join(DATA_DIR, 'processed')
     MODELS_DIR = os.path.join(DATA_DIR, 'models')
 
+    # Per-process memory budget for parsed dataset tables reused by analytics
+    ANALYTICS_TABLE_CACHE_MB = int(os.environ.get('ANALYTICS_TABLE_CACHE_MB', 192))
+
+    # Upload limits (ingestion endpoint); larger requests are rejected with 413
+    MAX_CONTENT_LENGTH = int(os.environ.get('MAX_UPLOAD_MB', 256)) * 1024 * 1024
+
+    # Response compression (Flask-Compress); small bodies are sent as-is
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_MIN_SIZE = 1024
+
     # Synthetic data generation module path
     SYNTHETIC_DATA_MODULE = os.path.join(PROJECT_ROOT, 'synthetic_data_generation')
 
@@ -1,6 +1,10 @@
+import importlib.util
 import os
 import json
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 import numpy as np
 import joblib
@@ -10,12 +14,115 @@ from flask import current_app
 from ..utils.file_manager import FileManager
 from .preprocessing_service import PreprocessingService
 
-# SHAP is optional - used for explainability
-try:
-    import shap
-    SHAP_AVAILABLE = True
-except ImportError:
-    SHAP_AVAILABLE = False
+# SHAP is optional - used for explainability. It is imported on first use
+# rather than at app start-up, since it is by far the slowest import here.
+SHAP_AVAILABLE = importlib.util.find_spec('shap') is not None
+_shap = None
+_shap_lock = threading.Lock()
+
+
+def _get_shap():
+    """Import shap once; the lock keeps threaded workers from racing the first import."""
+    global _shap
+    if _shap is None:
+        with _shap_lock:
+            if _shap is None:
+                import shap
+                _shap = shap
+    return _shap
+
+
+# Parsed dataset tables are kept per file path, modification time and column
+# selection, so a regenerated dataset is re-read. The cache is bounded by the
+# frames' in-memory size (ANALYTICS_TABLE_CACHE_MB per process), evicting the
+# least recently used tables first.
+_table_cache = OrderedDict()
+_table_cache_bytes = 0
+_table_cache_lock = threading.Lock()
+
+SCHEMA_CACHE_SIZE = 16
+
+
+def _read_table(path: str, mtime_ns: int, columns: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+    """Parsed table or column subset, shared between callers: do not modify the result."""
+    global _table_cache_bytes
+    key = (path, mtime_ns, columns)
+    full_key = (path, mtime_ns, None)
+    with _table_cache_lock:
+        # A cached full table also serves its column subsets
+        for cache_key in (key, full_key):
+            entry = _table_cache.get(cache_key)
+            if entry is not None:
+                _table_cache.move_to_end(cache_key)
+                return entry[0] if cache_key == key else entry[0][list(columns)]
+
+    df = FileManager.read_df(path, columns=list(columns) if columns is not None else None)
+    size = int(df.memory_usage(deep=True).sum())
+    budget = current_app.config['ANALYTICS_TABLE_CACHE_MB'] * 1024 * 1024
+    if size <= budget:
+        with _table_cache_lock:
+            if key not in _table_cache:
+                _table_cache[key] = (df, size)
+                _table_cache_bytes += size
+                while _table_cache_bytes > budget:
+                    _, (_, evicted_size) = _table_cache.popitem(last=False)
+                    _table_cache_bytes -= evicted_size
+    return df
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _read_table_schema(path: str, mtime_ns: int) -> pd.DataFrame:
+    return FileManager.read_df_schema(path)
+
+
+def _stat_table(dataset_path: str, name: str) -> Tuple[str, int]:
+    """Return the path and mtime of a dataset table (Parquet, else CSV)."""
+    base_path = os.path.join(dataset_path, name)
+    for path in (base_path + '.parquet', base_path + '.csv'):
+        try:
+            return path, os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(f"Could not find data file at {base_path}")
+
+
+def _load_table(dataset_path: str, name: str, columns: Optional[List[str]] = None,
+                copy: bool = True) -> pd.DataFrame:
+    """
+    Read a dataset table (or only some of its columns), reusing the parsed frame while the file is unchanged.
+
+    Read-only callers may pass copy=False to get the shared cached frame,
+    which they must not modify.
+    """
+    path, mtime_ns = _stat_table(dataset_path, name)
+    if columns is not None:
+        columns = tuple(dict.fromkeys(columns))
+    df = _read_table(path, mtime_ns, columns)
+    return df.copy() if copy else df
+
+
+def _load_table_schema(dataset_path: str, name: str) -> pd.DataFrame:
+    """Return an empty frame with a dataset table's columns and dtypes."""
+    return _read_table_schema(*_stat_table(dataset_path, name))
+
+
+def _load_athlete_rows(dataset_path: str, name: str, athlete_id: str) -> pd.DataFrame:
+    """Read one athlete's rows of a dataset table.
+
+    For Parquet tables with string athlete IDs the filter is pushed into the
+    reader, which skips row groups whose athlete_id range cannot match.
+    """
+    path, mtime_ns = _stat_table(dataset_path, name)
+    if path.endswith('.parquet'):
+        schema = _read_table_schema(path, mtime_ns)
+        if 'athlete_id' in schema.columns and pd.api.types.is_string_dtype(schema['athlete_id'].dtype):
+            return FileManager.read_df(path, filters=[('athlete_id', '==', athlete_id)])
+    df = _read_table(path, mtime_ns, None)
+    return df[df['athlete_id'] == athlete_id].copy()
+
+
+# Upper ACWR bounds of the Too Low, Optimal and Danger zones; higher is High Risk
+ACWR_ZONE_EDGES = np.array([0.8, 1.3, 1.5])
 
 # Lifestyle profile descriptions for athlete dashboard
 LIFESTYLE_DESCRIPTIONS = {
@@ -150,7 +257,7 @@ class AnalyticsService:
             return None
 
         try:
-            model = joblib.load(model_path)
+            model = joblib.load(model_path, mmap_mode='r')
         except Exception:
             return None
 
@@ -168,9 +275,9 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
-            activity_df = FileManager.read_df(os.path.join(dataset_path, 'activity_data'))
+            daily_df = _load_table(dataset_path, 'daily_data')
+            athletes_df = _load_table(dataset_path, 'athletes')
+            activity_df = _load_table(dataset_path, 'activity_data')
         except FileNotFoundError:
             return None
 
@@ -257,13 +364,12 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            if feature not in _load_table_schema(dataset_path, 'daily_data').columns:
+                return None
+            df = _load_table(dataset_path, 'daily_data', columns=[feature], copy=False)
         except FileNotFoundError:
             return None
 
-        if feature not in df.columns:
-            return None
-
         data = df[feature].dropna()
         hist, bin_edges = np.histogram(data, bins=bins)
 
@@ -285,7 +391,7 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            columns = _load_table_schema(dataset_path, 'daily_data').columns
         except FileNotFoundError:
             return None
 
@@ -295,16 +401,25 @@ class AnalyticsService:
                        'stress', 'body_battery_morning', 'actual_tss', 'injury']
 
         # Filter to available features
-        available_features = [f for f in features if f in df.columns]
+        available_features = [f for f in features if f in columns]
         if len(available_features) < 2:
             return None
 
-        corr_matrix = df[available_features].corr()
+        df = _load_table(dataset_path, 'daily_data', columns=available_features, copy=False)
+
+        # Complete data goes straight to NumPy; with gaps, keep pandas'
+        # pairwise-complete handling of missing values
+        values = df[available_features].to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            corr_matrix = df[available_features].corr().to_numpy()
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_matrix = np.corrcoef(values, rowvar=False)
 
         return {
             'features': available_features,
-            'correlation_matrix': corr_matrix.values.tolist(),
-            'feature_names': corr_matrix.columns.tolist()
+            'correlation_matrix': corr_matrix.tolist(),
+            'feature_names': list(available_features)
         }
 
     @classmethod
@@ -314,69 +429,50 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            df = _load_table(dataset_path, 'daily_data')
         except FileNotFoundError:
             return None
 
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values(['athlete_id', 'date'])
 
-        # Find injury onset days
-        df['injury_onset'] = 0
-        for athlete_id in df['athlete_id'].unique():
-            athlete_data = df[df['athlete_id'] == athlete_id]
-            for i in range(1, len(athlete_data)):
-                curr_idx = athlete_data.index[i]
-                prev_idx = athlete_data.index[i-1]
-                if df.loc[curr_idx, 'injury'] == 1 and df.loc[prev_idx, 'injury'] == 0:
-                    df.loc[curr_idx, 'injury_onset'] = 1
+        # Find injury onset days: injured after an uninjured day of the same athlete
+        # (an athlete's first day has no previous day and is never an onset)
+        prev_injury = df.groupby('athlete_id', sort=False)['injury'].shift(1)
+        df['injury_onset'] = ((df['injury'] == 1) & (prev_injury == 0)).astype(np.int8)
 
         metrics = ['hrv', 'resting_hr', 'sleep_hours', 'sleep_quality', 'stress', 'body_battery_morning']
         available_metrics = [m for m in metrics if m in df.columns]
 
-        window_analysis = {m: {'days': list(range(-lookback_days, 1)), 'values': []} for m in available_metrics}
-
-        # For each injury onset, collect the preceding days' metrics
-        injury_onsets = df[df['injury_onset'] == 1]
+        days = list(range(-lookback_days, 1))
 
-        for _, onset in injury_onsets.iterrows():
-            athlete_data = df[df['athlete_id'] == onset['athlete_id']].copy()
-            athlete_data = athlete_data.sort_values('date')
-
-            onset_idx = athlete_data[athlete_data['date'] == onset['date']].index
-            if len(onset_idx) == 0:
-                continue
+        # Rows are sorted by athlete and date, so each onset's window is the
+        # lookback_days rows before it, clipped at the start of the athlete's rows
+        onset_pos = np.flatnonzero(df['injury_onset'].to_numpy())
+        athlete_start = np.arange(len(df)) - df.groupby('athlete_id', sort=False).cumcount().to_numpy()
+        window_pos = onset_pos[:, None] + np.arange(-lookback_days, 1)
+        in_range = window_pos >= athlete_start[onset_pos][:, None]
 
-            onset_pos = athlete_data.index.get_loc(onset_idx[0])
-
-            for m in available_metrics:
-                values = []
-                for day in range(-lookback_days, 1):
-                    pos = onset_pos + day
-                    if 0 <= pos < len(athlete_data):
-                        values.append(float(athlete_data.iloc[pos][m]))
-                    else:
-                        values.append(None)
-                window_analysis[m]['values'].append(values)
+        # Gather every window in one indexing pass: (onsets, days, metrics)
+        windows = df[available_metrics].to_numpy(dtype=float)[np.maximum(window_pos, 0)]
+        counts = in_range.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Days outside an athlete's history are skipped; missing values stay NaN
+            averages = np.where(in_range[:, :, None], windows, 0.0).sum(axis=0) / counts[:, None]
 
         # Calculate averages
         result = {}
-        for m in available_metrics:
-            all_values = window_analysis[m]['values']
-            if all_values:
-                avg_values = []
-                for day_idx in range(lookback_days + 1):
-                    day_values = [v[day_idx] for v in all_values if v[day_idx] is not None]
-                    avg_values.append(float(np.mean(day_values)) if day_values else None)
+        if len(onset_pos):
+            for j, m in enumerate(available_metrics):
                 result[m] = {
-                    'days': list(range(-lookback_days, 1)),
-                    'average': avg_values,
-                    'n_samples': len(all_values)
+                    'days': days,
+                    'average': [float(v) if n else None for v, n in zip(averages[:, j], counts)],
+                    'n_samples': len(onset_pos)
                 }
 
         return {
             'lookback_days': lookback_days,
-            'n_injuries': len(injury_onsets),
+            'n_injuries': len(onset_pos),
             'metrics': result
         }
 
@@ -387,12 +483,10 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            athlete_data = _load_athlete_rows(dataset_path, 'daily_data', athlete_id)
         except FileNotFoundError:
             return None
 
-        athlete_data = daily_df[daily_df['athlete_id'] == athlete_id].copy()
-
         if len(athlete_data) == 0:
             return None
 
@@ -401,7 +495,7 @@ class AnalyticsService:
         # Get athlete profile
         profile = None
         try:
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
+            athletes_df = _load_table(dataset_path, 'athletes')
             profile_row = athletes_df[athletes_df['athlete_id'] == athlete_id]
             if len(profile_row) > 0:
                 # Convert numpy types to python types for serialization
@@ -428,52 +522,47 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            df = _load_table(dataset_path, 'daily_data')
         except FileNotFoundError:
             return None
 
         df = df.sort_values(['athlete_id', 'date'])
 
-        # Calculate ACWR
-        def calc_acwr(group):
-            group = group.copy()
-            group['acute_load'] = group['actual_tss'].rolling(7, min_periods=1).sum()
-            group['chronic_load'] = group['actual_tss'].rolling(28, min_periods=7).mean() * 7
-            group['acwr'] = group['acute_load'] / group['chronic_load'].replace(0, np.nan)
-            return group
-
-        df = df.groupby('athlete_id', group_keys=False).apply(calc_acwr)
-        df['acwr'] = df['acwr'].fillna(1.0)
-
-        # Define zones
-        def acwr_zone(acwr):
-            if acwr < 0.8:
-                return 'Too Low (<0.8)'
-            elif acwr < 1.3:
-                return 'Optimal (0.8-1.3)'
-            elif acwr < 1.5:
-                return 'Danger Zone (1.3-1.5)'
-            else:
-                return 'High Risk (>1.5)'
-
-        df['acwr_zone'] = df['acwr'].apply(acwr_zone)
+        # Calculate ACWR with grouped rolling windows (one pass per window, no per-group copies)
+        tss = df.groupby('athlete_id', sort=False)['actual_tss']
+        acute_load = tss.rolling(7, min_periods=1).sum().reset_index(level=0, drop=True)
+        chronic_load = tss.rolling(28, min_periods=7).mean().reset_index(level=0, drop=True) * 7
+        df['acwr'] = (acute_load / chronic_load.replace(0, np.nan)).fillna(1.0)
+
+        # Zone codes 0-3 from the zone boundaries; NaN sorts past every edge into High Risk
+        zone_order = ['Too Low (<0.8)', 'Optimal (0.8-1.3)', 'Danger Zone (1.3-1.5)', 'High Risk (>1.5)']
+        zone_codes = np.searchsorted(ACWR_ZONE_EDGES, df['acwr'].to_numpy(), side='right')
 
         # Calculate zone distribution
-        zone_counts = df['acwr_zone'].value_counts().to_dict()
+        zone_counts = np.bincount(zone_codes, minlength=len(zone_order))
         total = len(df)
         # Prevent division by zero when dataset is empty
-        zone_distribution = {zone: count / total if total > 0 else 0 for zone, count in zone_counts.items()}
+        zone_distribution = {
+            zone: count / total if total > 0 else 0
+            for zone, count in zip(zone_order, zone_counts.tolist()) if count
+        }
 
-        # Calculate injury rate by zone
-        injury_by_zone = df.groupby('acwr_zone')['injury'].agg(['sum', 'count'])
-        # Prevent division by zero with replace
-        injury_rates = (injury_by_zone['sum'] / injury_by_zone['count'].replace(0, 1)).to_dict()
+        # Calculate injury rate by zone (missing injury labels are not counted)
+        injury = df['injury'].to_numpy(dtype=np.float64)
+        labelled = ~np.isnan(injury)
+        injury_sums = np.bincount(zone_codes[labelled], weights=injury[labelled], minlength=len(zone_order))
+        labelled_counts = np.bincount(zone_codes[labelled], minlength=len(zone_order))
+        # Prevent division by zero with max(.., 1)
+        injury_rates = {
+            zone: float(injury_sums[code] / max(labelled_counts[code], 1))
+            for code, zone in enumerate(zone_order) if zone_counts[code]
+        }
 
         return {
             'zone_distribution': zone_distribution,
             'injury_rate_by_zone': injury_rates,
             'total_days': total,
-            'zone_order': ['Too Low (<0.8)', 'Optimal (0.8-1.3)', 'Danger Zone (1.3-1.5)', 'High Risk (>1.5)']
+            'zone_order': zone_order
         }
 
     @classmethod
@@ -501,7 +590,7 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
+            df = _load_table(dataset_path, 'athletes', columns=['athlete_id'], copy=False)
             return df['athlete_id'].tolist()
         except FileNotFoundError:
             return None
@@ -513,10 +602,16 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            schema = _load_table_schema(dataset_path, 'daily_data')
         except FileNotFoundError:
             return None
 
+        # Only the ID, label and numeric metric columns are summarized
+        numeric_cols = schema.select_dtypes(include=[np.number]).columns
+        daily_df = _load_table(dataset_path, 'daily_data', columns=[
+            c for c in schema.columns if c in ('athlete_id', 'injury') or c in numeric_cols
+        ], copy=False)
+
         stats = {
             'n_athletes': daily_df['athlete_id'].nunique(),
             'n_days': len(daily_df),
@@ -525,14 +620,16 @@ class AnalyticsService:
         }
 
         # Add per-metric stats
-        numeric_cols = daily_df.select_dtypes(include=[np.number]).columns
         for col in numeric_cols:
             if col not in ['athlete_id', 'injury']:
                 stats[f'{col}_mean'] = float(daily_df[col].mean())
                 stats[f'{col}_std'] = float(daily_df[col].std())
 
         try:
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
+            athletes_columns = _load_table_schema(dataset_path, 'athletes').columns
+            athletes_df = _load_table(dataset_path, 'athletes', columns=[
+                c for c in ('gender', 'age') if c in athletes_columns
+            ], copy=False)
             if 'gender' in athletes_df.columns:
                 stats['gender_distribution'] = athletes_df['gender'].value_counts().to_dict()
             if 'age' in athletes_df.columns:
@@ -554,8 +651,8 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
+            athletes_df = _load_table(dataset_path, 'athletes')
+            daily_df = _load_table(dataset_path, 'daily_data')
         except FileNotFoundError:
             return None
 
@@ -624,8 +721,8 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
+            daily_df = _load_table(dataset_path, 'daily_data')
+            athletes_df = _load_table(dataset_path, 'athletes')
         except FileNotFoundError:
             return None
 
@@ -754,7 +851,7 @@ class AnalyticsService:
             return None
 
         try:
-            model = joblib.load(model_path)
+            model = joblib.load(model_path, mmap_mode='r')
         except Exception:
             return None
 
@@ -771,9 +868,9 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
-            activity_df = FileManager.read_df(os.path.join(dataset_path, 'activity_data'))
+            daily_df = _load_table(dataset_path, 'daily_data')
+            athletes_df = _load_table(dataset_path, 'athletes')
+            activity_df = _load_table(dataset_path, 'activity_data')
         except FileNotFoundError:
             return None
 
@@ -844,7 +941,7 @@ class AnalyticsService:
             return None
 
         try:
-            model = joblib.load(model_path)
+            model = joblib.load(model_path, mmap_mode='r')
         except Exception:
             return None
 
@@ -862,9 +959,9 @@ class AnalyticsService:
         dataset_path = os.path.join(raw_dir, dataset_id)
 
         try:
-            daily_df = FileManager.read_df(os.path.join(dataset_path, 'daily_data'))
-            athletes_df = FileManager.read_df(os.path.join(dataset_path, 'athletes'))
-            activity_df = FileManager.read_df(os.path.join(dataset_path, 'activity_data'))
+            daily_df = _load_table(dataset_path, 'daily_data')
+            athletes_df = _load_table(dataset_path, 'athletes')
+            activity_df = _load_table(dataset_path, 'activity_data')
         except FileNotFoundError:
             return None
 
@@ -923,7 +1020,7 @@ class AnalyticsService:
         if SHAP_AVAILABLE and model_type in ['random_forest', 'xgboost']:
             try:
                 # Use SHAP for tree-based models
-                explainer = shap.TreeExplainer(model)
+                explainer = _get_shap().TreeExplainer(model)
                 shap_values = explainer.shap_values(X_sample)
 
                 # Handle binary classification
@@ -150,7 +150,8 @@ class DataGenerationService:
         df_activity_data = pd.DataFrame(activity_data_records)
 
         FileManager.save_df(df_athletes, os.path.join(folder_path, 'athletes.parquet'))
-        FileManager.save_df(df_daily_data, os.path.join(folder_path, 'daily_data.parquet'))
+        FileManager.save_df(df_daily_data, os.path.join(folder_path, 'daily_data.parquet'),
+                            row_group_size=FileManager.ATHLETE_ROW_GROUP_SIZE)
         FileManager.save_df(df_activity_data, os.path.join(folder_path, 'activity_data.parquet'))
 
         # Save metadata
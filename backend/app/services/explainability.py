@@ -26,6 +26,7 @@ import shap
 # Dice-ML for counterfactuals
 import dice_ml
 
+from app.utils.file_manager import FileManager
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -65,7 +66,7 @@ class ExplainabilityService:
             logger.info(f"Loading model from {self.model_path}")
 
             if self.model_type in ["xgboost", "random_forest"]:
-                self.model = joblib.load(self.model_path)
+                self.model = joblib.load(self.model_path, mmap_mode='r')
 
                 # For tree-based models, use TreeExplainer (fast and exact)
                 logger.info("Initializing SHAP TreeExplainer")
@@ -74,7 +75,7 @@ class ExplainabilityService:
                     feature_perturbation="interventional"  # Better for correlated features
                 )
             elif self.model_type == "lasso":
-                self.model = joblib.load(self.model_path)
+                self.model = joblib.load(self.model_path, mmap_mode='r')
 
                 # For linear models, use LinearExplainer
                 logger.info("Initializing SHAP LinearExplainer")
@@ -539,9 +540,9 @@ def explain_model_globally(dataset_id: str, model_name: str = "xgboost") -> Dict
     if not model_path.exists():
         raise FileNotFoundError(f"Model not found: {model_path}")
 
-    # Load test data
+    # Load test data (Parquet written by preprocessing, CSV as fallback)
     data_dir = Path("data/processed") / dataset_id
-    X_test = pd.read_csv(data_dir / "X_test.csv")
+    X_test = FileManager.read_df(str(data_dir / "X_test"))
 
     # Create explainer
     explainer = ExplainabilityService(
@@ -579,9 +580,9 @@ def explain_athlete_risk(
     if not model_path.exists():
         raise FileNotFoundError(f"Model not found: {model_path}")
 
-    # Load test data
+    # Load test data (Parquet written by preprocessing, CSV as fallback)
     data_dir = Path("data/processed") / dataset_id
-    X_test = pd.read_csv(data_dir / "X_test.csv")
+    X_test = FileManager.read_df(str(data_dir / "X_test"))
 
     # Filter to athlete
     # Assuming there's an Athlete_ID column or similar
@@ -85,7 +85,8 @@ class IngestionService:
         combined_df = pd.concat([daily_df, real_df], ignore_index=True)
         
         # Save back
-        FileManager.save_df(combined_df, os.path.join(dataset_path, 'daily_data.parquet'))
+        FileManager.save_df(combined_df, os.path.join(dataset_path, 'daily_data.parquet'),
+                            row_group_size=FileManager.ATHLETE_ROW_GROUP_SIZE)
         
         # Update metadata
         metadata = FileManager.get_dataset_metadata(dataset_id)
@@ -26,6 +26,8 @@ import json
 import subprocess
 from datetime import datetime
 
+from ..utils.file_manager import FileManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +44,12 @@ class SensitivityParameter:
 class MethodologyValidationService:
     """Service for publication-quality methodology validation."""
 
+    # Validation caches live in this subdirectory of the configured DATA_DIR
+    CACHE_SUBDIR = 'validation'
+
+    # Latest completed equivalence check, stored as a ready-to-serve JSON body
+    EQUIVALENCE_POINTER = '_equivalence_latest.json'
+
     # Default parameters for sensitivity analysis
     SENSITIVITY_PARAMETERS = [
         SensitivityParameter(
@@ -248,20 +256,13 @@ class MethodologyValidationService:
             return {'error': 'Dataset missing required columns (acwr, injury)'}
 
         # Define ACWR zones
-        def get_zone(acwr):
-            if pd.isna(acwr):
-                return 'Unknown'
-            elif acwr < 0.8:
-                return 'Undertrained'
-            elif acwr <= 1.3:
-                return 'Optimal'
-            elif acwr <= 1.5:
-                return 'Caution'
-            else:
-                return 'High Risk'
-
         df = df.copy()
-        df['acwr_zone'] = df['acwr'].apply(get_zone)
+        acwr = df['acwr'].to_numpy(dtype=np.float64)
+        df['acwr_zone'] = np.select(
+            [np.isnan(acwr), acwr < 0.8, acwr <= 1.3, acwr <= 1.5],
+            ['Unknown', 'Undertrained', 'Optimal', 'Caution'],
+            default='High Risk'
+        )
 
         # Calculate risk per load unit for each zone
         zone_stats = []
@@ -616,18 +617,36 @@ class MethodologyValidationService:
         with open(filepath, 'w') as f:
             json.dump(results, f, indent=2, default=str)
 
+        if validation_type == 'equivalence':
+            cls._write_equivalence_pointer(results)
+
+    @classmethod
+    def _write_equivalence_pointer(cls, results: Dict[str, Any]) -> None:
+        """
+        Record the latest equivalence result as the /methodology/equivalence body.
+
+        Written to a temporary file and moved into place, so readers never see
+        a partial file.
+        """
+        base = cls.get_cache_base()
+        os.makedirs(base, exist_ok=True)
+        body = json.dumps({**results, 'status': 'complete'}, default=str, sort_keys=True,
+                          separators=(',', ':'))
+        pointer = os.path.join(base, cls.EQUIVALENCE_POINTER)
+        FileManager.write_bytes_atomic(pointer, body.encode())
+
+    @classmethod
+    def get_equivalence_pointer_path(cls) -> str:
+        """Path of the latest-equivalence pointer file."""
+        return os.path.join(cls.get_cache_base(), cls.EQUIVALENCE_POINTER)
+
+    @classmethod
+    def get_cache_base(cls) -> str:
+        """Base directory of the validation caches, under the configured DATA_DIR."""
+        from flask import current_app
+        return os.path.join(current_app.config['DATA_DIR'], cls.CACHE_SUBDIR)
+
     @classmethod
     def _get_cache_dir(cls, dataset_id: str) -> str:
-        """Get the cache directory for methodology validation results."""
-        base_paths = [
-            '/data/validation',
-            '/home/rodrigues/injury-prediction/data/validation'
-        ]
-
-        for base in base_paths:
-            if os.path.exists(os.path.dirname(base)):
-                cache_dir = os.path.join(base, dataset_id, 'methodology')
-                os.makedirs(cache_dir, exist_ok=True)
-                return cache_dir
-
-        return os.path.join('/tmp', 'validation', dataset_id, 'methodology')
+        """Get the cache directory for methodology validation results (created when results are saved)."""
+        return os.path.join(cls.get_cache_base(), dataset_id, 'methodology')
@@ -96,39 +96,28 @@ class PreprocessingService:
         result_df['pre_injury'] = 0
         result_df['injury_state'] = 0
 
-        for athlete_id in result_df['athlete_id'].unique():
-            athlete_data = result_df[result_df['athlete_id'] == athlete_id].copy()
-            athlete_indices = athlete_data.index
-
-            injury_indices = []
-            for i in range(1, len(athlete_indices)):
-                prev_idx = athlete_indices[i-1]
-                curr_idx = athlete_indices[i]
-                if (result_df.loc[curr_idx, 'injury'] == 1 and
-                    result_df.loc[prev_idx, 'injury'] == 0):
-                    injury_indices.append(curr_idx)
-
-            if len(athlete_indices) > 0 and result_df.loc[athlete_indices[0], 'injury'] == 1:
-                injury_indices.append(athlete_indices[0])
-
-            result_df.loc[injury_indices, 'injury_onset'] = 1
-
-            for onset_idx in injury_indices:
-                onset_position = list(athlete_indices).index(onset_idx)
-                for i in range(1, prediction_window + 1):
-                    if onset_position - i >= 0:
-                        pre_injury_idx = athlete_indices[onset_position - i]
-                        if result_df.loc[pre_injury_idx, 'injury'] == 0:
-                            result_df.loc[pre_injury_idx, 'pre_injury'] = 1
-
-            recovery_indices = [idx for idx in athlete_indices
-                               if result_df.loc[idx, 'injury'] == 1
-                               and idx not in injury_indices]
-            result_df.loc[recovery_indices, 'recovery_day'] = 1
-
-            result_df.loc[result_df['injury_onset'] == 1, 'injury_state'] = 2
-            result_df.loc[(result_df['recovery_day'] == 1) & (result_df['injury_state'] == 0), 'injury_state'] = 3
-            result_df.loc[(result_df['pre_injury'] == 1) & (result_df['injury_state'] == 0), 'injury_state'] = 1
+        # Rows are now contiguous per athlete, so neighbouring days can be
+        # compared positionally instead of filtering the frame per athlete
+        athlete = result_df['athlete_id'].to_numpy()
+        injured = (result_df['injury'] == 1).to_numpy()
+        not_injured = (result_df['injury'] == 0).to_numpy()
+
+        # Onset: first injured day of a run (or an athlete's first day, if injured)
+        onset = injured.copy()
+        onset[1:] &= (athlete[1:] != athlete[:-1]) | not_injured[:-1]
+
+        # Pre-injury: uninjured days within prediction_window days before an onset
+        pre_injury = np.zeros(len(result_df), dtype=bool)
+        for days_before in range(1, prediction_window + 1):
+            pre_injury[:-days_before] |= onset[days_before:] & (athlete[:-days_before] == athlete[days_before:])
+        pre_injury &= not_injured
+
+        recovery_day = injured & ~onset
+
+        result_df['injury_onset'] = onset.astype(int)
+        result_df['recovery_day'] = recovery_day.astype(int)
+        result_df['pre_injury'] = pre_injury.astype(int)
+        result_df['injury_state'] = np.select([onset, recovery_day, pre_injury], [2, 3, 1], default=0)
 
         return result_df
 
@@ -139,14 +128,12 @@ class PreprocessingService:
         result_df['will_get_injured'] = 0
         result_df['time_to_injury'] = 29  # Max days
 
-        for athlete_id in result_df['athlete_id'].unique():
-            athlete_mask = result_df['athlete_id'] == athlete_id
-            athlete_data = result_df[athlete_mask].copy()
-
-            for i in range(len(athlete_data) - 1):
-                look_ahead = min(predict_window, len(athlete_data) - i - 1)
-                if athlete_data['injury_onset'].iloc[i+1:i+1+look_ahead].sum() > 0:
-                    result_df.loc[athlete_data.index[i], 'will_get_injured'] = 1
+        # An onset on any of the athlete's next predict_window days flags the row
+        onset_by_athlete = result_df.groupby('athlete_id', sort=False)['injury_onset']
+        will_get_injured = np.zeros(len(result_df), dtype=bool)
+        for days_ahead in range(1, predict_window + 1):
+            will_get_injured |= (onset_by_athlete.shift(-days_ahead) > 0).to_numpy()
+        result_df['will_get_injured'] = will_get_injured.astype(int)
 
         return result_df
 
@@ -2,10 +2,13 @@ import os
 import json
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
 import pandas as pd
 import numpy as np
+import orjson
 
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
@@ -22,6 +25,13 @@ from ..celery_app import celery_app
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _read_split_id(metadata_path: str) -> Optional[str]:
+    """split_id recorded in a model's metadata file; it never changes after training."""
+    with open(metadata_path, 'r') as f:
+        return json.load(f).get('split_id')
+
+
 class TrainingService:
     """Service for training ML models."""
 
@@ -37,6 +47,17 @@ class TrainingService:
         'lasso': {'C': 1.0, 'random_state': 42, 'max_iter': 1000}
     }
 
+    # Precomputed ROC/PR curve bodies live in this subdirectory of MODELS_DIR
+    CURVES_SUBDIR = 'curves'
+
+    # Scalar metrics ranked by compare_models, and the thread count for its metadata reads
+    COMPARISON_METRICS = ('roc_auc', 'average_precision', 'precision', 'recall', 'f1')
+    METADATA_READ_WORKERS = 8
+
+    # Test rows used for the global SHAP importances stored with each model
+    # (the default sample_size of the explainability endpoint)
+    GLOBAL_SHAP_SAMPLE_SIZE = 500
+
     @classmethod
     def get_model_types(cls):
         """Load and return model types and hyperparameters from config."""
@@ -435,7 +456,53 @@ class TrainingService:
         ]
 
     @classmethod
-    def _save_model(cls, model_id, model, model_type, params, metrics, feature_importance, split_id, feature_names):
+    def _compute_global_shap(cls, model, model_type, X_test, sample_size=GLOBAL_SHAP_SAMPLE_SIZE):
+        """
+        Mean absolute SHAP value per feature over a fixed sample of the test set.
+
+        Stored in the model metadata so the global explanation endpoint can be
+        served without loading the model or running SHAP. Returns None if SHAP
+        is unavailable or fails for this model.
+        """
+        try:
+            import shap
+
+            if len(X_test) > sample_size:
+                X_sample = X_test.sample(n=sample_size, random_state=42)
+            else:
+                X_sample = X_test
+
+            if model_type in ['xgboost', 'random_forest']:
+                explained = model.get_booster() if model_type == 'xgboost' else model
+                explainer = shap.TreeExplainer(
+                    explained, feature_perturbation='tree_path_dependent', model_output='raw'
+                )
+                # Trees split on float32 thresholds; float32 input halves the traversal's memory traffic
+                shap_values = explainer.shap_values(X_sample.to_numpy(dtype=np.float32))
+            else:
+                explainer = shap.LinearExplainer(model, X_sample)
+                shap_values = explainer.shap_values(X_sample)
+
+            # Binary classification: keep the positive class
+            if isinstance(shap_values, list):
+                shap_values = shap_values[1]
+            elif shap_values.ndim == 3:
+                shap_values = shap_values[..., 1]
+
+            mean_abs = np.abs(shap_values).mean(axis=0)
+        except Exception as e:
+            logger.warning(f"Could not precompute global SHAP values for {model_type}: {e}")
+            return None
+
+        return {
+            'sample_size': sample_size,
+            'feature_names': [str(c) for c in X_sample.columns],
+            'mean_abs_shap': mean_abs.tolist()
+        }
+
+    @classmethod
+    def _save_model(cls, model_id, model, model_type, params, metrics, feature_importance, split_id, feature_names,
+                    global_shap=None):
         """Save trained model and metadata."""
         from flask import current_app
         models_dir = current_app.config['MODELS_DIR']
@@ -461,6 +528,7 @@ class TrainingService:
             'split_id': split_id,
             'dataset_id': dataset_id,
             'feature_names': feature_names,
+            'global_shap': global_shap,
             'created_at': datetime.utcnow().isoformat(),
             'split_details': {
                 'strategy': split_metadata.get('split_strategy'),
@@ -496,8 +564,71 @@ class TrainingService:
         return None
 
     @classmethod
-    def get_roc_curve(cls, model_id: str, split_id: str) -> Optional[Dict[str, Any]]:
-        """Get ROC curve data for a model."""
+    def get_model_split_id(cls, model_id: str) -> Optional[str]:
+        """Get the split a model was trained on without returning its full metadata."""
+        from flask import current_app
+        metadata_path = os.path.join(current_app.config['MODELS_DIR'], f'{model_id}.json')
+        try:
+            return _read_split_id(metadata_path)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _roc_curve_data(y_true, y_score) -> Dict[str, Any]:
+        """ROC curve points; collinear points are dropped (sklearn's drop_intermediate)."""
+        fpr, tpr, thresholds = roc_curve(y_true, y_score, drop_intermediate=True)
+        return {
+            'fpr': fpr.tolist(),
+            'tpr': tpr.tolist(),
+            'thresholds': thresholds.tolist(),
+            'auc': float(roc_auc_score(y_true, y_score))
+        }
+
+    @staticmethod
+    def _pr_curve_data(y_true, y_score) -> Dict[str, Any]:
+        """PR curve points; thresholds that leave the plotted curve unchanged are dropped."""
+        precision, recall, thresholds = precision_recall_curve(y_true, y_score, drop_intermediate=True)
+        return {
+            'precision': precision.tolist(),
+            'recall': recall.tolist(),
+            'thresholds': thresholds.tolist(),
+            'average_precision': float(average_precision_score(y_true, y_score))
+        }
+
+    @classmethod
+    def get_curve_path(cls, model_id: str, split_id: str, kind: str) -> Optional[str]:
+        """Path of a precomputed 'roc' or 'pr' curve body for a model on a split (None if the IDs are unsafe)."""
+        from flask import current_app
+        from werkzeug.security import safe_join
+        curves_dir = os.path.join(current_app.config['MODELS_DIR'], cls.CURVES_SUBDIR)
+        if '/' in split_id:
+            return None
+        return safe_join(curves_dir, f'{model_id}__{split_id}_{kind}.json')
+
+    @classmethod
+    def _write_curve(cls, model_id: str, split_id: str, kind: str, curve: Dict[str, Any]) -> None:
+        """Store a curve as the JSON body served by the curve endpoints."""
+        curve_path = cls.get_curve_path(model_id, split_id, kind)
+        if curve_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(curve_path), exist_ok=True)
+            FileManager.write_bytes_atomic(curve_path, orjson.dumps(curve))
+        except OSError as e:
+            logger.warning(f"Could not store {kind} curve for {model_id}: {e}")
+
+    @classmethod
+    def _save_curves(cls, model_id: str, split_id: str, y_true, y_score) -> None:
+        """Precompute the ROC and PR curves of a freshly trained model."""
+        try:
+            cls._write_curve(model_id, split_id, 'roc', cls._roc_curve_data(y_true, y_score))
+            cls._write_curve(model_id, split_id, 'pr', cls._pr_curve_data(y_true, y_score))
+        except Exception as e:
+            logger.warning(f"Could not precompute curves for {model_id}: {e}")
+
+    @classmethod
+    def _test_predictions(cls, model_id: str, split_id: str):
+        """Load a model and its split's test set; return (y_test, positive-class probabilities)."""
         from flask import current_app
         models_dir = current_app.config['MODELS_DIR']
         processed_dir = current_app.config['PROCESSED_DATA_DIR']
@@ -507,7 +638,7 @@ class TrainingService:
             return None
 
         try:
-            model = joblib.load(model_path)
+            model = joblib.load(model_path, mmap_mode='r')
         except Exception as e:
             logger.error(f"Failed to load model from {model_path}: {e}")
             return None
@@ -522,79 +653,91 @@ class TrainingService:
             return None
 
         try:
-            y_pred_proba = model.predict_proba(X_test)[:, 1]
-            fpr, tpr, thresholds = roc_curve(y_test, y_pred_proba)
+            return y_test, model.predict_proba(X_test)[:, 1]
         except Exception as e:
-            logger.error(f"Failed to compute ROC curve: {e}")
+            logger.error(f"Failed to predict on {split_dir}: {e}")
             return None
 
-        return {
-            'fpr': fpr.tolist(),
-            'tpr': tpr.tolist(),
-            'thresholds': thresholds.tolist(),
-            'auc': float(roc_auc_score(y_test, y_pred_proba))
-        }
-
     @classmethod
-    def get_pr_curve(cls, model_id: str, split_id: str) -> Optional[Dict[str, Any]]:
-        """Get Precision-Recall curve data for a model."""
-        from flask import current_app
-        models_dir = current_app.config['MODELS_DIR']
-        processed_dir = current_app.config['PROCESSED_DATA_DIR']
-
-        model_path = os.path.join(models_dir, f'{model_id}.joblib')
-        if not os.path.exists(model_path):
+    def get_roc_curve(cls, model_id: str, split_id: str) -> Optional[Dict[str, Any]]:
+        """Get ROC curve data for a model, storing it for later requests."""
+        predictions = cls._test_predictions(model_id, split_id)
+        if predictions is None:
             return None
 
         try:
-            model = joblib.load(model_path)
+            curve = cls._roc_curve_data(*predictions)
         except Exception as e:
-            logger.error(f"Failed to load model from {model_path}: {e}")
+            logger.error(f"Failed to compute ROC curve: {e}")
             return None
 
-        # Load test data
-        split_dir = os.path.join(processed_dir, split_id)
-        try:
-            X_test = FileManager.read_df(os.path.join(split_dir, 'X_test'))
-            y_test = FileManager.read_df(os.path.join(split_dir, 'y_test')).values.ravel()
-        except Exception as e:
-            logger.error(f"Failed to load test data from {split_dir}: {e}")
+        cls._write_curve(model_id, split_id, 'roc', curve)
+        return curve
+
+    @classmethod
+    def get_pr_curve(cls, model_id: str, split_id: str) -> Optional[Dict[str, Any]]:
+        """Get Precision-Recall curve data for a model, storing it for later requests."""
+        predictions = cls._test_predictions(model_id, split_id)
+        if predictions is None:
             return None
 
         try:
-            y_pred_proba = model.predict_proba(X_test)[:, 1]
-            precision, recall, thresholds = precision_recall_curve(y_test, y_pred_proba)
+            curve = cls._pr_curve_data(*predictions)
         except Exception as e:
             logger.error(f"Failed to compute PR curve: {e}")
             return None
 
-        return {
-            'precision': precision.tolist(),
-            'recall': recall.tolist(),
-            'thresholds': thresholds.tolist(),
-            'average_precision': float(average_precision_score(y_test, y_pred_proba))
-        }
+        cls._write_curve(model_id, split_id, 'pr', curve)
+        return curve
 
     @classmethod
-    def compare_models(cls, model_ids: List[str]) -> Dict[str, Any]:
-        """Compare multiple models."""
+    def load_metrics_bulk(cls, model_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Read the registry entries of several models concurrently (None for unknown models)."""
         from flask import current_app
         models_dir = current_app.config['MODELS_DIR']
-        comparison = []
-
-        for model_id in model_ids:
-            metadata_path = os.path.join(models_dir, f'{model_id}.json')
-            if os.path.exists(metadata_path):
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-                    comparison.append({
-                        'model_id': model_id,
-                        'model_type': metadata.get('model_type'),
-                        'model_name': metadata.get('model_name'),
-                        'dataset_id': metadata.get('dataset_id'),
-                        'split_id': metadata.get('split_id'),
-                        'metrics': metadata.get('metrics'),
-                        'created_at': metadata.get('created_at')
-                    })
-
-        return {'models': comparison}
\ No newline at end of file
+
+        def read_metadata(model_id):
+            try:
+                with open(os.path.join(models_dir, f'{model_id}.json'), 'rb') as f:
+                    return json.load(f)
+            except FileNotFoundError:
+                return None
+
+        if not model_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(cls.METADATA_READ_WORKERS, len(model_ids))) as pool:
+            return list(pool.map(read_metadata, model_ids))
+
+    @classmethod
+    def compare_models(cls, model_ids: List[str]) -> Dict[str, Any]:
+        """Compare multiple models."""
+        comparison = [
+            {
+                'model_id': model_id,
+                'model_type': metadata.get('model_type'),
+                'model_name': metadata.get('model_name'),
+                'dataset_id': metadata.get('dataset_id'),
+                'split_id': metadata.get('split_id'),
+                'metrics': metadata.get('metrics'),
+                'created_at': metadata.get('created_at')
+            }
+            for model_id, metadata in zip(model_ids, cls.load_metrics_bulk(model_ids))
+            if metadata is not None
+        ]
+
+        # Rank every scalar metric across models in one pass (higher is better)
+        scores = pd.DataFrame(
+            [m['metrics'] or {} for m in comparison],
+            index=[m['model_id'] for m in comparison],
+            columns=list(cls.COMPARISON_METRICS)
+        ).apply(pd.to_numeric, errors='coerce').dropna(axis=1, how='all')
+        rankings = scores.rank(ascending=False, method='min')
+
+        return {
+            'models': comparison,
+            'best_by': scores.idxmax().to_dict(),
+            'rankings': {
+                metric: {model_id: int(rank) for model_id, rank in ranks.dropna().items()}
+                for metric, ranks in rankings.items()
+            }
+        }
\ No newline at end of file
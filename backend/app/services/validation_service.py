@@ -7,18 +7,36 @@ calculate distribution alignment, and run transfer learning experiments.
 
 import os
 import glob
+import hashlib
 import logging
+import threading
+import time
 import pandas as pd
 import numpy as np
 from scipy import stats
-from scipy.spatial.distance import jensenshannon
-from typing import Dict, List, Any, Optional
+from scipy.special import rel_entr
+from typing import Dict, List, Any, Optional, Tuple
 
 from .pm_adapter import PMDataAdapter
 from .training_service import TrainingService
+from ..utils.file_manager import FileManager
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for the data availability probes behind /status
+AVAILABILITY_CACHE_TTL = 5.0
+_availability_cache = {}
+_availability_cache_lock = threading.Lock()
+
+# Files PMDataAdapter reads, relative to the PMData root
+PMDATA_INPUT_GLOBS = (
+    ('*', 'pmsys', 'wellness.csv'),
+    ('*', 'pmsys', 'injury.csv'),
+    ('*', 'pmsys', 'srpe.csv'),
+    ('p*', 'fitbit', 'very_active_minutes.json'),
+    ('p*', 'fitbit', 'moderately_active_minutes.json'),
+)
+
 
 class ValidationService:
     """Service for Sim2Real validation experiments."""
@@ -67,6 +85,67 @@ class ValidationService:
         datasets = sorted(glob.glob(os.path.join(raw_path, 'dataset_*')))
         return datasets[-1] if datasets else None
 
+    @classmethod
+    def _cached_probe(cls, name: str, probe) -> bool:
+        """Return probe(), reusing the result for AVAILABILITY_CACHE_TTL seconds."""
+        now = time.monotonic()
+        with _availability_cache_lock:
+            entry = _availability_cache.get(name)
+            if entry is not None and now < entry[1]:
+                return entry[0]
+        value = probe()
+        with _availability_cache_lock:
+            _availability_cache[name] = (value, now + AVAILABILITY_CACHE_TTL)
+        return value
+
+    @classmethod
+    def synthetic_available(cls) -> bool:
+        """Whether a synthetic daily_data file exists, without loading it (may be up to 5 s stale)."""
+        def probe():
+            synth_path = cls.get_synthetic_path()
+            return bool(synth_path) and (
+                os.path.exists(os.path.join(synth_path, 'daily_data.parquet'))
+                or os.path.exists(os.path.join(synth_path, 'daily_data.csv'))
+            )
+        return cls._cached_probe('synthetic', probe)
+
+    @classmethod
+    def pmdata_available(cls) -> bool:
+        """Whether the PMData directory exists, without loading it (may be up to 5 s stale)."""
+        return cls._cached_probe('pmdata', lambda: os.path.exists(cls.get_pmdata_path()))
+
+    @classmethod
+    def data_revision(cls) -> tuple:
+        """
+        Identity of the default synthetic dataset and PMData files (paths, sizes, mtimes).
+
+        Changes whenever either input is regenerated, replaced or edited, so it
+        can key caches of analyses computed from load_synthetic()/load_pmdata().
+        """
+        synthetic = None
+        synth_path = cls.get_synthetic_path()
+        if synth_path:
+            for name in ('daily_data.parquet', 'daily_data.csv'):
+                try:
+                    st = os.stat(os.path.join(synth_path, name))
+                except FileNotFoundError:
+                    continue
+                synthetic = (synth_path, name, st.st_size, st.st_mtime_ns)
+                break
+
+        # Only the files PMDataAdapter reads, not the whole (large) PMData tree
+        pmdata = []
+        pmdata_path = cls.get_pmdata_path()
+        for pattern in PMDATA_INPUT_GLOBS:
+            for path in sorted(glob.glob(os.path.join(pmdata_path, *pattern))):
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                pmdata.append((path, st.st_size, st.st_mtime_ns))
+
+        return synthetic, tuple(pmdata)
+
     @classmethod
     def load_pmdata(cls) -> Optional[pd.DataFrame]:
         """Load and standardize PMData."""
@@ -123,23 +202,83 @@ class ValidationService:
     @classmethod
     def calculate_js_divergence(cls, arr1: np.ndarray, arr2: np.ndarray, bins: int = 50) -> float:
         """Calculate Jensen-Shannon divergence between two arrays."""
-        # Create histograms with same bins
-        min_val = min(arr1.min(), arr2.min())
-        max_val = max(arr1.max(), arr2.max())
-        bins_edges = np.linspace(min_val, max_val, bins + 1)
+        return float(cls.calculate_js_divergences([(arr1, arr2)], bins)[0])
+
+    @classmethod
+    def calculate_js_divergences(cls, pairs: List[Tuple[np.ndarray, np.ndarray]],
+                                 bins: int = 50) -> np.ndarray:
+        """
+        Jensen-Shannon divergence for several (synthetic, real) array pairs.
+
+        Each pair is binned on its own shared range; the divergence is then
+        evaluated for all pairs at once on the stacked histograms.
+        """
+        hist1 = np.empty((len(pairs), bins))
+        hist2 = np.empty((len(pairs), bins))
+        for i, (arr1, arr2) in enumerate(pairs):
+            # Create histograms with same bins
+            min_val = min(arr1.min(), arr2.min())
+            max_val = max(arr1.max(), arr2.max())
+            bins_edges = np.linspace(min_val, max_val, bins + 1)
 
-        hist1, _ = np.histogram(arr1, bins=bins_edges, density=True)
-        hist2, _ = np.histogram(arr2, bins=bins_edges, density=True)
+            hist1[i], _ = np.histogram(arr1, bins=bins_edges, density=True)
+            hist2[i], _ = np.histogram(arr2, bins=bins_edges, density=True)
 
         # Add small epsilon to avoid division by zero
-        hist1 = hist1 + 1e-10
-        hist2 = hist2 + 1e-10
+        hist1 += 1e-10
+        hist2 += 1e-10
 
         # Normalize
-        hist1 = hist1 / hist1.sum()
-        hist2 = hist2 / hist2.sum()
+        hist1 /= hist1.sum(axis=1, keepdims=True)
+        hist2 /= hist2.sum(axis=1, keepdims=True)
 
-        return float(jensenshannon(hist1, hist2))
+        # Row-wise equivalent of scipy.spatial.distance.jensenshannon
+        mid = (hist1 + hist2) / 2.0
+        js = rel_entr(hist1, mid).sum(axis=1) + rel_entr(hist2, mid).sum(axis=1)
+        return np.sqrt(js / 2.0)
+
+    @classmethod
+    def _compare_feature_distributions(cls, df_synth: pd.DataFrame, df_real: pd.DataFrame,
+                                       features: List[str]) -> Dict[str, Any]:
+        """Per-feature JS divergence, summary stats and chart histograms."""
+        results = {}
+        values = {}
+        for feat in features:
+            if feat not in df_synth.columns or feat not in df_real.columns:
+                results[feat] = {'error': 'Column missing'}
+                continue
+            values[feat] = (df_synth[feat].dropna().values, df_real[feat].dropna().values)
+
+        js_divs = cls.calculate_js_divergences(list(values.values()))
+
+        # Histogram data for charts: 20 bins from 0 to 1
+        bins = np.linspace(0, 1, 21)
+        for (feat, (synth_vals, real_vals)), js_div in zip(values.items(), js_divs.tolist()):
+            synth_hist, _ = np.histogram(synth_vals, bins=bins, density=True)
+            real_hist, _ = np.histogram(real_vals, bins=bins, density=True)
+
+            results[feat] = {
+                'js_divergence': round(js_div, 4),
+                'status': 'PASS' if js_div < 0.1 else 'WARNING' if js_div < 0.3 else 'FAIL',
+                'synthetic': {
+                    'mean': round(float(synth_vals.mean()), 4),
+                    'std': round(float(synth_vals.std()), 4),
+                    'min': round(float(synth_vals.min()), 4),
+                    'max': round(float(synth_vals.max()), 4),
+                    'histogram': synth_hist.tolist()
+                },
+                'real': {
+                    'mean': round(float(real_vals.mean()), 4),
+                    'std': round(float(real_vals.std()), 4),
+                    'min': round(float(real_vals.min()), 4),
+                    'max': round(float(real_vals.max()), 4),
+                    'histogram': real_hist.tolist()
+                },
+                'bins': bins.tolist()
+            }
+
+        # Keep the requested feature order
+        return {feat: results[feat] for feat in features}
 
     @classmethod
     def get_distribution_comparison(cls) -> Dict[str, Any]:
@@ -169,40 +308,7 @@ class ValidationService:
             'features': {}
         }
 
-        for feat in features:
-            if feat not in df_synth.columns or feat not in df_real.columns:
-                results['features'][feat] = {'error': 'Column missing'}
-                continue
-
-            synth_vals = df_synth[feat].dropna().values
-            real_vals = df_real[feat].dropna().values
-
-            js_div = cls.calculate_js_divergence(synth_vals, real_vals)
-
-            # Create histogram data for charts
-            bins = np.linspace(0, 1, 21)  # 20 bins from 0 to 1
-            synth_hist, _ = np.histogram(synth_vals, bins=bins, density=True)
-            real_hist, _ = np.histogram(real_vals, bins=bins, density=True)
-
-            results['features'][feat] = {
-                'js_divergence': round(js_div, 4),
-                'status': 'PASS' if js_div < 0.1 else 'WARNING' if js_div < 0.3 else 'FAIL',
-                'synthetic': {
-                    'mean': round(float(synth_vals.mean()), 4),
-                    'std': round(float(synth_vals.std()), 4),
-                    'min': round(float(synth_vals.min()), 4),
-                    'max': round(float(synth_vals.max()), 4),
-                    'histogram': synth_hist.tolist()
-                },
-                'real': {
-                    'mean': round(float(real_vals.mean()), 4),
-                    'std': round(float(real_vals.std()), 4),
-                    'min': round(float(real_vals.min()), 4),
-                    'max': round(float(real_vals.max()), 4),
-                    'histogram': real_hist.tolist()
-                },
-                'bins': bins.tolist()
-            }
+        results['features'] = cls._compare_feature_distributions(df_synth, df_real, features)
 
         # Add load feature statistics from PMData (not compared with synthetic yet)
         results['load_features'] = {}
@@ -220,23 +326,17 @@ class ValidationService:
 
         # Add ACWR zone analysis
         if 'acwr' in df_real.columns and 'will_get_injured' in df_real.columns:
-            def get_zone(x):
-                if pd.isna(x):
-                    return 'unknown'
-                elif x < 0.8:
-                    return 'undertrained (<0.8)'
-                elif x < 1.3:
-                    return 'optimal (0.8-1.3)'
-                elif x < 1.5:
-                    return 'danger (1.3-1.5)'
-                else:
-                    return 'high risk (>1.5)'
-
-            df_real['acwr_zone'] = df_real['acwr'].apply(get_zone)
-            zone_stats = df_real.groupby('acwr_zone')['will_get_injured'].agg(['mean', 'count'])
+            # Zone codes from the boundaries; rows without an ACWR get no zone
+            acwr = df_real['acwr'].to_numpy(dtype=np.float64)
+            zone_codes = np.where(np.isnan(acwr), -1, np.searchsorted([0.8, 1.3, 1.5], acwr, side='right'))
+            df_real['acwr_zone'] = pd.Categorical.from_codes(
+                zone_codes,
+                categories=['undertrained (<0.8)', 'optimal (0.8-1.3)', 'danger (1.3-1.5)', 'high risk (>1.5)']
+            )
+            zone_stats = df_real.groupby('acwr_zone', observed=True)['will_get_injured'].agg(['mean', 'count'])
             results['acwr_zones'] = {
                 zone: {'injury_rate': round(float(row['mean']), 4), 'count': int(row['count'])}
-                for zone, row in zone_stats.iterrows() if zone != 'unknown'
+                for zone, row in zone_stats.iterrows()
             }
 
         return results
@@ -775,6 +875,13 @@ class ValidationService:
                 return path
         return possible_paths[0]
 
+    # Per-section result files of a validation run, in response order
+    RESULT_FILES = ['summary.json', 'distributions.json', 'sim2real.json',
+                    'pmdata_analysis.json', 'causal_mechanism.json', 'three_pillars.json']
+
+    # Combined response body for GET /results/<dataset_id>
+    RESULTS_BUNDLE = 'results.json'
+
     @classmethod
     def get_cached_results(cls, dataset_id: str) -> Optional[Dict[str, Any]]:
         """Load cached validation results for a dataset."""
@@ -787,10 +894,8 @@ class ValidationService:
 
         try:
             results = {'dataset_id': dataset_id}
-            files = ['summary.json', 'distributions.json', 'sim2real.json',
-                     'pmdata_analysis.json', 'causal_mechanism.json', 'three_pillars.json']
 
-            for filename in files:
+            for filename in cls.RESULT_FILES:
                 filepath = os.path.join(cache_dir, filename)
                 if os.path.exists(filepath):
                     with open(filepath, 'r') as f:
@@ -802,6 +907,77 @@ class ValidationService:
             logger.error(f"Error loading cached results: {e}")
             return None
 
+    @classmethod
+    def get_cached_results_path(cls, dataset_id: str) -> Optional[str]:
+        """
+        Path of the combined cached-results body for a dataset, or None if not cached.
+
+        The bundle is (re)built from the per-section files whenever it is
+        missing or older than any of them, so it can be served without parsing.
+        """
+        cache_dir = os.path.join(cls.get_validation_cache_dir(), dataset_id)
+        bundle_path = os.path.join(cache_dir, cls.RESULTS_BUNDLE)
+
+        section_mtimes = []
+        for filename in cls.RESULT_FILES:
+            try:
+                section_mtimes.append(os.stat(os.path.join(cache_dir, filename)).st_mtime_ns)
+            except FileNotFoundError:
+                if filename == 'summary.json':
+                    return None
+
+        try:
+            if os.stat(bundle_path).st_mtime_ns >= max(section_mtimes):
+                return bundle_path
+        except FileNotFoundError:
+            pass
+
+        return cls.write_results_bundle(dataset_id)
+
+    @classmethod
+    def write_results_bundle(cls, dataset_id: str) -> Optional[str]:
+        """Write the combined cached-results body for a dataset and return its path."""
+        import orjson
+        results = cls.get_cached_results(dataset_id)
+        if not results:
+            return None
+
+        results['cached'] = True
+        bundle_path = os.path.join(cls.get_validation_cache_dir(), dataset_id, cls.RESULTS_BUNDLE)
+        FileManager.write_bytes_atomic(
+            bundle_path, orjson.dumps(results, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        )
+        return bundle_path
+
+    # Results of the default-dataset analyses run as background jobs (/sim2real, /pmdata-analysis)
+    ANALYSIS_CACHE_SUBDIR = '_default'
+
+    @classmethod
+    def get_analysis_result_path(cls, name: str) -> str:
+        """Path of a stored analysis result for the current data revision."""
+        revision = hashlib.sha1(repr(cls.data_revision()).encode()).hexdigest()[:16]
+        return os.path.join(cls.get_validation_cache_dir(), cls.ANALYSIS_CACHE_SUBDIR, f'{name}_{revision}.json')
+
+    @classmethod
+    def store_analysis_result(cls, result_path: str, result: Dict[str, Any]) -> None:
+        """Write an analysis result body, replacing those stored for earlier data revisions."""
+        import orjson
+        from ..utils.json_provider import OrjsonProvider
+        result_dir = os.path.dirname(result_path)
+        os.makedirs(result_dir, exist_ok=True)
+
+        name = os.path.basename(result_path).rsplit('_', 1)[0]
+        for stale_path in glob.glob(os.path.join(result_dir, f'{name}_*.json')):
+            if stale_path != result_path:
+                try:
+                    os.remove(stale_path)
+                except FileNotFoundError:
+                    pass  # removed by a concurrent writer
+
+        FileManager.write_bytes_atomic(
+            result_path, orjson.dumps(result, default=OrjsonProvider.default, option=OrjsonProvider.option)
+        )
+
     @classmethod
     def list_cached_validations(cls) -> List[Dict[str, Any]]:
         """List all datasets with cached validation results."""
@@ -948,40 +1124,7 @@ class ValidationService:
             'features': {}
         }
 
-        for feat in wellness_features:
-            if feat not in df_synth.columns or feat not in df_real.columns:
-                results['features'][feat] = {'error': 'Column missing'}
-                continue
-
-            synth_vals = df_synth[feat].dropna().values
-            real_vals = df_real[feat].dropna().values
-
-            js_div = cls.calculate_js_divergence(synth_vals, real_vals)
-
-            # Create histogram data for charts
-            bins = np.linspace(0, 1, 21)
-            synth_hist, _ = np.histogram(synth_vals, bins=bins, density=True)
-            real_hist, _ = np.histogram(real_vals, bins=bins, density=True)
-
-            results['features'][feat] = {
-                'js_divergence': round(js_div, 4),
-                'status': 'PASS' if js_div < 0.1 else 'WARNING' if js_div < 0.3 else 'FAIL',
-                'synthetic': {
-                    'mean': round(float(synth_vals.mean()), 4),
-                    'std': round(float(synth_vals.std()), 4),
-                    'min': round(float(synth_vals.min()), 4),
-                    'max': round(float(synth_vals.max()), 4),
-                    'histogram': synth_hist.tolist()
-                },
-                'real': {
-                    'mean': round(float(real_vals.mean()), 4),
-                    'std': round(float(real_vals.std()), 4),
-                    'min': round(float(real_vals.min()), 4),
-                    'max': round(float(real_vals.max()), 4),
-                    'histogram': real_hist.tolist()
-                },
-                'bins': bins.tolist()
-            }
+        results['features'] = cls._compare_feature_distributions(df_synth, df_real, wellness_features)
 
         return results
 
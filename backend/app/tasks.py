@@ -343,7 +343,9 @@ def train_models_task(job_id: str, split_id: str, model_types: List[str], hyperp
                 metrics = TrainingService._calculate_metrics(y_test, y_pred, y_pred_proba)
                 feature_importance = TrainingService._get_feature_importance(model, X_train.columns, model_type)
                 model_id = f"model_{model_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:4]}"
-                TrainingService._save_model(model_id, model, model_type, params, metrics, feature_importance, split_id, X_test.columns.tolist())
+                global_shap = TrainingService._compute_global_shap(model, model_type, X_test)
+                TrainingService._save_model(model_id, model, model_type, params, metrics, feature_importance, split_id, X_test.columns.tolist(), global_shap)
+                TrainingService._save_curves(model_id, split_id, y_test, y_pred_proba)
                 trained_models.append({'model_id': model_id, 'model_type': model_type, 'metrics': metrics})
             ProgressTracker.complete_job(job_id, result={'models': trained_models})
         except Exception as e:
@@ -446,6 +448,7 @@ def run_validation_task(job_id: str, dataset_id: str):
                 'avg_js_divergence': _calculate_avg_js(distributions),
             }
             _save_validation_result(validation_dir, 'summary.json', summary)
+            ValidationService.write_results_bundle(dataset_id)
 
             ProgressTracker.complete_job(job_id, result={
                 'dataset_id': dataset_id,
@@ -458,6 +461,45 @@ def run_validation_task(job_id: str, dataset_id: str):
             ProgressTracker.fail_job(job_id, f"{str(e)}\n{traceback.format_exc()}")
 
 
+@celery_app.task(name='run_sim2real')
+def run_sim2real_task(job_id: str):
+    """Celery task for the Sim2Real experiment on the default synthetic dataset and PMData."""
+    _run_default_analysis(job_id, 'sim2real', 'Running Sim2Real transfer experiment...',
+                          lambda service: service.run_sim2real_experiment())
+
+
+@celery_app.task(name='run_pmdata_analysis')
+def run_pmdata_analysis_task(job_id: str):
+    """Celery task for the PMData injury pattern analysis."""
+    _run_default_analysis(job_id, 'pmdata_analysis', 'Analyzing PMData patterns...',
+                          lambda service: service.get_pmdata_analysis())
+
+
+def _run_default_analysis(job_id: str, name: str, message: str, analysis):
+    """Run a default-dataset analysis and store its result for the matching GET endpoint."""
+    from app import create_app
+    from .services.validation_service import ValidationService
+    app = create_app()
+    with app.app_context():
+        try:
+            ProgressTracker.start_job(job_id, total_steps=100)
+            # Key the result on the data revision the analysis starts from
+            result_path = ValidationService.get_analysis_result_path(name)
+            ProgressTracker.update_progress(job_id, 10, message)
+
+            result = analysis(ValidationService)
+            if 'error' in result:
+                ProgressTracker.fail_job(job_id, result['error'])
+                return
+
+            ValidationService.store_analysis_result(result_path, result)
+            ProgressTracker.complete_job(job_id, result=result)
+
+        except Exception as e:
+            import traceback
+            ProgressTracker.fail_job(job_id, f"{str(e)}\n{traceback.format_exc()}")
+
+
 def _save_validation_result(validation_dir: str, filename: str, data: dict):
     """Save validation result to JSON file."""
     filepath = os.path.join(validation_dir, filename)
@@ -616,4 +658,26 @@ def run_scientific_validation_task(job_id: str, dataset_id: str, tasks: List[str
 
         except Exception as e:
             import traceback
-            ProgressTracker.fail_job(job_id, f"{str(e)}\n{traceback.format_exc()}")
\ No newline at end of file
+            ProgressTracker.fail_job(job_id, f"{str(e)}\n{traceback.format_exc()}")
+
+@celery_app.task(name='explain_global')
+def explain_global_task(job_id: str, model_id: str, sample_size: int = 500):
+    """Celery task computing a model's global SHAP explanation off the request thread."""
+    from app import create_app
+    from .api.routes.explainability import compute_global_explanation
+    app = create_app()
+    with app.app_context():
+        try:
+            ProgressTracker.start_job(job_id, total_steps=100)
+            ProgressTracker.update_progress(job_id, 10, 'Computing SHAP values...', model_id=model_id)
+
+            result, status = compute_global_explanation(model_id, sample_size)
+            if status != 200:
+                ProgressTracker.fail_job(job_id, result.get('error', 'Explanation failed'))
+                return
+
+            ProgressTracker.complete_job(job_id, result=result)
+
+        except Exception as e:
+            import traceback
+            ProgressTracker.fail_job(job_id, f"{str(e)}\n{traceback.format_exc()}")
@@ -1,15 +1,22 @@
 import os
 import json
 import shutil
+import tempfile
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import pandas as pd
+import pyarrow.parquet as pq
 from flask import current_app
 
 
 class FileManager:
     """Manage data files and metadata."""
 
+    # Rows per Parquet row group for tables stored athlete by athlete. Small
+    # enough that reads filtered on athlete_id can skip most row groups using
+    # their min/max statistics.
+    ATHLETE_ROW_GROUP_SIZE = 16384
+
     @staticmethod
     def get_data_dir() -> str:
         return current_app.config['DATA_DIR']
@@ -89,28 +96,60 @@ class FileManager:
         return False
 
     @classmethod
-    def save_df(cls, df: pd.DataFrame, path: str, index: bool = False):
-        """Save a DataFrame to a file (prefer Parquet)."""
+    def save_df(cls, df: pd.DataFrame, path: str, index: bool = False, **kwargs):
+        """Save a DataFrame to a file (prefer Parquet); extra options go to the Parquet writer."""
         if path.endswith('.csv'):
             df.to_csv(path, index=index)
         else:
             # Ensure path ends with .parquet if not specified
             if not path.endswith('.parquet'):
                 path += '.parquet'
-            df.to_parquet(path, index=index)
+            df.to_parquet(path, index=index, **kwargs)
+
+    @classmethod
+    def write_bytes_atomic(cls, path: str, data: bytes):
+        """
+        Write a file through a uniquely named temporary file in the same directory.
+
+        Readers never see a partial file, and concurrent writers of the same path
+        (threads or processes) each publish a complete copy.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
     @classmethod
-    def read_df(cls, path: str, **kwargs) -> pd.DataFrame:
-        """Read a DataFrame from a file (CSV or Parquet)."""
+    def read_df(cls, path: str, columns: Optional[List[str]] = None, **kwargs) -> pd.DataFrame:
+        """Read a DataFrame from a file (CSV or Parquet), optionally only the given columns."""
         if path.endswith('.parquet') or os.path.exists(path + '.parquet'):
             full_path = path if path.endswith('.parquet') else path + '.parquet'
-            return pd.read_parquet(full_path, **kwargs)
+            return pd.read_parquet(full_path, columns=columns, **kwargs)
         elif path.endswith('.csv') or os.path.exists(path + '.csv'):
             full_path = path if path.endswith('.csv') else path + '.csv'
-            return pd.read_csv(full_path, **kwargs)
+            return pd.read_csv(full_path, usecols=columns, **kwargs)
         else:
             raise FileNotFoundError(f"Could not find data file at {path}")
 
+    @classmethod
+    def read_df_schema(cls, path: str) -> pd.DataFrame:
+        """Return an empty DataFrame with a file's columns and dtypes.
+
+        Parquet schemas come from the file footer; CSV files have to be parsed.
+        """
+        if path.endswith('.parquet') or os.path.exists(path + '.parquet'):
+            full_path = path if path.endswith('.parquet') else path + '.parquet'
+            return pq.read_schema(full_path).empty_table().to_pandas()
+        return cls.read_df(path).iloc[:0]
+
     @classmethod
     def get_dataset_summary(cls, dataset_id: str) -> Optional[Dict[str, Any]]:
         """Get summary statistics for a dataset."""
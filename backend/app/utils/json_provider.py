@@ -0,0 +1,51 @@
+from typing import Any
+
+import numpy as np
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Serializes NumPy arrays and scalars natively, so route handlers can return
+    large SHAP/analytics payloads without converting them to Python lists first.
+    Datetimes are passed through to Flask's default handler to keep the
+    existing HTTP-date format. NaN/Infinity are emitted as null.
+    """
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    @staticmethod
+    def default(obj: Any) -> Any:
+        # NumPy types orjson cannot handle natively (object/float16 arrays, etc.)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        # pandas Series/Index and other array-likes
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        # Pydantic error details: raw JSON input and validator exceptions
+        if isinstance(obj, (bytes, bytearray)):
+            return obj.decode('utf-8', 'replace')
+        if isinstance(obj, Exception):
+            return str(obj)
+        return DefaultJSONProvider.default(obj)
+
+    def _options(self) -> int:
+        return self.option | orjson.OPT_SORT_KEYS if self.sort_keys else self.option
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=self._options())
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
@@ -2,13 +2,32 @@ import uuid
 import json
 import os
 import logging
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 import redis
 import numpy as np
+import orjson
+
+from .json_provider import OrjsonProvider
 
 logger = logging.getLogger(__name__)
 
+# Jobs (and their entries in the per-type listing indexes) live for 24 hours
+JOB_TTL = 86400
+
+# Job reads are reused for a short time so that clients polling the same job
+# share one Redis GET. Writes made through this process drop the entry at once;
+# writes from other processes (Celery workers) show up within the TTL.
+JOB_CACHE_TTL = 0.25
+JOB_CACHE_SIZE = 4096
+_job_cache = {}
+_job_cache_lock = threading.Lock()
+
+# Set once this process has made sure pre-index jobs are indexed
+_indexes_backfilled = False
+
 
 def numpy_to_python(obj: Any) -> Any:
     """
@@ -47,6 +66,17 @@ def numpy_to_python(obj: Any) -> Any:
     return obj
 
 
+def _to_json(obj: Any) -> str:
+    """Encode job data for Redis, letting orjson serialize NumPy values natively."""
+    try:
+        return orjson.dumps(
+            obj, default=OrjsonProvider.default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except orjson.JSONEncodeError:
+        # Dict keys orjson cannot encode (NumPy scalars, tuples) are stringified by the walker
+        return json.dumps(numpy_to_python(obj))
+
+
 class ProgressTracker:
     """Redis-backed job progress tracking with atomic operations."""
 
@@ -131,9 +161,23 @@ class ProgressTracker:
             'error': None,
             'data': {}
         }
-        cls._get_client().set(f"job:{job_id}", json.dumps(job_data), ex=86400) # Expire in 24h
+        # Store the job, register it in its type's listing index and trim index
+        # entries older than the job TTL, whose job keys have expired
+        created = time.time()
+        index_key = cls._index_key(job_type)
+        pipe = cls._get_client().pipeline()
+        pipe.set(f"job:{job_id}", json.dumps(job_data), ex=JOB_TTL)
+        pipe.zadd(index_key, {job_id: created})
+        pipe.zremrangebyscore(index_key, '-inf', created - JOB_TTL)
+        pipe.execute()
+        cls.notify_update(job_id)
         return job_id
 
+    @staticmethod
+    def _index_key(job_type: str) -> str:
+        """Sorted set of a job type's IDs scored by creation time."""
+        return f"jobs:index:{job_type}"
+
     @classmethod
     def start_job(cls, job_id: str, total_steps: int = 100) -> bool:
         """Mark a job as started. Returns True if successful, False if job not found."""
@@ -150,6 +194,7 @@ class ProgressTracker:
                 'null'                              # result
             ]
         )
+        cls.notify_update(job_id)
         if result is None:
             logger.warning(f"Attempted to start non-existent job: {job_id}")
             return False
@@ -159,12 +204,13 @@ class ProgressTracker:
     def update_progress(cls, job_id: str, progress: int, current_step: str = '', **kwargs) -> bool:
         """Update job progress atomically. Returns True if successful, False if job not found."""
         cls._get_client()  # Ensure scripts are registered
-        # Convert NumPy types to native Python types for JSON serialization
-        extra_data = json.dumps(numpy_to_python(kwargs)) if kwargs else '{}'
+        # NumPy values are serialized directly, without a conversion pass
+        extra_data = _to_json(kwargs) if kwargs else '{}'
         result = cls._scripts['update_progress'](
             keys=[f"job:{job_id}"],
             args=[str(progress), current_step, extra_data]
         )
+        cls.notify_update(job_id)
         if result is None:
             logger.warning(f"Attempted to update progress for non-existent job: {job_id}")
             return False
@@ -174,8 +220,8 @@ class ProgressTracker:
     def complete_job(cls, job_id: str, result: Any = None) -> bool:
         """Mark a job as completed atomically. Returns True if successful, False if job not found."""
         cls._get_client()  # Ensure scripts are registered
-        # Convert NumPy types to native Python types for JSON serialization
-        result_json = json.dumps(numpy_to_python(result)) if result is not None else 'null'
+        # NumPy values are serialized directly, without a conversion pass
+        result_json = _to_json(result) if result is not None else 'null'
         script_result = cls._scripts['update_status'](
             keys=[f"job:{job_id}"],
             args=[
@@ -188,6 +234,7 @@ class ProgressTracker:
                 result_json                         # result
             ]
         )
+        cls.notify_update(job_id)
         if script_result is None:
             logger.warning(f"Attempted to complete non-existent job: {job_id}")
             return False
@@ -209,6 +256,7 @@ class ProgressTracker:
                 'null'                              # result
             ]
         )
+        cls.notify_update(job_id)
         if result is None:
             logger.warning(f"Attempted to fail non-existent job: {job_id}")
             return False
@@ -230,6 +278,7 @@ class ProgressTracker:
                 'null'                              # result
             ]
         )
+        cls.notify_update(job_id)
         if result is None:
             logger.warning(f"Attempted to cancel non-existent job: {job_id}")
             return False
@@ -237,23 +286,101 @@ class ProgressTracker:
 
     @classmethod
     def get_job(cls, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job status and details."""
-        data = cls._get_client().get(f"job:{job_id}")
+        """Get job status and details (may be up to JOB_CACHE_TTL seconds stale)."""
+        now = time.monotonic()
+        with _job_cache_lock:
+            entry = _job_cache.get(job_id)
+        if entry is not None and now < entry[1]:
+            data = entry[0]
+        else:
+            data = cls._get_client().get(f"job:{job_id}")
+            with _job_cache_lock:
+                if len(_job_cache) >= JOB_CACHE_SIZE:
+                    for key in [k for k, (_, expires) in _job_cache.items() if expires <= now]:
+                        del _job_cache[key]
+                    if len(_job_cache) >= JOB_CACHE_SIZE:
+                        _job_cache.clear()
+                _job_cache[job_id] = (data, now + JOB_CACHE_TTL)
         return json.loads(data) if data else None
 
+    @staticmethod
+    def notify_update(job_id: str) -> None:
+        """Drop a job's cached read after it changes."""
+        with _job_cache_lock:
+            _job_cache.pop(job_id, None)
+
+    @classmethod
+    def _scan_job_blobs(cls) -> list:
+        """Raw JSON of every stored job, found by scanning the job keys."""
+        client = cls._get_client()
+        keys = list(client.scan_iter(match="job:*", count=1000))
+        return [data for data in client.mget(keys) if data] if keys else []
+
+    @classmethod
+    def _backfill_indexes(cls):
+        """
+        Index jobs stored before the listing indexes existed.
+
+        Runs once per process; a Redis flag that expires with the last such
+        job keeps other processes from repeating the scan.
+        """
+        global _indexes_backfilled
+        if _indexes_backfilled:
+            return
+        _indexes_backfilled = True
+
+        client = cls._get_client()
+        if not client.set("jobs:backfilled", 1, nx=True, ex=JOB_TTL):
+            return
+        pipe = client.pipeline()
+        for blob in cls._scan_job_blobs():
+            job = json.loads(blob)
+            created = datetime.fromisoformat(job['created_at']).replace(tzinfo=timezone.utc).timestamp()
+            pipe.zadd(cls._index_key(job['type']), {job['id']: created})
+        pipe.execute()
+
     @classmethod
-    def get_all_jobs(cls, job_type: Optional[str] = None) -> list:
-        """Get all jobs, optionally filtered by type."""
+    def _get_job_blobs(cls, job_type: Optional[str], limit: Optional[int]) -> list:
+        """
+        Raw JSON of jobs newest first, optionally filtered by type and capped at limit.
+
+        Typed listings read one page of the type's creation-time index and fetch
+        the jobs with a single MGET instead of scanning every job key.
+        """
+        if job_type is None:
+            blobs = sorted(cls._scan_job_blobs(), key=lambda blob: json.loads(blob)['created_at'], reverse=True)
+            return blobs[:limit] if limit and limit > 0 else blobs
+
+        cls._backfill_indexes()
         client = cls._get_client()
-        keys = client.keys("job:*")
-        jobs = []
-        for key in keys:
-            data = client.get(key)
+        index_key = cls._index_key(job_type)
+        job_ids = client.zrevrange(index_key, 0, limit - 1 if limit and limit > 0 else -1)
+        if not job_ids:
+            return []
+
+        blobs = []
+        expired = []
+        for job_id, data in zip(job_ids, client.mget([f"job:{job_id}" for job_id in job_ids])):
             if data:
-                job = json.loads(data)
-                if job_type is None or job['type'] == job_type:
-                    jobs.append(job)
-        return sorted(jobs, key=lambda x: x['created_at'], reverse=True)
+                blobs.append(data)
+            else:
+                expired.append(job_id)
+
+        # Job keys expire on their own; drop their index entries as they are found
+        if expired:
+            client.zrem(index_key, *expired)
+
+        return blobs
+
+    @classmethod
+    def get_all_jobs(cls, job_type: Optional[str] = None, limit: Optional[int] = None) -> list:
+        """Get jobs newest first, optionally filtered by type and capped at limit."""
+        return [json.loads(blob) for blob in cls._get_job_blobs(job_type, limit)]
+
+    @classmethod
+    def get_all_jobs_json(cls, job_type: Optional[str] = None, limit: Optional[int] = None) -> bytes:
+        """Job listing response body {"jobs": [...]}, spliced from the stored JSON without re-encoding it."""
+        return ('{"jobs":[' + ','.join(cls._get_job_blobs(job_type, limit)) + ']}').encode()
 
     @classmethod
     def is_running(cls, job_id: str) -> bool:
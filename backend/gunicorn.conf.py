@@ -0,0 +1,23 @@
+"""Gunicorn settings for serving the Flask API in the Docker image."""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Threaded workers: explainability/analytics handlers block on model and
+# parquet I/O, so several requests can be in flight per process.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# SHAP and validation endpoints can take a while on large test sets
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+
+# Reload on code changes in the bind-mounted development setup
+reload = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+
+
+def post_worker_init(worker):
+    """Load shap while the worker boots instead of on its first explainability request."""
+    from app.api.routes.explainability import prewarm_shap
+    prewarm_shap()
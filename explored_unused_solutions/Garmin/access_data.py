@@ -2,102 +2,156 @@ import pandas as pd
 from datetime import datetime, timedelta, timezone
 from process_data import GarminDataProcessor
 import os
-import requests
+import asyncio
+import aiohttp
+import orjson
+from urllib.parse import urlencode
+from collections import defaultdict
 
 # Additional API endpoints for injury-relevant data
 ACTIVITIES_URL = "https://apis.garmin.com/wellness-api/rest/activities"
 DAILY_SUMMARIES_URL = "https://apis.garmin.com/wellness-api/rest/dailies"
 SLEEP_URL = "https://apis.garmin.com/wellness-api/rest/sleeps"
 
+# Maximum number of simultaneous connections to the Garmin API
+MAX_CONNECTIONS = 16
+
+# Width of each upload-time window requested from the Garmin API
+FETCH_WINDOW_DAYS = 90
+
 class DataCollector:
-    def __init__(self, oauth, user_id):
+    # Directories already created by this process
+    _created_dirs = set()
+
+    def __init__(self, oauth, user_id, debug=False):
         self.oauth = oauth
         self.user_id = user_id
         self.data_dir = f"user_data/{user_id}"
-        os.makedirs(self.data_dir, exist_ok=True)
+        if self.data_dir not in DataCollector._created_dirs:
+            os.makedirs(self.data_dir, exist_ok=True)
+            DataCollector._created_dirs.add(self.data_dir)
+        self.processor = GarminDataProcessor()
+        self.debug = debug
         
-    def collect_historical_data(self, injury_dates, days_back=8):
-        """Collect historical data for each day of the past year"""
-        all_daily_data = []
+    async def collect_historical_data(self, injury_dates, days_back=8, file_format="csv"):
+        """Collect historical data for each day of the past year.
+
+        file_format: "csv" (default) or "parquet" for the combined output file.
+        """
         # Get the current time in UTC
         end_date = datetime.now(timezone.utc)
         end_date = end_date.replace(hour=0, minute=00, second=00, microsecond=999999)
         
-        # Collect data day-by-day for the past year
-        for i in range(days_back):
-            # Calculate the specific day in the past year
-            start = end_date - timedelta(days=1+i)
-            end = start.replace(hour=23, minute=59, second=59, microsecond=999999)
-            # Convert injury_dates to datetime.date objects
-            injury_dates_as_date = [datetime.strptime(date_str, '%Y-%m-%d').date() for date_str in injury_dates]
-
-            # Check if start.date() matches any injury_date
-            injury = any(start.date() == injury_date for injury_date in injury_dates_as_date)
-            
-            daily_df = self._collect_data(start, end, injury)
-            all_daily_data.append(daily_df)
-        data_processor = GarminDataProcessor()
+        # Convert injury_dates to datetime.date objects
+        injury_dates_as_date = {datetime.strptime(date_str, '%Y-%m-%d').date() for date_str in injury_dates}
+
+        # Fetch the whole range in a few wide upload windows instead of one
+        # request per endpoint per day, then bucket the records by day locally
+        first_day = end_date - timedelta(days=days_back)
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            windows = await asyncio.gather(*(
+                self._fetch_window(
+                    session,
+                    first_day + timedelta(days=offset),
+                    first_day + timedelta(days=min(offset + FETCH_WINDOW_DAYS, days_back))
+                )
+                for offset in range(0, days_back, FETCH_WINDOW_DAYS)
+            ))
+
+        activities_by_day = defaultdict(list)
+        daily_summaries_by_day = defaultdict(list)
+        sleep_by_day = defaultdict(list)
+        for activities, daily_summaries, sleep in windows:
+            for activity in activities:
+                if "startTimeInSeconds" in activity:
+                    # Bucket by the activity's local date, matching the summaries' calendarDate
+                    local_start = activity["startTimeInSeconds"] + (activity.get("startTimeOffsetInSeconds") or 0)
+                    day = datetime.fromtimestamp(local_start, timezone.utc).strftime('%Y-%m-%d')
+                    activities_by_day[day].append(activity)
+            for summary in daily_summaries:
+                daily_summaries_by_day[summary.get("calendarDate")].append(summary)
+            for record in sleep:
+                sleep_by_day[record.get("calendarDate")].append(record)
+
+        # Process each day oldest first, so the combined frame is in date order
+        all_daily_data = []
+        for i in reversed(range(days_back)):
+            day = (end_date - timedelta(days=1+i)).date()
+            day_str = day.strftime('%Y-%m-%d')
+            all_daily_data.append(self._process_day(
+                day_str,
+                activities_by_day[day_str],
+                daily_summaries_by_day[day_str],
+                sleep_by_day[day_str],
+                day in injury_dates_as_date
+            ))
+        data_processor = self.processor
         user_combined_df = data_processor.combine_all_days(all_daily_data)
-        data_processor.save_to_csv(user_combined_df, f"{self.user_id}_all_data.csv")
-
-            
+        if file_format == "parquet":
+            data_processor.save_to_parquet(user_combined_df, f"{self.user_id}_all_data.parquet")
+        else:
+            data_processor.save_to_csv(user_combined_df, f"{self.user_id}_all_data.csv")
 
-
-
-    def _collect_data(self, start_date, end_date, injury):
-        """Core data collection logic"""
+    async def _fetch_window(self, session, start_date, end_date):
+        """Fetch the three endpoints for one upload window in parallel"""
         start_str = int(start_date.timestamp())
         end_str = int(end_date.timestamp())
-        
-        data_points = {
-            "activities": self._get_activities(start_str, end_str),
-            "daily_summaries": self._get_daily_summaries(start_str, end_str),
-            "sleep": self._get_sleep(start_str, end_str)
-        }
-        data_processor = GarminDataProcessor()
+        return await asyncio.gather(
+            self._get_activities(session, start_str, end_str),
+            self._get_daily_summaries(session, start_str, end_str),
+            self._get_sleep(session, start_str, end_str)
+        )
+
+    def _process_day(self, day_str, activities, daily_summaries, sleep, injury):
+        """Build the combined row(s) for one day from its bucketed records"""
+        data_processor = self.processor
 
         # Process and save combined data
-        daily_summary_df = data_processor.process_daily_summaries(data_points["daily_summaries"])
-        sleep_df = data_processor.process_sleep(data_points["sleep"])
-        activities_df = data_processor.process_activities(data_points["activities"])
+        daily_summary_df = data_processor.process_daily_summaries(daily_summaries)
+        sleep_df = data_processor.process_sleep(sleep)
+        activities_df = data_processor.process_activities(activities)
         combined_data = data_processor.combine_daily_data(daily_summary_df, sleep_df, activities_df, injury)
 
-        #data_processor.save_to_csv(combined_data, start_date.strftime('%Y-%m-%d')+ "_data.csv")
-
-        #data_processing_tasks = [
-        #   ("daily_summaries", data_processor.process_daily_summaries, start_date.strftime('%Y-%m-%d') + "_daily_summaries.csv"),
-        #    ("sleep", data_processor.process_sleep, start_date.strftime('%Y-%m-%d') + "_sleep.csv"),
-        #    ("activities", data_processor.process_activities, start_date.strftime('%Y-%m-%d') + "_activities.csv")
-        #]
+        if self.debug:
+            # Dump the already processed frames per category for inspection
+            data_processor.save_to_csv(combined_data, day_str + "_data.csv")
+            for category, processed_data in (
+                ("daily_summaries", daily_summary_df),
+                ("sleep", sleep_df),
+                ("activities", activities_df),
+            ):
+                data_processor.save_to_csv(processed_data, f"{day_str}_{category}.csv")
 
-        # Process and save each data category
-        #for category, process_function, output_filename in data_processing_tasks:
-        #    processed_data = process_function(data_points[category])
-        #    data_processor.save_to_csv(processed_data, output_filename)
-        
         return combined_data
 
 
-    def _make_request(self, url, params):
+    async def _make_request(self, session, url, params):
         """Make authenticated request to Garmin API with error handling"""
         try:
-            response = requests.get(url, auth=self.oauth, params=params)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Error fetching data from {url}: {response.status_code}")
-                print(f"Response: {response.text}")
-                return []
+            # Sign the full URL (query parameters are part of the OAuth1 signature)
+            _, headers, _ = self.oauth.client.sign(f"{url}?{urlencode(params)}", http_method="GET")
+            headers = {k.decode(): v.decode() for k, v in headers.items()}
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 204:
+                    return []
+                if response.status == 200:
+                    body = await response.read()
+                    return orjson.loads(body) if body else []
+                else:
+                    print(f"Error fetching data from {url}: {response.status}")
+                    print(f"Response: {await response.text()}")
+                    return []
         except Exception as e:
             print(f"Exception making request to {url}: {str(e)}")
             return []
 
     # Individual data collection methods
-    def _get_activities(self, start_date, end_date):
-        return self._make_request(ACTIVITIES_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
+    async def _get_activities(self, session, start_date, end_date):
+        return await self._make_request(session, ACTIVITIES_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
 
-    def _get_daily_summaries(self, start_date, end_date):
-        return self._make_request(DAILY_SUMMARIES_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
+    async def _get_daily_summaries(self, session, start_date, end_date):
+        return await self._make_request(session, DAILY_SUMMARIES_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
 
-    def _get_sleep(self, start_date, end_date):
-        return self._make_request(SLEEP_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
\ No newline at end of file
+    async def _get_sleep(self, session, start_date, end_date):
+        return await self._make_request(session, SLEEP_URL, {'uploadStartTimeInSeconds': start_date, 'uploadEndTimeInSeconds': end_date})
\ No newline at end of file
@@ -1,11 +1,13 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1
 from flask import Flask, request, redirect, session, url_for, render_template, jsonify
 import os
+import asyncio
 from dotenv import load_dotenv
 from urllib.parse import parse_qs
 from access_data import DataCollector
-from threading import Thread
+from concurrent.futures import ProcessPoolExecutor
 
 load_dotenv()
 
@@ -20,9 +22,40 @@ AUTHORIZATION_URL = "https://connect.garmin.com/oauthConfirm"
 ACCESS_TOKEN_URL = "https://connectapi.garmin.com/oauth-service/oauth/access_token"
 USER_ID_URL = "https://apis.garmin.com/wellness-api/rest/user/id"
 
+# Shared HTTP session so connections to the Garmin endpoints are kept alive
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Bounded pool for background data collection (one user per worker process)
+COLLECTION_WORKERS = int(os.getenv("GARMIN_COLLECTION_WORKERS", "4"))
+collection_pool = ProcessPoolExecutor(max_workers=COLLECTION_WORKERS)
+
+def _make_oauth(resource_owner_key=None, resource_owner_secret=None, verifier=None, callback_uri=None):
+    """Return an OAuth1 signer for the given token pair.
+
+    Not cached: request tokens and verifiers are single-use, and building the
+    signer is cheap next to the HTTPS round trip it signs.
+    """
+    return OAuth1(
+        CONSUMER_KEY,
+        client_secret=CONSUMER_SECRET,
+        resource_owner_key=resource_owner_key,
+        resource_owner_secret=resource_owner_secret,
+        verifier=verifier,
+        callback_uri=callback_uri
+    )
+
 # Flask app setup
 app = Flask(__name__)
-app.secret_key = os.urandom(24)  
+
+# The session cookie carries the OAuth tokens between requests, which a
+# multi-worker server spreads over processes: every worker must sign it with
+# the same key. Only the development server (below) may make one up; its
+# collection workers re-import this file as __mp_main__ under spawn/forkserver.
+SECRET_KEY = os.getenv("FLASK_SECRET_KEY")
+if not SECRET_KEY and __name__ not in ("__main__", "__mp_main__"):
+    raise RuntimeError("FLASK_SECRET_KEY must be set when serving oauth:app from a WSGI server")
+app.secret_key = SECRET_KEY
 
 
 @app.route("/")
@@ -40,14 +73,10 @@ def start_auth():
     """Step 1: Acquire Unauthorized Request Token and Token Secret"""
     try:
         # Create OAuth1 object for getting request token
-        oauth = OAuth1(
-            CONSUMER_KEY,
-            client_secret=CONSUMER_SECRET,
-            callback_uri=url_for('callback', _external=True)
-        )
+        oauth = _make_oauth(callback_uri=url_for('callback', _external=True))
 
         # Request temporary token
-        response = requests.post(REQUEST_TOKEN_URL, auth=oauth)
+        response = SESSION.post(REQUEST_TOKEN_URL, auth=oauth)
         
         if response.status_code != 200:
             return f"Failed to get request token. Status: {response.status_code}, Response: {response.text}", 500
@@ -82,16 +111,10 @@ def callback():
             return "No request token found in session.", 400
 
         # Create OAuth1 object for getting access token
-        oauth = OAuth1(
-            CONSUMER_KEY,
-            client_secret=CONSUMER_SECRET,
-            resource_owner_key=request_token,
-            resource_owner_secret=request_token_secret,
-            verifier=oauth_verifier
-        )
+        oauth = _make_oauth(request_token, request_token_secret, verifier=oauth_verifier)
 
         # Exchange request token for access token
-        response = requests.post(ACCESS_TOKEN_URL, auth=oauth)
+        response = SESSION.post(ACCESS_TOKEN_URL, auth=oauth)
         
         if response.status_code != 200:
             return f"Failed to get access token. Status: {response.status_code}, Response: {response.text}", 500
@@ -123,14 +146,9 @@ def get_user_id():
             return "No access token found in session.", 400
 
         # Create OAuth1 object for API request
-        oauth = OAuth1(
-            CONSUMER_KEY,
-            client_secret=CONSUMER_SECRET,
-            resource_owner_key=access_token,
-            resource_owner_secret=access_token_secret
-        )
+        oauth = _make_oauth(access_token, access_token_secret)
         # Make request to get user ID
-        response = requests.get(USER_ID_URL, auth=oauth)
+        response = SESSION.get(USER_ID_URL, auth=oauth)
         
         if response.status_code != 200:
             return f"Failed to get user ID. Status: {response.status_code}, Response: {response.text}", 500
@@ -158,23 +176,26 @@ def thank_you():
     user_id = session.get('user_id')
     injuries = session.get('injury_dates', [])
 
-    # Create OAuth object
-    oauth = OAuth1(
-        CONSUMER_KEY,
-        client_secret=CONSUMER_SECRET,
-        resource_owner_key=access_token,
-        resource_owner_secret=access_token_secret
+    # Queue data collection on the bounded worker pool; only plain tokens are
+    # sent to the worker, which rebuilds its own OAuth1 object
+    future = collection_pool.submit(
+        collect_data_async, access_token, access_token_secret, user_id, injuries
     )
-    
-    # Start data collection in background
-    Thread(target=collect_data_async, args=(oauth, user_id, injuries)).start()
+    future.add_done_callback(_report_collection_error)
     
     # Return the page immediately
     return render_template('thank_you.html')
 
-def collect_data_async(oauth, user_id, injuries):
+def collect_data_async(access_token, access_token_secret, user_id, injuries):
+    oauth = _make_oauth(access_token, access_token_secret)
     collector = DataCollector(oauth, user_id)
-    collector.collect_historical_data(injuries)
+    asyncio.run(collector.collect_historical_data(injuries))
+
+def _report_collection_error(future):
+    """Surface exceptions raised inside the worker process."""
+    error = future.exception()
+    if error is not None:
+        print(f"Data collection failed: {error}")
 
 @app.route('/report-injuries', methods=['GET'])
 def show_injury_form():
@@ -197,5 +218,15 @@ def report_injury():
 
 
 
+# Werkzeug development server, for local use only. In production serve the app
+# with a multi-worker WSGI server so concurrent OAuth callbacks are not queued:
+#   FLASK_SECRET_KEY=... gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 oauth:app
+# Each gunicorn worker starts its own collection pool, so up to
+# workers x GARMIN_COLLECTION_WORKERS collections run at once; size the
+# two together (e.g. GARMIN_COLLECTION_WORKERS=1 with -w 4).
 if __name__ == "__main__":
-    app.run(port=5000, debug=True)
\ No newline at end of file
+    if not app.secret_key:
+        # Development key, exported so the collection workers agree with this process
+        app.secret_key = os.environ["FLASK_SECRET_KEY"] = os.urandom(24).hex()
+    debug = os.getenv("FLASK_DEBUG", "").lower() in ("1", "true")
+    app.run(port=5000, debug=debug, threaded=True)
\ No newline at end of file
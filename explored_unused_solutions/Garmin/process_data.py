@@ -1,110 +1,90 @@
+import numpy as np
 import pandas as pd
 import os
 import ast
-from datetime import datetime
+from collections import defaultdict
+
+# Fields to extract from each Garmin API record, with their pandas dtypes.
+# Nullable integer types keep missing values without falling back to float/object.
+DAILY_SUMMARY_DTYPES = {
+    "calendarDate": "object",
+    "startTimeInSeconds": "Int64",
+    "moderateIntensityDurationInSeconds": "Int32",
+    "vigorousIntensityDurationInSeconds": "Int32",
+    "minHeartRateInBeatsPerMinute": "Int16",
+    "maxHeartRateInBeatsPerMinute": "Int16",
+    "averageHeartRateInBeatsPerMinute": "Int16",
+    "restingHeartRateInBeatsPerMinute": "Int16",
+    "averageStressLevel": "Int16",
+    "maxStressLevel": "Int16",
+    "stressDurationInSeconds": "Int32",
+    "restStressDurationInSeconds": "Int32",
+    "activityStressDurationInSeconds": "Int32",
+    "lowStressDurationInSeconds": "Int32",
+    "mediumStressDurationInSeconds": "Int32",
+    "highStressDurationInSeconds": "Int32",
+    "stressQualifier": "object",
+}
+DAILY_SUMMARY_FIELDS = tuple(DAILY_SUMMARY_DTYPES)
+
+SLEEP_DTYPES = {
+    "calendarDate": "object",
+    "durationInSeconds": "Int32",
+    "overallSleepScore": "object",
+    "sleepScores": "object",
+}
+SLEEP_FIELDS = tuple(SLEEP_DTYPES)
+
+ACTIVITY_DTYPES = {
+    "activityType": "object",
+    "durationInSeconds": "Int32",
+    "averageHeartRateInBeatsPerMinute": "Int16",
+    "maxHeartRateInBeatsPerMinute": "Int16",
+    "averageBikeCadenceInRoundsPerMinute": "float32",
+    "averageRunCadenceInStepsPerMinute": "float32",
+    "activeKilocalories": "Int32",
+    "distanceInMeters": "float64",
+}
+ACTIVITY_FIELDS = tuple(ACTIVITY_DTYPES)
 
 class GarminDataProcessor:
     def __init__(self, save_dir="processed_data"):
         self.save_dir = save_dir
-        os.makedirs(self.save_dir, exist_ok=True)
+        if not os.path.isdir(self.save_dir):
+            os.makedirs(self.save_dir, exist_ok=True)
 
 
     def process_daily_summaries(self, daily_summaries):
-
-        # Define the fields to extract
-        selected_fields = [
-            "calendarDate",
-            "startTimeInSeconds",
-            "moderateIntensityDurationInSeconds",
-            "vigorousIntensityDurationInSeconds",
-            "minHeartRateInBeatsPerMinute",
-            "maxHeartRateInBeatsPerMinute",
-            "averageHeartRateInBeatsPerMinute",
-            "restingHeartRateInBeatsPerMinute",
-            "averageStressLevel",
-            "maxStressLevel",
-            "stressDurationInSeconds",
-            "restStressDurationInSeconds",
-            "activityStressDurationInSeconds",
-            "lowStressDurationInSeconds",
-            "mediumStressDurationInSeconds",
-            "highStressDurationInSeconds",
-            "stressQualifier"
-        ]
-
-        # Extract the selected fields from each daily summary
-        processed_data = []
-        for summary in daily_summaries:
-            processed_data.append({field: summary.get(field, None) for field in selected_fields})
-        # Convert the processed data into a pandas DataFrame
-        df = pd.DataFrame(processed_data)
-         # Get the latest (maximum) calendarDate
-        max_date = df['calendarDate'].max()
-
-        # Filter the dataframe to keep only the rows with the maximum calendarDate
-        df_latest = df[df['calendarDate'] == max_date]
-
-        # Sort values by 'startTimeInSeconds'
-        df_latest = df_latest.sort_values(by=['startTimeInSeconds'], ascending=[True])
-
-        # Keep only the last entry of the latest date (in case there are multiple entries for the same date)
-        df_last_entry = df_latest.groupby('calendarDate').last().reset_index()
+        # Build the DataFrame and project onto the selected fields (missing fields become NaN)
+        df = pd.DataFrame(daily_summaries).reindex(columns=DAILY_SUMMARY_FIELDS).astype(DAILY_SUMMARY_DTYPES)
+        # Keep only the latest entry (maximum startTimeInSeconds) of the latest calendarDate,
+        # in case there are multiple entries for the same date
+        df = df[df['calendarDate'] == df['calendarDate'].max()]
+        if not df.empty and df['startTimeInSeconds'].notna().any():
+            df = df.loc[[df['startTimeInSeconds'].idxmax()]]
+        else:
+            df = df.tail(1)
 
         # Drop the 'startTimeInSeconds' column
-        df_last_entry = df_last_entry.drop(columns=['startTimeInSeconds'])
-
-        return df_last_entry
+        return df.drop(columns=['startTimeInSeconds']).reset_index(drop=True)
     
 
     
     def process_sleep(self, sleep_data):
-        # Define the fields to extract
-        selected_fields = [
-            "calendarDate",
-            "durationInSeconds",
-            "overallSleepScore",
-            "sleepScores"
-        ]
-
-        # Extract the selected fields from each sleep record
-        processed_data = []
-        for record in sleep_data:
-            processed_data.append({field: record.get(field, None) for field in selected_fields})
-        # Convert the processed data into a pandas DataFrame
-        df = pd.DataFrame(processed_data)
+        # Build the DataFrame and project onto the selected fields (missing fields become NaN)
+        df = pd.DataFrame(sleep_data).reindex(columns=SLEEP_FIELDS).astype(SLEEP_DTYPES)
 
         return df
     
     def process_activities(self, activities):
-        selected_fields = [
-            "activityType",
-            "durationInSeconds",
-            "averageHeartRateInBeatsPerMinute",
-            "maxHeartRateInBeatsPerMinute",
-            "averageBikeCadenceInRoundsPerMinute",
-            "averageRunCadenceInStepsPerMinute",
-            "activeKilocalories",
-            "distanceInMeters"
-        ]
+        time_fields = ("startTimeInSeconds", "startTimeOffsetInSeconds")
+        df = pd.DataFrame(activities).reindex(columns=time_fields + ACTIVITY_FIELDS)
+        df = df.astype({**dict.fromkeys(time_fields, "Int64"), **ACTIVITY_DTYPES})
 
-        processed_data = []
-        for activity in activities:
-            # Convert start time to a human-readable date format
-            start_time_in_seconds = activity.get("startTimeInSeconds")
-            if start_time_in_seconds:
-                date = datetime.fromtimestamp(start_time_in_seconds).strftime('%Y-%m-%d')  # Date in YYYY-MM-DD format
-            else:
-                date = None  # If there's no start time, set as None
-
-            activity_data = {field: activity.get(field, None) for field in selected_fields}
-            activity_data["calendarDate"] = date  # Add the date to the activity data
-            
-            
-            processed_data.append(activity_data)
-        # Convert the processed data into a pandas DataFrame
-        df = pd.DataFrame(processed_data)
-        columns = ['calendarDate'] + [col for col in df.columns if col != 'calendarDate']
-        df = df[columns]
+        # Convert the local start time (UTC start plus the activity's UTC offset) to a
+        # YYYY-MM-DD date matching the summaries' calendarDate, NaN if missing
+        local_start = df.pop("startTimeInSeconds") + df.pop("startTimeOffsetInSeconds").fillna(0)
+        df.insert(0, "calendarDate", pd.to_datetime(local_start, unit='s').dt.strftime('%Y-%m-%d'))
         return df
     
     def combine_daily_data(self, daily_df, sleep_df, activities_df, injury_occured):
@@ -117,68 +97,54 @@ class GarminDataProcessor:
         if activities_df is None or activities_df.empty:
             activities_df = pd.DataFrame(columns=["calendarDate", "activityType", "durationInSeconds"])
         
-        # Make copies to avoid modifying original dataframes
-        daily = daily_df.copy()
-        sleep = sleep_df.copy()
-        activities = activities_df.copy()
+        # The inputs are not modified below, so they are used without copying
+        daily = daily_df
+        sleep = sleep_df
+        activities = activities_df
 
-        # Group activities by date
-        activities_grouped = activities.groupby('calendarDate').apply(
-            lambda x: x.drop('calendarDate', axis=1).to_dict('records')
-        ).reset_index()
-        activities_grouped.columns = ['calendarDate', 'activities']
+        # Group activities by date in a single pass over the records
+        activities_by_date = defaultdict(list)
+        for record in activities.dropna(subset=['calendarDate']).to_dict('records'):
+            activities_by_date[record.pop('calendarDate')].append(record)
+        activities_grouped = pd.DataFrame({
+            'calendarDate': pd.Series(list(activities_by_date.keys()), dtype='object'),
+            'activities': list(activities_by_date.values())
+        })
         # Prepare sleep data
         # Convert sleep scores from string to dict if they're stored as strings
-        # Using ast.literal_eval for safe evaluation of literal structures
-        if sleep['sleepScores'].dtype == 'object':
-            sleep['sleepScores'] = sleep['sleepScores'].apply(
-                lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-            )
-        if sleep['overallSleepScore'].dtype == 'object':
-            sleep['overallSleepScore'] = sleep['overallSleepScore'].apply(
-                lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-            )
+        # (e.g. re-loaded from CSV). Only string cells are parsed, using
+        # ast.literal_eval for safe evaluation of literal structures
+        for column in ('sleepScores', 'overallSleepScore'):
+            if sleep[column].dtype == 'object':
+                is_str = sleep[column].map(lambda x: isinstance(x, str))
+                if is_str.any():
+                    parsed = sleep[column].mask(is_str, sleep.loc[is_str, column].map(ast.literal_eval))
+                    sleep = sleep.assign(**{column: parsed})
         
         # Create sleep data dictionary
-        sleep['sleep_data'] = sleep.apply(
-            lambda row: {
-                'durationInSeconds': row['durationInSeconds'],
-                'overallSleepScore': row['overallSleepScore'],
-                'sleepScores': row['sleepScores']
-            }, axis=1
-        )
-        sleep_grouped = sleep[['calendarDate', 'sleep_data']]
+        sleep_grouped = pd.DataFrame({
+            'calendarDate': sleep['calendarDate'],
+            'sleep_data': [
+                {'durationInSeconds': duration, 'overallSleepScore': overall, 'sleepScores': scores}
+                for duration, overall, scores in zip(
+                    sleep['durationInSeconds'].tolist(),
+                    sleep['overallSleepScore'].tolist(),
+                    sleep['sleepScores'].tolist()
+                )
+            ]
+        })
         
-        # Merge all dataframes
-        # First merge daily with activities
-        merged_df = pd.merge(
-            daily,
-            activities_grouped,
-            on='calendarDate',
-            how='left'
+        # Left-join activities and sleep onto the daily summary by calendarDate index
+        final_df = (
+            daily.set_index('calendarDate')
+            .join(activities_grouped.set_index('calendarDate'), how='left')
+            .join(sleep_grouped.set_index('calendarDate'), how='left')
+            .reset_index()
         )
         
-        # Then merge with sleep data
-        final_df = pd.merge(
-            merged_df,
-            sleep_grouped,
-            on='calendarDate',
-            how='left'
-        )
-        
-        # Handle NaN values properly
-        def handle_activities(x):
-            if isinstance(x, list):
-                return x
-            return []
-        
-        def handle_sleep(x):
-            if isinstance(x, dict):
-                return x
-            return {}
-        
-        final_df['activities'] = final_df['activities'].apply(handle_activities)
-        final_df['sleep_data'] = final_df['sleep_data'].apply(handle_sleep)
+        # Handle NaN values properly (days without activities or sleep records)
+        final_df['activities'] = [x if isinstance(x, list) else [] for x in final_df['activities']]
+        final_df['sleep_data'] = [x if isinstance(x, dict) else {} for x in final_df['sleep_data']]
         if injury_occured:
             final_df["injuryOccured"] = 1
         else:
@@ -191,18 +157,14 @@ class GarminDataProcessor:
         Combines all daily `final_df` dataframes into a single dataframe.
 
         Parameters:
-            final_dfs (list): A list of daily `final_df` dataframes.
+            final_dfs (list): A list of daily `final_df` dataframes, already in
+                chronological order.
 
         Returns:
             pd.DataFrame: A single dataframe with all days' data combined.
         """
-        # Combine all dataframes using pd.concat
-        combined_df = pd.concat(final_dfs, ignore_index=True)
-        
-        # Optional: Sort by calendarDate to ensure chronological order
-        combined_df = combined_df.sort_values(by='calendarDate').reset_index(drop=True)
-        
-        return combined_df
+        # The caller passes the days oldest-first, so no sort is needed
+        return pd.concat(final_dfs, ignore_index=True)
     
     def save_to_csv(self, df, filename):
         """
@@ -214,62 +176,87 @@ class GarminDataProcessor:
         df.to_csv(filepath, index=False)
         print(f"Processed data saved to {filepath}")
 
-    def calculate_tss(duration_seconds, avg_metric, threshold_metric, activity_type):
+    def save_to_parquet(self, df, filename):
+        """
+        Save the processed DataFrame to a zstd-compressed Parquet file.
+        Nested columns (activities, sleep_data) are stored natively, so they
+        do not need to be re-parsed with ast.literal_eval when read back.
+        :param df: pandas DataFrame to save.
+        :param filename: Name of the Parquet file (without directory path).
+        """
+        filepath = os.path.join(self.save_dir, filename)
+        df.to_parquet(filepath, index=False, engine='pyarrow', compression='zstd')
+        print(f"Processed data saved to {filepath}")
+
+    @staticmethod
+    def _safe_divide(numerator, denominator):
+        """Elementwise division that yields NaN where the denominator is zero."""
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.asarray(denominator, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator != 0, numerator / denominator, np.nan)
+
+    @staticmethod
+    def calculate_tss(duration_seconds, avg_metric, threshold_metric, activity_type=None):
         """
-        Calculate Training Stress Score (TSS).
+        Calculate Training Stress Score (TSS). Accepts scalars or arrays.
         :param duration_seconds: Duration of the activity in seconds.
         :param avg_metric: Average effort metric (heart rate, power, etc.).
         :param threshold_metric: Threshold effort metric (threshold heart rate, FTP, etc.).
         :param activity_type: Type of activity (e.g., 'running', 'cycling', 'swimming').
-        :return: Training Stress Score (TSS).
+        :return: Training Stress Score (TSS), NaN where threshold_metric is 0.
         """
-        if threshold_metric == 0:
-            return None  # Avoid division by zero
-
-        # Determine intensity factor based on activity type
-        intensity_factor = avg_metric / threshold_metric
-
-        # Calculate TSS
-        tss = (duration_seconds * intensity_factor ** 2) / 3600 * 100
-
-        return tss
+        intensity_factor = GarminDataProcessor._safe_divide(avg_metric, threshold_metric)
+        return np.asarray(duration_seconds, dtype=np.float64) * intensity_factor ** 2 / 3600 * 100
 
+    @staticmethod
     def calculate_acwr(acute_load, chronic_load):
         """
-        Calculate Acute-to-Chronic Workload Ratio (ACWR).
+        Calculate Acute-to-Chronic Workload Ratio (ACWR). Accepts scalars or arrays.
         :param acute_load: Total load over the past 7 days.
         :param chronic_load: Average load over the past 28 days.
-        :return: Acute-to-Chronic Workload Ratio (ACWR).
+        :return: Acute-to-Chronic Workload Ratio (ACWR), NaN where chronic_load is 0.
         """
-        if chronic_load == 0:
-            return None  # Avoid division by zero
+        return GarminDataProcessor._safe_divide(acute_load, chronic_load)
 
-        return acute_load / chronic_load
+    @staticmethod
+    def calculate_rolling_acwr(daily_load, acute_days=7, chronic_days=28):
+        """
+        Calculate ACWR for a daily load series using rolling windows.
+        :param daily_load: pandas Series of daily training load in date order.
+        :param acute_days: Window for the acute load sum.
+        :param chronic_days: Window for the chronic load average.
+        :return: pandas Series of ACWR values (NaN until enough history exists).
+        """
+        acute_load = daily_load.rolling(acute_days).sum()
+        chronic_load = daily_load.rolling(chronic_days).mean()
+        return pd.Series(
+            GarminDataProcessor._safe_divide(acute_load, chronic_load),
+            index=daily_load.index
+        )
 
+    @staticmethod
     def calculate_trimp(duration_minutes, avg_hr, hr_rest, hr_max):
         """
-        Calculate Training Impulse (TRIMP) based on heart rate.
+        Calculate Training Impulse (TRIMP) based on heart rate. Accepts scalars or arrays.
         :param duration_minutes: Duration of the activity in minutes.
         :param avg_hr: Average heart rate during the activity.
         :param hr_rest: Resting heart rate.
         :param hr_max: Maximum heart rate.
-        :return: TRIMP score.
+        :return: TRIMP score, NaN where hr_max equals hr_rest.
         """
-        if hr_max == hr_rest:
-            return None  # Avoid division by zero
-
-        hr_reserve = (avg_hr - hr_rest) / (hr_max - hr_rest)
-        trimp = duration_minutes * hr_reserve * 10
-        return trimp
+        hr_reserve = GarminDataProcessor.calculate_hrr(avg_hr, hr_max, hr_rest)
+        return np.asarray(duration_minutes, dtype=np.float64) * hr_reserve * 10
 
+    @staticmethod
     def calculate_hrr(avg_hr, max_hr, rest_hr):
         """
-        Calculate Heart Rate Reserve (HRR).
+        Calculate Heart Rate Reserve (HRR). Accepts scalars or arrays.
         :param avg_hr: Average heart rate.
         :param max_hr: Maximum heart rate.
         :param rest_hr: Resting heart rate.
-        :return: Heart Rate Reserve (HRR).
+        :return: Heart Rate Reserve (HRR), NaN where max_hr equals rest_hr.
         """
-        return (avg_hr - rest_hr) / (max_hr - rest_hr)
-
-    
\ No newline at end of file
+        rest_hr = np.asarray(rest_hr, dtype=np.float64)
+        return GarminDataProcessor._safe_divide(np.asarray(avg_hr, dtype=np.float64) - rest_hr,
+                                                np.asarray(max_hr, dtype=np.float64) - rest_hr)
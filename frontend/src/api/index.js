@@ -21,6 +21,34 @@ api.interceptors.response.use(
   }
 );
 
+// Read a newline-delimited JSON response incrementally, returning all items
+const readNdjson = async (url, onItem) => {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`API Error: ${response.status}`);
+  }
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const items = [];
+  let buffer = '';
+  const emit = (line) => {
+    if (!line.trim()) return;
+    const item = JSON.parse(line);
+    items.push(item);
+    if (onItem) onItem(item);
+  };
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.forEach(emit);
+  }
+  emit(buffer + decoder.decode());
+  return items;
+}
+
 // Data Generation API
 export const dataApi = {
   generate: (config) => api.post('/data/generate', config),
@@ -121,7 +149,11 @@ export const validationApi = {
   // Legacy endpoints (for backward compatibility)
   getSummary: () => api.get('/validation/summary'),
   getDistributions: () => api.get('/validation/distributions'),
-  runSim2Real: () => api.get('/validation/sim2real'),
+  runSim2Real: () => api.post('/validation/sim2real'),
+  getSim2RealJobStatus: (jobId) => api.get(`/validation/sim2real/jobs/${jobId}`),
+  getSim2Real: () => api.get('/validation/sim2real'),
+  runPmdataAnalysis: () => api.post('/validation/pmdata-analysis'),
+  getPmdataAnalysisJobStatus: (jobId) => api.get(`/validation/pmdata-analysis/jobs/${jobId}`),
   getPmdataAnalysis: () => api.get('/validation/pmdata-analysis'),
   getStatus: () => api.get('/validation/status'),
   // Causal Mechanism Analysis (Publication-quality)
@@ -138,7 +170,9 @@ export const validationApi = {
   getScientificJobStatus: (jobId) => api.get(`/validation/scientific/jobs/${jobId}/status`),
   listScientificJobs: () => api.get('/validation/scientific/jobs'),
   getScientificResults: (datasetId) => api.get(`/validation/scientific/results/${datasetId}`),
-  listScientificValidations: () => api.get('/validation/scientific/results'),
+  // Streams NDJSON summaries; onSummary (optional) sees each one as it arrives
+  listScientificValidations: (onSummary) => readNdjson('/api/validation/scientific/results', onSummary)
+    .then(validations => ({ data: { validations } })),
   deleteScientificResults: (datasetId) => api.delete(`/validation/scientific/results/${datasetId}`)
 }
 